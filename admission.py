@@ -0,0 +1,88 @@
+import asyncio
+from typing import Optional
+
+
+class AdmissionController:
+    """Caps the number of concurrent call sessions in one worker.
+
+    Up to ``max_sessions`` sessions run at once. Further offers wait in a short
+    queue (at most ``max_waiting`` of them, for at most ``wait_timeout``
+    seconds) and are refused once the queue is full or the wait times out, so
+    a spike turns some calls away cleanly instead of degrading all of them.
+
+    Attributes:
+        max_sessions: Concurrent session cap; 0 disables admission control.
+        max_waiting: Offers allowed to wait for a free slot.
+        wait_timeout: Seconds an offer may wait before being refused.
+    """
+
+    def __init__(self, max_sessions: int = 0, max_waiting: int = 8, wait_timeout: float = 2.0):
+        self.max_sessions = max_sessions
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def configure(self, max_sessions: int, max_waiting: int, wait_timeout: float):
+        """Set the limits; must be called before the first acquire()."""
+        self.max_sessions = max_sessions
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self._semaphore = None
+
+    @property
+    def accepting(self) -> bool:
+        if not self.max_sessions:
+            return True
+        return self.active < self.max_sessions or self.waiting < self.max_waiting
+
+    async def acquire(self) -> bool:
+        """Reserve a session slot. Returns False if the offer must be refused."""
+        if not self.max_sessions:
+            self.active += 1
+            self.admitted += 1
+            return True
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_sessions)
+
+        if self._semaphore.locked() and self.waiting >= self.max_waiting:
+            self.rejected += 1
+            return False
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.wait_timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            self.rejected += 1
+            return False
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        self.admitted += 1
+        return True
+
+    def release(self):
+        """Free a slot reserved by a successful acquire()."""
+        self.active -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def occupancy(self) -> dict:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_sessions": self.max_sessions,
+            "max_waiting": self.max_waiting,
+            "utilization": round(self.active / self.max_sessions, 3) if self.max_sessions else None,
+            "accepting": self.accepting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
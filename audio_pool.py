@@ -0,0 +1,166 @@
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+from loguru import logger
+from pipecat.audio.filters.base_audio_filter import BaseAudioFilter
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADParams, VADState
+
+from audio_frontend import FastSileroVADAnalyzer, SileroBatcher, make_audio_filter
+
+
+def default_vad_params() -> VADParams:
+    return VADParams(
+        start_secs=0.20,   # react ~100 ms after speech onset
+        confidence=0.5,
+        stop_secs=0.4,
+        min_volume=0.6,
+    )
+
+
+@dataclass
+class AudioLease:
+    """Audio input processors handed to a single call."""
+
+    vad_analyzer: SileroVADAnalyzer
+    audio_in_filter: Optional[BaseAudioFilter]
+    pooled: bool
+
+
+class AudioProcessingPool:
+    """Process-wide pool of warm Silero VAD analyzers and noise-reduce filters.
+
+    Loading the Silero ONNX model is too slow for the connect path, so the
+    worker loads it once (``vad_batcher``) and every analyzer only holds its
+    call's recurrent state on it. The pool builds ``size`` leases at startup
+    and hands them out per call; released analyzers have their state reset
+    and go back to the pool. When the pool is empty a fresh lease is built
+    (a miss, which loads no model) and, on release, kept if the pool has room.
+
+    Analyzers are FastSileroVADAnalyzers. The input filter of each lease is
+    ``audio_filter`` (see ``audio_frontend.AUDIO_FILTERS``).
+
+    Attributes:
+        size: Number of warm analyzers kept ready.
+        audio_filter: Input filter kind of new leases.
+        noise_window_secs: Window of the spectral-gate filter.
+        vad_batcher: The worker's Silero model. Unless configured for
+            batching, it is loaded on first use and runs each chunk alone.
+        hits: Acquisitions served from the pool.
+        misses: Acquisitions that had to build a new analyzer.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        vad_params: Optional[VADParams] = None,
+        audio_filter: str = "noisereduce",
+        noise_window_secs: float = 0.064,
+        vad_batcher: Optional[SileroBatcher] = None,
+    ):
+        self.size = size
+        self.vad_params = vad_params or default_vad_params()
+        self.audio_filter = audio_filter
+        self.noise_window_secs = noise_window_secs
+        self.vad_batcher = vad_batcher
+        self.hits = 0
+        self.misses = 0
+        self._idle: List[AudioLease] = []
+        self._in_use = 0
+        self._lock = threading.Lock()
+
+    def _shared_model(self) -> SileroBatcher:
+        with self._lock:
+            if self.vad_batcher is None:
+                self.vad_batcher = SileroBatcher(max_batch=1, max_wait_secs=0.0)
+            return self.vad_batcher
+
+    def _build(self) -> AudioLease:
+        return AudioLease(
+            vad_analyzer=FastSileroVADAnalyzer(params=self.vad_params, batcher=self._shared_model()),
+            audio_in_filter=make_audio_filter(self.audio_filter, self.noise_window_secs),
+            pooled=True,
+        )
+
+    def warm(self):
+        """Preload analyzers until ``size`` are idle. Call once at startup."""
+        with self._lock:
+            missing = self.size - len(self._idle)
+        built = [self._build() for _ in range(max(missing, 0))]
+        with self._lock:
+            self._idle.extend(built)
+        logger.info(f"Audio pool warmed with {len(built)} VAD analyzers (size={self.size})")
+
+    def acquire(self) -> AudioLease:
+        with self._lock:
+            self._in_use += 1
+            if self._idle:
+                self.hits += 1
+                return self._idle.pop()
+            self.misses += 1
+        return self._build()
+
+    def release(self, lease: AudioLease):
+        _reset_vad(lease.vad_analyzer)
+        with self._lock:
+            self._in_use -= 1
+            if len(self._idle) < self.size:
+                self._idle.append(lease)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else None,
+                "audio_filter": self.audio_filter,
+                "vad_batch": self.vad_batcher.stats() if self.vad_batcher else None,
+            }
+
+
+def _reset_vad(vad: SileroVADAnalyzer):
+    # VADAnalyzer has no public reset, so clear the per-call state by hand
+    # before the analyzer is handed to the next call.
+    model = getattr(vad, "_model", None)
+    if model is not None and hasattr(model, "reset_states"):
+        model.reset_states()
+    if hasattr(vad, "_vad_buffer"):
+        vad._vad_buffer = b""
+    if hasattr(vad, "_vad_state"):
+        vad._vad_state = VADState.QUIET
+    if hasattr(vad, "_vad_starting_count"):
+        vad._vad_starting_count = 0
+    if hasattr(vad, "_vad_stopping_count"):
+        vad._vad_stopping_count = 0
+
+
+audio_pool = AudioProcessingPool()
+
+
+def configure_audio_pool(
+    size: int,
+    audio_filter: str = "noisereduce",
+    noise_window_secs: float = 0.064,
+    vad_batch: int = 0,
+    vad_batch_wait_secs: float = 0.004,
+) -> AudioProcessingPool:
+    """Resize and configure the shared pool; call before ``warm()``.
+
+    Args:
+        size: Warm leases kept ready.
+        audio_filter: Input filter of each call (``audio_frontend.AUDIO_FILTERS``).
+        noise_window_secs: Window of the spectral-gate filter.
+        vad_batch: Most calls classified in one batched VAD inference; 0 runs
+            each call's chunks alone (on the same shared model).
+        vad_batch_wait_secs: Longest a VAD chunk waits for others to batch with.
+    """
+    audio_pool.size = size
+    audio_pool.audio_filter = audio_filter
+    audio_pool.noise_window_secs = noise_window_secs
+    audio_pool.vad_batcher = SileroBatcher(max(vad_batch, 1), vad_batch_wait_secs if vad_batch > 0 else 0.0)
+    return audio_pool
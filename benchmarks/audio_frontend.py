@@ -0,0 +1,165 @@
+"""CPU cost of the caller-audio front end, in microseconds per 20 ms frame.
+
+Every inbound frame goes through the input filter and the VAD analyzer
+before anything else sees it. This profiles each stage on its own, outside
+the pipeline, over the same caller audio (synthetic speech with white
+noise, or ``--pcm``):
+
+- filters: pipecat's NoisereduceFilter (noisereduce on every frame) and the
+  windowed SpectralGateFilter of ``audio_frontend`` at each ``--windows-ms``;
+- VAD: the stock SileroVADAnalyzer and FastSileroVADAnalyzer on their own,
+  then ``--sessions`` concurrent calls fed in real time, each from its own
+  thread (as the transports' executors do): one model per call, and one
+  SileroBatcher shared by all of them, with the mean batch size reached.
+
+CPU is process time (all threads) divided by the frames processed; "% of
+a core" is that per call, relative to the 20 ms a frame lasts. Run from the
+repo root:
+
+    python benchmarks/audio_frontend.py --secs 6 --sessions 1,8,32
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger  # noqa: E402
+from pipecat.audio.filters.noisereduce_filter import NoisereduceFilter  # noqa: E402
+from pipecat.audio.vad.silero import SileroVADAnalyzer  # noqa: E402
+
+from audio_frontend import FastSileroVADAnalyzer, SileroBatcher, SpectralGateFilter  # noqa: E402
+from audio_pool import default_vad_params  # noqa: E402
+from load_test import read_pcm, synthetic_speech  # noqa: E402
+
+FRAME_SECS = 0.02
+
+
+def caller_frames(pcm: bytes, sample_rate: int, secs: float) -> List[bytes]:
+    samples = np.frombuffer(pcm, np.int16)
+    samples = np.resize(samples, int(secs * sample_rate))
+    frame = int(sample_rate * FRAME_SECS)
+    return [samples[i : i + frame].tobytes() for i in range(0, len(samples) - frame + 1, frame)]
+
+
+def cpu_us_per_frame(process: Callable[[bytes], object], frames: List[bytes]) -> float:
+    start = time.process_time()
+    for frame in frames:
+        process(frame)
+    return (time.process_time() - start) / len(frames) * 1e6
+
+
+def profile_filter(audio_filter, frames: List[bytes], sample_rate: int) -> float:
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(audio_filter.start(sample_rate))
+        return cpu_us_per_frame(lambda frame: loop.run_until_complete(audio_filter.filter(frame)), frames)
+    finally:
+        loop.close()
+
+
+def profile_vad(analyzer, frames: List[bytes], sample_rate: int) -> float:
+    analyzer.set_sample_rate(sample_rate)
+    return cpu_us_per_frame(analyzer.analyze_audio, frames)
+
+
+def profile_concurrent_vad(
+    sessions: int, frames: List[bytes], sample_rate: int, batcher: Optional[SileroBatcher] = None
+) -> dict:
+    """``sessions`` analyzers, each fed a frame every 20 ms from its own thread."""
+    before = batcher.stats() if batcher else None
+
+    def feed(analyzer):
+        # Calls connect at random times, so their chunks are not aligned
+        time.sleep(random.random() * FRAME_SECS)
+        due = time.monotonic()
+        for frame in frames:
+            analyzer.analyze_audio(frame)
+            due += FRAME_SECS
+            time.sleep(max(0.0, due - time.monotonic()))
+
+    analyzers = []
+    for _ in range(sessions):
+        analyzer = FastSileroVADAnalyzer(params=default_vad_params(), batcher=batcher)
+        analyzer.set_sample_rate(sample_rate)
+        analyzers.append(analyzer)
+    threads = [threading.Thread(target=feed, args=(analyzer,)) for analyzer in analyzers]
+    start = time.process_time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cpu = time.process_time() - start
+    result = {"us_per_frame": cpu / (sessions * len(frames)) * 1e6}
+    if batcher is not None:
+        after = batcher.stats()
+        batches = after["batches"] - before["batches"]
+        result["mean_batch"] = (after["chunks"] - before["chunks"]) / batches if batches else 0.0
+    return result
+
+
+def print_row(stage: str, us: float, note: str = ""):
+    print(f"{stage:<34}  {us:>10.1f}  {us / (FRAME_SECS * 1e6) * 100:>10.2f}  {note}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU per 20 ms frame of the caller-audio front end")
+    parser.add_argument("--pcm", default=None, help="16-bit mono WAV (8 or 16 kHz) instead of synthetic speech")
+    parser.add_argument("--secs", type=float, default=6.0, help="Seconds of caller audio per measurement")
+    parser.add_argument("--noise", type=float, default=300.0, help="White-noise RMS added to synthetic speech")
+    parser.add_argument("--windows-ms", default="32,64,128", help="SpectralGateFilter windows to profile")
+    parser.add_argument("--sessions", default="1,8,32", help="Concurrent calls, profiled unbatched and batched")
+    parser.add_argument("--batch-wait-ms", type=float, default=4.0, help="SileroBatcher max wait")
+    parser.add_argument(
+        "--noisereduce-secs",
+        type=float,
+        default=2.0,
+        help="Seconds profiled for NoisereduceFilter, which runs slower than real time (default: 2)",
+    )
+    parser.add_argument("--verbose", "-v", action="count", default=0)
+    opts = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if opts.verbose else "WARNING")
+
+    if opts.pcm:
+        pcm, sample_rate = read_pcm(opts.pcm)
+    else:
+        sample_rate = 16000
+        speech = np.frombuffer(synthetic_speech(sample_rate), np.int16).astype(np.float32)
+        noise = np.random.default_rng(0).normal(0, opts.noise, len(speech))
+        pcm = np.clip(speech + noise, -32768, 32767).astype(np.int16).tobytes()
+    frames = caller_frames(pcm, sample_rate, opts.secs)
+
+    print(f"{'stage':<34}  {'us/frame':>10}  {'% of core':>10}")
+    print("-" * 58)
+    print_row(
+        "filter noisereduce",
+        profile_filter(NoisereduceFilter(), frames[: int(opts.noisereduce_secs / FRAME_SECS)], sample_rate),
+    )
+    for window_ms in (float(w) for w in opts.windows_ms.split(",")):
+        audio_filter = SpectralGateFilter(window_secs=window_ms / 1000)
+        us = profile_filter(audio_filter, frames, sample_rate)
+        print_row(f"filter spectral-gate {window_ms:g} ms", us, f"latency {audio_filter.latency_secs * 1000:.0f} ms")
+    print_row("vad silero", profile_vad(SileroVADAnalyzer(params=default_vad_params()), frames, sample_rate))
+    print_row("vad silero fast", profile_vad(FastSileroVADAnalyzer(params=default_vad_params()), frames, sample_rate))
+    for sessions in (int(n) for n in opts.sessions.split(",")):
+        result = profile_concurrent_vad(sessions, frames, sample_rate)
+        print_row(f"vad silero fast x{sessions} (paced)", result["us_per_frame"])
+        batcher = SileroBatcher(max_batch=sessions, max_wait_secs=opts.batch_wait_ms / 1000)
+        result = profile_concurrent_vad(sessions, frames, sample_rate, batcher)
+        print_row(
+            f"vad silero batched x{sessions} (paced)", result["us_per_frame"], f"mean batch {result['mean_batch']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
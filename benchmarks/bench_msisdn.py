@@ -0,0 +1,53 @@
+"""Micro-benchmark for phone-number normalization.
+
+Compares the original character-walking ``normalize_msisdn`` with the
+translation-table fast path, the spoken-number parser and the memoized entry
+point. Run from the repo root:
+
+    python benchmarks/bench_msisdn.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from msisdn import extract_digits, normalize_msisdn  # noqa: E402
+
+INPUTS = {
+    "formatted": "+91 98765-43210",
+    "devanagari": "९८७६५४३२१०",
+    "spoken_hinglish": "nau aath saat chhe paanch chaar teen do ek shunya",
+    "spoken_repeats": "nine nine one one double two double three double four",
+}
+
+
+def legacy_normalize_msisdn(raw: str, default_cc: str = "+91") -> str:
+    digits = "".join(ch for ch in raw if ch.isdigit())
+    if digits.startswith("91") and len(digits) == 12:
+        return f"+{digits}"
+    if len(digits) == 10:
+        return f"{default_cc}{digits}"
+    return f"+{digits}" if not raw.startswith("+") else raw
+
+
+def per_call_us(fn, arg: str, number: int = 100_000) -> float:
+    return min(timeit.repeat(lambda: fn(arg), number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    uncached = normalize_msisdn.__wrapped__
+    print(f"{'input':<18}{'legacy':>10}{'uncached':>10}{'memoized':>10}  result")
+    for name, raw in INPUTS.items():
+        legacy = per_call_us(legacy_normalize_msisdn, raw)
+        fresh = per_call_us(uncached, raw)
+        memo = per_call_us(normalize_msisdn, raw)
+        print(f"{name:<18}{legacy:>9.2f}u{fresh:>9.2f}u{memo:>9.2f}u  {normalize_msisdn(raw)}"
+              f"{'' if legacy_normalize_msisdn(raw) == normalize_msisdn(raw) else '  (legacy: ' + legacy_normalize_msisdn(raw) + ')'}")
+    print(f"\nextract_digits fast path: {per_call_us(extract_digits, INPUTS['formatted']):.2f} us/call")
+    print("(u = microseconds per call, best of 5)")
+
+
+if __name__ == "__main__":
+    main()
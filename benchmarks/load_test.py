@@ -0,0 +1,576 @@
+"""Offline load test for the Ola call pipeline.
+
+Runs N concurrent synthetic callers in one process, the way a run.py worker
+serves them. Every call gets the real pipeline from ``ola_support.run_pipeline``
+(pooled Silero VAD and noise filter, context aggregators, tools, transcripts)
+behind a replay transport, with ``StubRealtimeLLM`` standing in for the OpenAI
+realtime service. Caller audio is a recorded 16-bit mono WAV, or synthetic
+voiced speech when none is given.
+
+For every concurrency level it reports CPU and RSS per call, event-loop lag,
+and output audio delivery: playout-tick jitter and underruns (the emulated
+WebRTC track had to play silence in the middle of a reply). Run from the repo
+root:
+
+    python benchmarks/load_test.py --concurrency 1,5,10,20 --duration 30
+    python benchmarks/load_test.py --pcm caller.wav --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import wave
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Stubs replace every OpenAI service, but the pipeline still reads a key.
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-load-test")
+
+from loguru import logger  # noqa: E402
+from pipecat.frames.frames import (  # noqa: E402
+    EndTaskFrame,
+    FunctionCallFromLLM,
+    InputAudioRawFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    OutputAudioRawFrame,
+    StartFrame,
+    StartInterruptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.processors.aggregators.openai_llm_context import (  # noqa: E402
+    OpenAILLMContext,
+    OpenAILLMContextFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection  # noqa: E402
+from pipecat.services.llm_service import LLMService  # noqa: E402
+from pipecat.services.openai.llm import OpenAILLMService  # noqa: E402
+from pipecat.transports.base_input import BaseInputTransport  # noqa: E402
+from pipecat.transports.base_output import BOT_VAD_STOP_SECS, BaseOutputTransport  # noqa: E402
+from pipecat.transports.base_transport import BaseTransport, TransportParams  # noqa: E402
+
+import metrics  # noqa: E402
+import ola_support  # noqa: E402
+from audio_frontend import AUDIO_FILTERS  # noqa: E402
+from audio_pool import audio_pool  # noqa: E402
+from metrics import Histogram  # noqa: E402
+from prompt_budget import count_tokens  # noqa: E402
+
+FRAME_SECS = 0.02
+REPLY_SAMPLE_RATE = 24000
+
+ToolCall = Tuple[str, Dict[str, Any]]
+# (tool, arguments) run before the reply to each user turn; None just replies.
+# A list of calls is made one model round trip (tool turn) at a time.
+Step = Optional[Union[ToolCall, List[ToolCall]]]
+
+DEFAULT_SCRIPT: Sequence[Step] = (
+    ("verify_driver_number", {"phone_number": "nau aath saat chhe paanch chaar teen do ek shunya"}),
+    ("get_driver_account_health", {}),
+    ("check_app_online_status", {"phone_number": "+919876543210"}),
+    None,
+    ("get_supply_demand_snapshot", {"lat": 12.97, "lon": 77.59}),
+    None,
+)
+
+_VERIFY: ToolCall = ("verify_driver_number", {"phone_number": "nau aath saat chhe paanch chaar teen do ek shunya"})
+
+# The readme's "no rides" dialogue: verify, then health, online status and
+# wallet one tool turn each...
+SEQUENTIAL_SCRIPT: Sequence[Step] = (
+    _VERIFY,
+    [
+        ("get_driver_account_health", {}),
+        ("check_app_online_status", {"phone_number": "+919876543210"}),
+        ("fetch_wallet_and_payouts", {}),
+    ],
+    None,
+)
+# ...or the same facts in a single get_driver_snapshot turn
+BATCHED_SCRIPT: Sequence[Step] = (
+    _VERIFY,
+    ("get_driver_snapshot", {"fields": ["account_health", "online_status", "wallet"]}),
+    None,
+)
+
+SCRIPTS = {"default": DEFAULT_SCRIPT, "sequential": SEQUENTIAL_SCRIPT, "batched": BATCHED_SCRIPT}
+
+
+def synthetic_speech(sample_rate: int, speech_secs: float = 1.5, pause_secs: float = 4.0) -> bytes:
+    """One caller utterance (harmonic "voice" at syllable rate) followed by a pause.
+
+    Silero classifies it as speech, so every utterance ends in a VAD stop.
+    """
+    t = np.arange(int(sample_rate * speech_secs)) / sample_rate
+    pitch = 140 * (1 + 0.1 * np.sin(2 * np.pi * 0.7 * t))
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    voiced *= 0.5 * (1 + np.sin(2 * np.pi * 4 * t)) ** 1.5
+    voiced = voiced / np.abs(voiced).max() * 0.3
+    samples = np.concatenate([voiced, np.zeros(int(sample_rate * pause_secs))])
+    return (samples * 32767).astype(np.int16).tobytes()
+
+
+def read_pcm(path: str) -> Tuple[bytes, int]:
+    with wave.open(path, "rb") as f:
+        if f.getsampwidth() != 2 or f.getnchannels() != 1:
+            raise ValueError(f"{path}: expected 16-bit mono PCM")
+        return f.readframes(f.getnframes()), f.getframerate()
+
+
+class CallStats:
+    """Delivery measurements of one synthetic call."""
+
+    def __init__(self):
+        self.input_lag = Histogram()
+        self.playout_jitter = Histogram()
+        self.underrun_gap = Histogram()
+        self.underruns = 0
+        self.audio_out_secs = 0.0
+        self.connected_at: Optional[float] = None
+        # Client connected -> first reply audio played (the greeting)
+        self.first_audio_ms: Optional[float] = None
+
+
+class ReplayInputTransport(BaseInputTransport):
+    """Feeds the caller PCM into the pipeline in real-time 20 ms frames."""
+
+    def __init__(self, transport: "ReplayTransport", params: TransportParams, **kwargs):
+        super().__init__(params, **kwargs)
+        self._transport = transport
+        self._replay_task: Optional[asyncio.Task] = None
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        await self.set_transport_ready(frame)
+        if self._replay_task is None:
+            self._replay_task = self.create_task(self._replay())
+
+    async def stop(self, frame):
+        await super().stop(frame)
+        await self._stop_replay()
+
+    async def cancel(self, frame):
+        await super().cancel(frame)
+        await self._stop_replay()
+
+    async def _stop_replay(self):
+        if self._replay_task is not None:
+            await self.cancel_task(self._replay_task)
+            self._replay_task = None
+
+    async def _replay(self):
+        transport = self._transport
+        transport.stats.connected_at = time.monotonic()
+        await transport._call_event_handler("on_client_connected", transport)
+        pcm, sample_rate = transport.pcm, transport.pcm_sample_rate
+        frame_bytes = int(sample_rate * FRAME_SECS) * 2
+        frames_in_pcm = max(len(pcm) // frame_bytes, 1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for index in range(int(transport.duration / FRAME_SECS)):
+            due = start + index * FRAME_SECS
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            transport.stats.input_lag.observe((loop.time() - due) * 1000)
+            offset = (index % frames_in_pcm) * frame_bytes
+            await self.push_audio_frame(
+                InputAudioRawFrame(audio=pcm[offset : offset + frame_bytes], sample_rate=sample_rate, num_channels=1)
+            )
+        await transport._call_event_handler("on_client_disconnected", transport)
+        await self.push_frame(EndTaskFrame(), FrameDirection.UPSTREAM)
+
+
+class PacedOutputTransport(BaseOutputTransport):
+    """Emulates the WebRTC audio track: queued audio is played every 20 ms.
+
+    A playout tick that finds the queue empty in the middle of a reply would
+    be heard as a gap; it is counted as an underrun once more audio arrives.
+    """
+
+    def __init__(self, transport: "ReplayTransport", params: TransportParams, **kwargs):
+        super().__init__(params, **kwargs)
+        self._transport = transport
+        self._chunks: Deque[bytes] = deque()
+        self._playout_task: Optional[asyncio.Task] = None
+        self._last_audio_at = 0.0
+        self._starved_at: Optional[float] = None
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        await self.set_transport_ready(frame)
+        if self._playout_task is None:
+            self._playout_task = self.create_task(self._playout())
+
+    async def stop(self, frame):
+        await super().stop(frame)
+        await self._stop_playout()
+
+    async def cancel(self, frame):
+        await super().cancel(frame)
+        await self._stop_playout()
+
+    async def _stop_playout(self):
+        if self._playout_task is not None:
+            await self.cancel_task(self._playout_task)
+            self._playout_task = None
+
+    async def write_audio_frame(self, frame: OutputAudioRawFrame):
+        if not isinstance(frame, TTSAudioRawFrame):
+            return
+        now = time.monotonic()
+        stats = self._transport.stats
+        if self._starved_at is not None and now - self._last_audio_at < BOT_VAD_STOP_SECS:
+            stats.underruns += 1
+            stats.underrun_gap.observe((now - self._starved_at) * 1000)
+        self._starved_at = None
+        chunk_bytes = int(frame.sample_rate * FRAME_SECS) * 2 * frame.num_channels
+        for offset in range(0, len(frame.audio), chunk_bytes):
+            self._chunks.append(frame.audio[offset : offset + chunk_bytes])
+
+    async def _playout(self):
+        stats = self._transport.stats
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tick = 0
+        while True:
+            tick += 1
+            due = start + tick * FRAME_SECS
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            stats.playout_jitter.observe((loop.time() - due) * 1000)
+            if self._chunks:
+                self._chunks.popleft()
+                stats.audio_out_secs += FRAME_SECS
+                self._last_audio_at = time.monotonic()
+                if stats.first_audio_ms is None and stats.connected_at is not None:
+                    stats.first_audio_ms = (self._last_audio_at - stats.connected_at) * 1000
+            elif self._starved_at is None:
+                self._starved_at = time.monotonic()
+
+
+class ReplayTransport(BaseTransport):
+    """In-process stand-in for SmallWebRTCTransport driven by recorded audio."""
+
+    def __init__(self, params: TransportParams, pcm: bytes, pcm_sample_rate: int, duration: float):
+        super().__init__()
+        self.pcm = pcm
+        self.pcm_sample_rate = pcm_sample_rate
+        self.duration = duration
+        self.stats = CallStats()
+        self._input = ReplayInputTransport(self, params)
+        self._output = PacedOutputTransport(self, params)
+        self._register_event_handler("on_client_connected")
+        self._register_event_handler("on_client_disconnected")
+
+    def input(self) -> ReplayInputTransport:
+        return self._input
+
+    def output(self) -> PacedOutputTransport:
+        return self._output
+
+
+class StubRealtimeLLM(OpenAILLMService):
+    """Offline stand-in for OpenAIRealtimeBetaLLMService.
+
+    Consumes the caller's audio and answers the opening context and every
+    user turn (VAD stop) after ``ttfb`` seconds with canned 24 kHz audio,
+    streamed at ``stream_speed`` times real time like the realtime API. A
+    turn's scripted tool calls run first, through the regular function-call
+    path; each result triggers the next call (after another ``ttfb``), and
+    the last one the reply.
+
+    With ``prefill_ms_per_1k`` every response also waits for the model to
+    read its input: ``session_tokens`` (instructions and tools) plus the
+    conversation so far, at that many milliseconds per 1000 tokens.
+    """
+
+    def __init__(
+        self,
+        script: Sequence[Step] = DEFAULT_SCRIPT,
+        ttfb: float = 0.3,
+        reply_secs: float = 2.0,
+        stream_speed: float = 2.0,
+        session_tokens: int = 0,
+        prefill_ms_per_1k: float = 0.0,
+        **kwargs,
+    ):
+        super().__init__(api_key="stub", model="stub", **kwargs)
+        self._script = script
+        self._ttfb = ttfb
+        self._session_tokens = session_tokens
+        self._prefill_ms_per_1k = prefill_ms_per_1k
+        self._stream_speed = stream_speed
+        t = np.arange(int(REPLY_SAMPLE_RATE * reply_secs)) / REPLY_SAMPLE_RATE
+        self._reply_audio = (np.sin(2 * np.pi * 220 * t) * 3000).astype(np.int16).tobytes()
+        self._context: Optional[OpenAILLMContext] = None
+        self._reply_task: Optional[asyncio.Task] = None
+        self._turns = 0
+        self._pending_calls: List[ToolCall] = []
+        self._calls = 0
+
+    async def process_frame(self, frame, direction: FrameDirection):
+        if isinstance(frame, InputAudioRawFrame):
+            return
+        if isinstance(frame, OpenAILLMContextFrame):
+            await LLMService.process_frame(self, frame, direction)
+            self._context = frame.context
+            if self._pending_calls:
+                await self._next_call()
+            else:
+                await self._start_reply()
+            return
+        await super().process_frame(frame, direction)
+        if isinstance(frame, UserStoppedSpeakingFrame):
+            await self._take_turn()
+        elif isinstance(frame, StartInterruptionFrame):
+            self._pending_calls = []
+            await self._cancel_reply()
+
+    async def stop(self, frame):
+        await super().stop(frame)
+        await self._cancel_reply()
+
+    async def cancel(self, frame):
+        await super().cancel(frame)
+        await self._cancel_reply()
+
+    async def _take_turn(self):
+        step = self._script[self._turns % len(self._script)] if self._script else None
+        self._turns += 1
+        if self._context is not None:
+            # The realtime service adds each transcribed user turn to the context
+            self._context.add_message({"role": "user", "content": f"Caller turn {self._turns}."})
+        if step is None or self._context is None:
+            await self._start_reply()
+            return
+        self._pending_calls = list(step) if isinstance(step, list) else [step]
+        await self._next_call()
+
+    async def _next_call(self):
+        name, arguments = self._pending_calls.pop(0)
+        self._calls += 1
+        await asyncio.sleep(self._response_delay())
+        await self.run_function_calls(
+            [FunctionCallFromLLM(name, f"call_{self._calls}", dict(arguments), self._context)]
+        )
+
+    async def _start_reply(self):
+        await self._cancel_reply()
+        self._reply_task = self.create_task(self._reply())
+
+    async def _cancel_reply(self):
+        if self._reply_task is not None:
+            await self.cancel_task(self._reply_task)
+            self._reply_task = None
+
+    def _response_delay(self) -> float:
+        if not self._prefill_ms_per_1k or self._context is None:
+            return self._ttfb
+        tokens = self._session_tokens + count_tokens(json.dumps(self._context.messages, default=str))
+        return self._ttfb + tokens / 1000 * self._prefill_ms_per_1k / 1000
+
+    async def _reply(self):
+        await asyncio.sleep(self._response_delay())
+        await self.push_frame(LLMFullResponseStartFrame())
+        await self.push_frame(TTSStartedFrame())
+        chunk_bytes = int(REPLY_SAMPLE_RATE * 0.1) * 2
+        for offset in range(0, len(self._reply_audio), chunk_bytes):
+            await self.push_frame(
+                TTSAudioRawFrame(self._reply_audio[offset : offset + chunk_bytes], REPLY_SAMPLE_RATE, 1)
+            )
+            await asyncio.sleep(0.1 / self._stream_speed)
+        text = f"Canned reply {self._turns}."
+        await self.push_frame(LLMTextFrame(text))
+        await self.push_frame(TTSTextFrame(text))
+        await self.push_frame(TTSStoppedFrame())
+        await self.push_frame(LLMFullResponseEndFrame())
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak RSS (KiB on Linux) where /proc is unavailable
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def monitor_loop(lag: Histogram, rss_peak: List[int], interval: float = 0.05):
+    """Sample event-loop lag (sleep overshoot) and peak RSS until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        due = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag.observe((loop.time() - due) * 1000)
+        rss_peak[0] = max(rss_peak[0], rss_bytes())
+
+
+async def run_call(index: int, opts: argparse.Namespace, pcm: bytes, sample_rate: int) -> CallStats:
+    lease = audio_pool.acquire()
+    try:
+        transport = ReplayTransport(
+            TransportParams(
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+                audio_in_filter=lease.audio_in_filter if opts.noise_filter else None,
+                vad_analyzer=lease.vad_analyzer,
+            ),
+            pcm,
+            sample_rate,
+            opts.duration,
+        )
+        llm = StubRealtimeLLM(
+            script=SCRIPTS[opts.script],
+            ttfb=opts.ttfb, 
+            reply_secs=opts.reply_secs,
+            stream_speed=opts.stream_speed,
+        )
+        await ola_support.run_pipeline(transport, f"loadtest-{index}", opts, llm=llm)
+        return transport.stats
+    finally:
+        audio_pool.release(lease)
+
+
+async def run_level(calls: int, opts: argparse.Namespace, pcm: bytes, sample_rate: int) -> dict:
+    lag = Histogram()
+    rss_before = rss_bytes()
+    rss_peak = [rss_before]
+    counts_before = metrics.counters("turn.")
+    tool_turn = metrics.histogram("turn.tool_turn")
+    tool_turn_before = (tool_turn.count, tool_turn.total)
+    monitor = asyncio.create_task(monitor_loop(lag, rss_peak))
+    cpu_before, wall_before = cpu_seconds(), time.perf_counter()
+    try:
+        results = await asyncio.gather(*(run_call(i, opts, pcm, sample_rate) for i in range(calls)))
+    finally:
+        monitor.cancel()
+    wall = time.perf_counter() - wall_before
+    cpu = cpu_seconds() - cpu_before
+
+    jitter, input_lag, gaps = Histogram(), Histogram(), Histogram()
+    for stats in results:
+        for merged, part in ((jitter, stats.playout_jitter), (input_lag, stats.input_lag), (gaps, stats.underrun_gap)):
+            for i, n in enumerate(part.counts):
+                merged.counts[i] += n
+            merged.count += part.count
+            merged.total += part.total
+            merged.max = max(merged.max, part.max)
+    audio_out_mins = sum(s.audio_out_secs for s in results) / 60
+    counts = metrics.counters("turn.")
+    tool_turns = tool_turn.count - tool_turn_before[0]
+    return {
+        "calls": calls,
+        "cpu_pct_per_call": cpu / wall / calls * 100,
+        "rss_mb_per_call": (rss_peak[0] - rss_before) / calls / 1e6,
+        "loop_lag": lag.snapshot(),
+        "input_lag": input_lag.snapshot(),
+        "playout_jitter": jitter.snapshot(),
+        "underruns": sum(s.underruns for s in results),
+        "underruns_per_audio_min": sum(s.underruns for s in results) / audio_out_mins if audio_out_mins else 0.0,
+        "turns_per_call": (counts.get("turn.turns", 0) - counts_before.get("turn.turns", 0)) / calls,
+        "tool_turns_per_call": (counts.get("turn.tool_turns", 0) - counts_before.get("turn.tool_turns", 0)) / calls,
+        "tool_turn_mean_ms": (tool_turn.total - tool_turn_before[1]) / tool_turns if tool_turns else 0.0,
+    }
+
+
+def print_report(rows: List[dict]):
+    header = (
+        f"{'calls':>5}  {'cpu%/call':>9}  {'MB/call':>7}  {'loop lag p50/p99/max ms':>24}  "
+        f"{'jitter p99/max ms':>18}  {'input lag p99':>13}  {'underruns':>9}  {'per audio-min':>13}  {'turns/call':>10}  "
+        f"{'tool turns/call':>15}  {'tool turn ms':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        lag, jitter = row["loop_lag"], row["playout_jitter"]
+        print(
+            f"{row['calls']:>5}  {row['cpu_pct_per_call']:>9.1f}  {row['rss_mb_per_call']:>7.1f}  "
+            f"{lag['p50_ms']:>8g}/{lag['p99_ms']:g}/{lag['max_ms']:<8g}  "
+            f"{jitter['p99_ms']:>9g}/{jitter['max_ms']:<8g}  {row['input_lag']['p99_ms']:>13g}  "
+            f"{row['underruns']:>9}  {row['underruns_per_audio_min']:>13.2f}  {row['turns_per_call']:>10.1f}  "
+            f"{row['tool_turns_per_call']:>15.1f}  {row['tool_turn_mean_ms']:>12.0f}"
+        )
+
+
+async def main_async(opts: argparse.Namespace):
+    if opts.pcm:
+        pcm, sample_rate = read_pcm(opts.pcm)
+    else:
+        sample_rate = 16000
+        pcm = synthetic_speech(sample_rate)
+
+    levels = [int(n) for n in opts.concurrency.split(",")]
+    opts.audio_pool_size = max(levels)
+    ola_support.warmup(opts)
+
+    rows = []
+    for calls in levels:
+        logger.warning(f"Running {calls} concurrent calls for {opts.duration:g}s")
+        rows.append(await run_level(calls, opts, pcm, sample_rate))
+    print_report(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline multi-call load test for ola_support")
+    parser.add_argument("--concurrency", default="1,5,10,20", help="Comma-separated concurrent call counts")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of caller audio per call")
+    parser.add_argument("--pcm", default=None, help="16-bit mono WAV replayed by every caller (looped)")
+    parser.add_argument("--ttfb", type=float, default=0.3, help="Stub LLM time to first byte, seconds")
+    parser.add_argument("--reply-secs", type=float, default=2.0, help="Length of each canned reply")
+    parser.add_argument(
+        "--script",
+        choices=sorted(SCRIPTS),
+        default="default",
+        help="Stub LLM tool calls per user turn; 'sequential' vs 'batched' compares get_driver_snapshot",
+    )
+    parser.add_argument("--stream-speed", type=float, default=2.0, help="Reply streaming speed vs real time")
+    parser.add_argument(
+        "--noise-filter",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Run the pooled noise filter on caller audio, as in production (default: on)",
+    )
+    parser.add_argument("--audio-filter", choices=AUDIO_FILTERS, default="noisereduce", help="Pooled noise filter")
+    parser.add_argument("--vad-batch", type=int, default=0, help="Calls per batched VAD inference, 0 for none")
+    parser.add_argument("--driver-db", default=None, help="SQLite driver snapshot for the tools")
+    parser.add_argument("--demand-snapshot", default=None, help="Demand snapshot for get_supply_demand_snapshot")
+    parser.add_argument("--tool-cache", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--transcript-format", choices=("text", "jsonl"), default="jsonl")
+    parser.add_argument("--verbose", "-v", action="count", default=0)
+    opts = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if opts.verbose else "WARNING")
+
+    opts.call_timeout = opts.duration + 60
+    opts.transcript_dir = tempfile.mkdtemp(prefix="ola-load-test-")
+    try:
+        asyncio.run(main_async(opts))
+    finally:
+        shutil.rmtree(opts.transcript_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
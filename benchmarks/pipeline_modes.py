@@ -0,0 +1,343 @@
+"""Compare time to first audio of the realtime and cascaded pipeline modes.
+
+Each mode runs a few concurrent calls through the real pipeline of
+``ola_support.run_pipeline``, as in ``load_test.py``, with local stand-ins
+for the OpenAI services:
+
+- realtime: ``StubRealtimeLLM`` (speech in, speech out);
+- cascaded: ``StubSTT`` -> ``StubTextLLM`` -> ``StubTTS``, TTS starting on
+  the first complete sentence of the streamed reply;
+- cascaded-reply: the same, but TTS waits for the whole reply (what the
+  cascaded mode would cost without sentence streaming).
+
+Every stand-in charges the latencies given on the command line (STT time per
+segment, LLM time to first token and token rate, TTS time to first audio),
+and both LLMs charge the same prefill per 1000 input tokens. These are
+models of the services, not measurements of them: set them from observed
+TTFBs. What the benchmark measures is how they combine in the pipeline into:
+
+- first audio: client connected -> first greeting audio played out;
+- turn audio: caller VAD stop -> bot audio starts (``vad_to_audio``).
+
+Run from the repo root:
+
+    python benchmarks/pipeline_modes.py --calls 4 --duration 30
+    python benchmarks/pipeline_modes.py --stt-secs 0.6 --llm-ttfb 0.5 --tts-ttfb 0.3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from load_test import (  # noqa: E402
+    DEFAULT_SCRIPT,
+    REPLY_SAMPLE_RATE,
+    ReplayTransport,
+    StubRealtimeLLM,
+    read_pcm,
+    synthetic_speech,
+)
+from loguru import logger  # noqa: E402
+from pipecat.frames.frames import (  # noqa: E402
+    Frame,
+    FunctionCallFromLLM,
+    LLMTextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext  # noqa: E402
+from pipecat.services.openai.llm import OpenAILLMService  # noqa: E402
+from pipecat.services.stt_service import SegmentedSTTService  # noqa: E402
+from pipecat.services.tts_service import TTSService  # noqa: E402
+from pipecat.transports.base_transport import TransportParams  # noqa: E402
+from pipecat.utils.text.simple_text_aggregator import SimpleTextAggregator  # noqa: E402
+from pipecat.utils.time import time_now_iso8601  # noqa: E402
+
+import metrics  # noqa: E402
+import ola_support  # noqa: E402
+from audio_pool import audio_pool  # noqa: E402
+from prompt_budget import analyze, count_tokens  # noqa: E402
+from session_config import get_session_configs  # noqa: E402
+
+MODES = ("realtime", "cascaded", "cascaded-reply")
+
+# Canned reply of the text LLM: three sentences, like a typical support answer
+REPLY_TEXT = (
+    "Namaste, main aapki madad ke liye yahan hoon. "
+    "Maine aapka account check kiya hai aur sab kuch theek lag raha hai. "
+    "Kya aap mujhe bata sakte hain ki aapko kis cheez mein pareshani aa rahi hai?"
+)
+
+
+class StubSTT(SegmentedSTTService):
+    """Offline stand-in for OpenAISTTService: one transcript per VAD segment after ``latency`` seconds."""
+
+    def __init__(self, latency: float = 0.4, **kwargs):
+        super().__init__(**kwargs)
+        self._latency = latency
+        self._segments = 0
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        self._segments += 1
+        await asyncio.sleep(self._latency)
+        yield TranscriptionFrame(f"Caller turn {self._segments}.", "caller", time_now_iso8601())
+
+
+class StubTextLLM(OpenAILLMService):
+    """Offline stand-in for the cascaded mode's OpenAILLMService.
+
+    Answers every context after ``ttfb`` seconds plus the prefill charge,
+    streaming ``reply`` word by word at ``tokens_per_sec``. A user turn's
+    scripted tool call (see ``load_test.DEFAULT_SCRIPT``) runs first, through
+    the regular function-call path, and its result triggers the reply.
+    """
+
+    def __init__(
+        self,
+        script: Sequence[Optional[Tuple[str, Dict[str, Any]]]] = DEFAULT_SCRIPT,
+        reply: str = REPLY_TEXT,
+        ttfb: float = 0.35,
+        tokens_per_sec: float = 60.0,
+        session_tokens: int = 0,
+        prefill_ms_per_1k: float = 0.0,
+        **kwargs,
+    ):
+        super().__init__(api_key="stub", model="stub", **kwargs)
+        self._script = script
+        self._words = reply.split(" ")
+        self._ttfb = ttfb
+        self._token_secs = 1 / tokens_per_sec
+        self._session_tokens = session_tokens
+        self._prefill_ms_per_1k = prefill_ms_per_1k
+        self._turns = 0
+
+    def _response_delay(self, context: OpenAILLMContext) -> float:
+        tokens = self._session_tokens + count_tokens(json.dumps(context.messages, default=str))
+        return self._ttfb + tokens / 1000 * self._prefill_ms_per_1k / 1000
+
+    async def _process_context(self, context: OpenAILLMContext):
+        await asyncio.sleep(self._response_delay(context))
+        if context.messages and context.messages[-1].get("role") == "user":
+            step = self._script[self._turns % len(self._script)] if self._script else None
+            self._turns += 1
+            if step is not None:
+                name, arguments = step
+                await self.run_function_calls(
+                    [FunctionCallFromLLM(name, f"call_{self._turns}", dict(arguments), context)]
+                )
+                return
+        for index, word in enumerate(self._words):
+            await self.push_frame(LLMTextFrame(word if index == 0 else f" {word}"))
+            await asyncio.sleep(self._token_secs)
+
+
+class ReplyTextAggregator(SimpleTextAggregator):
+    """Never splits: the TTS service gets the whole reply at the end of the response."""
+
+    async def aggregate(self, text: str) -> Optional[str]:
+        self._text += text
+        return None
+
+
+class StubTTS(TTSService):
+    """Offline stand-in for OpenAITTSService.
+
+    Each text starts playing ``ttfb`` seconds after it is sent, as speech of
+    ``secs_per_char`` per character streamed at ``stream_speed`` times real time.
+    """
+
+    def __init__(self, ttfb: float = 0.25, secs_per_char: float = 0.06, stream_speed: float = 2.0, **kwargs):
+        super().__init__(sample_rate=REPLY_SAMPLE_RATE, **kwargs)
+        self._ttfb = ttfb
+        self._secs_per_char = secs_per_char
+        self._stream_speed = stream_speed
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        yield TTSStartedFrame()
+        await asyncio.sleep(self._ttfb)
+        t = np.arange(int(REPLY_SAMPLE_RATE * len(text) * self._secs_per_char)) / REPLY_SAMPLE_RATE
+        audio = (np.sin(2 * np.pi * 220 * t) * 3000).astype(np.int16).tobytes()
+        chunk_bytes = int(REPLY_SAMPLE_RATE * 0.1) * 2
+        for offset in range(0, len(audio), chunk_bytes):
+            yield TTSAudioRawFrame(audio[offset : offset + chunk_bytes], REPLY_SAMPLE_RATE, 1)
+            await asyncio.sleep(0.1 / self._stream_speed)
+        yield TTSStoppedFrame()
+
+
+async def run_call(
+    mode: str, pc_id: str, opts: argparse.Namespace, pcm: bytes, sample_rate: int
+) -> Dict[str, List[float]]:
+    config = get_session_configs().current()
+    budget = analyze(config)
+    lease = audio_pool.acquire()
+    # Created before the pipeline so the turn observer records into it
+    session = metrics.session_metrics(pc_id)
+    call_args = argparse.Namespace(**vars(opts))
+    call_args.pipeline_mode = "realtime" if mode == "realtime" else "cascaded"
+    stt = tts = None
+    try:
+        transport = ReplayTransport(
+            TransportParams(
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+                audio_in_filter=lease.audio_in_filter if opts.noise_filter else None,
+                vad_analyzer=lease.vad_analyzer,
+            ),
+            pcm,
+            sample_rate,
+            opts.duration,
+        )
+        if mode == "realtime":
+            llm = StubRealtimeLLM(
+                ttfb=opts.realtime_ttfb,
+                reply_secs=len(REPLY_TEXT) * opts.secs_per_char,
+                stream_speed=opts.stream_speed,
+                # The first-turn message travels in the context, which the stub counts itself
+                session_tokens=budget.total - budget.first_turn,
+                prefill_ms_per_1k=opts.prefill_ms_per_1k,
+            )
+        else:
+            stt = StubSTT(latency=opts.stt_secs)
+            # Instructions travel in the context here; only the tool schemas are extra
+            llm = StubTextLLM(
+                ttfb=opts.llm_ttfb,
+                tokens_per_sec=opts.tokens_per_sec,
+                session_tokens=budget.tools_total,
+                prefill_ms_per_1k=opts.prefill_ms_per_1k,
+            )
+            tts = StubTTS(
+                ttfb=opts.tts_ttfb,
+                secs_per_char=opts.secs_per_char,
+                stream_speed=opts.stream_speed,
+                text_aggregator=ReplyTextAggregator() if mode == "cascaded-reply" else None,
+            )
+        await ola_support.run_pipeline(transport, pc_id, call_args, llm=llm, stt=stt, tts=tts)
+    finally:
+        audio_pool.release(lease)
+    turn = session.histograms.get("vad_to_audio")
+    return {
+        "first_audio": [transport.stats.first_audio_ms] if transport.stats.first_audio_ms is not None else [],
+        "turn_audio_mean": [turn.total / turn.count] if turn and turn.count else [],
+    }
+
+
+async def run_mode(mode: str, opts: argparse.Namespace, pcm: bytes, sample_rate: int) -> dict:
+    results = await asyncio.gather(
+        *(run_call(mode, f"mode-{mode}-{i}", opts, pcm, sample_rate) for i in range(opts.calls))
+    )
+    first_audio = np.array([v for r in results for v in r["first_audio"]])
+    turn_audio = np.array([v for r in results for v in r["turn_audio_mean"]])
+    return {
+        "mode": mode,
+        "first_audio_p50_ms": float(np.percentile(first_audio, 50)) if first_audio.size else None,
+        "first_audio_max_ms": float(first_audio.max()) if first_audio.size else None,
+        "turn_audio_mean_ms": float(turn_audio.mean()) if turn_audio.size else None,
+    }
+
+
+def print_report(rows: List[dict]):
+    header = f"{'mode':<16} {'first audio p50/max ms':>22}  {'turn audio mean ms':>18}  {'vs realtime':>11}"
+    print(header)
+    print("-" * len(header))
+    baseline = next((row["turn_audio_mean_ms"] for row in rows if row["mode"] == "realtime"), None)
+
+    def fmt(value):
+        return f"{value:.0f}" if value is not None else "-"
+
+    for row in rows:
+        delta = "-"
+        if baseline and row["turn_audio_mean_ms"] is not None:
+            delta = f"{row['turn_audio_mean_ms'] - baseline:+.0f} ms"
+        print(
+            f"{row['mode']:<16} {fmt(row['first_audio_p50_ms']):>11}/{fmt(row['first_audio_max_ms']):<10}  "
+            f"{fmt(row['turn_audio_mean_ms']):>18}  {delta:>11}"
+        )
+
+
+async def main_async(opts: argparse.Namespace):
+    if opts.pcm:
+        pcm, sample_rate = read_pcm(opts.pcm)
+    else:
+        sample_rate = 16000
+        # Long enough pauses for a whole cascaded reply, so turns are not interrupted
+        pcm = synthetic_speech(sample_rate, pause_secs=opts.pause_secs)
+    # The caller listens to the greeting before speaking, so it is never interrupted
+    pcm = bytes(int(sample_rate * opts.lead_secs) * 2) + pcm
+
+    opts.audio_pool_size = opts.calls
+    ola_support.warmup(opts)
+
+    modes = opts.modes.split(",")
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        raise SystemExit(f"Unknown modes {unknown}; choose from {list(MODES)}")
+
+    rows = []
+    for mode in modes:
+        logger.warning(f"Running {mode}: {opts.calls} calls for {opts.duration:g}s")
+        rows.append(await run_mode(mode, opts, pcm, sample_rate))
+    if opts.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_report(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to first audio of the realtime and cascaded pipelines")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"Comma-separated subset of {','.join(MODES)}")
+    parser.add_argument("--calls", type=int, default=4, help="Concurrent calls per mode")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of caller audio per call")
+    parser.add_argument("--pcm", default=None, help="16-bit mono WAV replayed by every caller (looped)")
+    parser.add_argument("--lead-secs", type=float, default=8.0, help="Caller silence before first speaking")
+    parser.add_argument("--pause-secs", type=float, default=8.0, help="Silence after each synthetic utterance")
+    parser.add_argument("--realtime-ttfb", type=float, default=0.5, help="Realtime stand-in: seconds to first audio")
+    parser.add_argument("--stt-secs", type=float, default=0.4, help="STT stand-in: seconds per transcribed segment")
+    parser.add_argument("--llm-ttfb", type=float, default=0.35, help="Text LLM stand-in: seconds to first token")
+    parser.add_argument("--tokens-per-sec", type=float, default=60.0, help="Text LLM stand-in: streaming rate")
+    parser.add_argument("--tts-ttfb", type=float, default=0.25, help="TTS stand-in: seconds to first audio per text")
+    parser.add_argument(
+        "--prefill-ms-per-1k",
+        type=float,
+        default=50.0,
+        help="Modeled prefill cost of both LLM stand-ins per 1000 input tokens (default: 50)",
+    )
+    parser.add_argument("--secs-per-char", type=float, default=0.06, help="Length of synthesized speech per character")
+    parser.add_argument("--stream-speed", type=float, default=2.0, help="Reply audio streaming speed vs real time")
+    parser.add_argument(
+        "--noise-filter",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Run the pooled noise filter on caller audio (default: off, it only adds CPU here)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--verbose", "-v", action="count", default=0)
+    opts = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if opts.verbose else "WARNING")
+
+    opts.call_timeout = opts.duration + 60
+    opts.transcript_format = "jsonl"
+    opts.transcript_dir = tempfile.mkdtemp(prefix="ola-pipeline-modes-")
+    try:
+        asyncio.run(main_async(opts))
+    finally:
+        shutil.rmtree(opts.transcript_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
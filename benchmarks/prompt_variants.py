@@ -0,0 +1,197 @@
+"""Compare time to first audio across prompt/tool variants of the realtime session.
+
+Every variant from ``prompt_budget.build_variants`` (full or compacted
+prompt, all tools or one intent's subset) is run as a few concurrent calls
+through the real pipeline, as in ``load_test.py``, with ``StubRealtimeLLM``
+standing in for the realtime model. The stand-in charges each response a
+prefill delay proportional to its input: the variant's instructions and tool
+schemas plus the conversation so far. The per-token rate is a model of the
+realtime service, not a measurement of it; set ``--prefill-ms-per-1k`` from
+observed TTFB against token counts. What the benchmark measures is how a
+variant's size carries through the pipeline into:
+
+- first audio: client connected -> first greeting audio played out;
+- turn audio: caller VAD stop -> bot audio starts (``vad_to_audio``).
+
+Run from the repo root:
+
+    python benchmarks/prompt_variants.py --calls 4 --duration 20
+    python benchmarks/prompt_variants.py --variants full,compact,compact+payout --prefill-ms-per-1k 60
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from load_test import ReplayTransport, StubRealtimeLLM, read_pcm, synthetic_speech  # noqa: E402
+from loguru import logger  # noqa: E402
+from pipecat.transports.base_transport import TransportParams  # noqa: E402
+
+import metrics  # noqa: E402
+import ola_support  # noqa: E402
+from audio_pool import audio_pool  # noqa: E402
+from prompt_budget import analyze, build_variants  # noqa: E402
+from session_config import FIRST_TURN_PATH, PROMPT_PATH, SessionConfig  # noqa: E402
+
+DEFAULT_VARIANTS = "full,compact,full+payout,compact+payout,compact+no_rides"
+
+
+async def run_call(
+    pc_id: str, config: SessionConfig, opts: argparse.Namespace, pcm: bytes, sample_rate: int
+) -> Dict[str, List[float]]:
+    budget = analyze(config)
+    lease = audio_pool.acquire()
+    # Created before the pipeline so the turn observer records into it
+    session = metrics.session_metrics(pc_id)
+    try:
+        transport = ReplayTransport(
+            TransportParams(
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+                audio_in_filter=lease.audio_in_filter if opts.noise_filter else None,
+                vad_analyzer=lease.vad_analyzer,
+            ),
+            pcm,
+            sample_rate,
+            opts.duration,
+        )
+        llm = StubRealtimeLLM(
+            ttfb=opts.ttfb,
+            reply_secs=opts.reply_secs,
+            stream_speed=opts.stream_speed,
+            # The first-turn message travels in the context, which the stub counts itself
+            session_tokens=budget.total - budget.first_turn,
+            prefill_ms_per_1k=opts.prefill_ms_per_1k,
+        )
+        await ola_support.run_pipeline(transport, pc_id, opts, llm=llm, session_config=config)
+    finally:
+        audio_pool.release(lease)
+    turn = session.histograms.get("vad_to_audio")
+    return {
+        "first_audio": [transport.stats.first_audio_ms] if transport.stats.first_audio_ms is not None else [],
+        "turn_audio_mean": [turn.total / turn.count] if turn and turn.count else [],
+    }
+
+
+async def run_variant(
+    label: str, config: SessionConfig, opts: argparse.Namespace, pcm: bytes, sample_rate: int
+) -> dict:
+    budget = analyze(config)
+    results = await asyncio.gather(
+        *(run_call(f"variant-{label}-{i}", config, opts, pcm, sample_rate) for i in range(opts.calls))
+    )
+    first_audio = np.array([v for r in results for v in r["first_audio"]])
+    turn_audio = np.array([v for r in results for v in r["turn_audio_mean"]])
+    return {
+        "variant": label,
+        "tokens": budget.total,
+        "session_bytes": budget.session_bytes,
+        "tools": len(budget.tools),
+        "first_audio_p50_ms": float(np.percentile(first_audio, 50)) if first_audio.size else None,
+        "first_audio_max_ms": float(first_audio.max()) if first_audio.size else None,
+        "turn_audio_mean_ms": float(turn_audio.mean()) if turn_audio.size else None,
+    }
+
+
+def print_report(rows: List[dict]):
+    header = (
+        f"{'variant':<28} {'tokens':>6}  {'bytes':>6}  {'tools':>5}  "
+        f"{'first audio p50/max ms':>22}  {'turn audio mean ms':>18}  {'vs full':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    baseline = next((row["first_audio_p50_ms"] for row in rows if row["variant"] == "full"), None)
+
+    def fmt(value):
+        return f"{value:.0f}" if value is not None else "-"
+
+    for row in rows:
+        delta = "-"
+        if baseline and row["first_audio_p50_ms"] is not None:
+            delta = f"{row['first_audio_p50_ms'] - baseline:+.0f} ms"
+        print(
+            f"{row['variant']:<28} {row['tokens']:>6}  {row['session_bytes']:>6}  {row['tools']:>5}  "
+            f"{fmt(row['first_audio_p50_ms']):>11}/{fmt(row['first_audio_max_ms']):<10}  "
+            f"{fmt(row['turn_audio_mean_ms']):>18}  {delta:>8}"
+        )
+
+
+async def main_async(opts: argparse.Namespace):
+    if opts.pcm:
+        pcm, sample_rate = read_pcm(opts.pcm)
+    else:
+        sample_rate = 16000
+        pcm = synthetic_speech(sample_rate)
+    # The caller listens to the greeting before speaking, so it is never interrupted
+    pcm = bytes(int(sample_rate * opts.lead_secs) * 2) + pcm
+
+    opts.audio_pool_size = opts.calls
+    ola_support.warmup(opts)
+
+    variants = build_variants(opts.prompt or PROMPT_PATH, opts.first_turn or FIRST_TURN_PATH)
+    labels = list(variants) if opts.variants == "all" else opts.variants.split(",")
+    unknown = [label for label in labels if label not in variants]
+    if unknown:
+        raise SystemExit(f"Unknown variants {unknown}; choose from {sorted(variants)}")
+
+    rows = []
+    for label in labels:
+        logger.warning(f"Running variant {label}: {opts.calls} calls for {opts.duration:g}s")
+        rows.append(await run_variant(label, variants[label], opts, pcm, sample_rate))
+    if opts.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_report(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to first audio across prompt/tool variants")
+    parser.add_argument("--variants", default=DEFAULT_VARIANTS, help="Comma-separated variants, or 'all'")
+    parser.add_argument("--calls", type=int, default=4, help="Concurrent calls per variant")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of caller audio per call")
+    parser.add_argument("--pcm", default=None, help="16-bit mono WAV replayed by every caller (looped)")
+    parser.add_argument("--lead-secs", type=float, default=3.0, help="Caller silence before first speaking")
+    parser.add_argument("--prompt", default=None, help="Session instructions (default: prompt.txt)")
+    parser.add_argument("--first-turn", default=None, help="First-turn message (default: first_turn.txt)")
+    parser.add_argument("--ttfb", type=float, default=0.3, help="Stub LLM time to first byte before prefill, seconds")
+    parser.add_argument(
+        "--prefill-ms-per-1k",
+        type=float,
+        default=50.0,
+        help="Modeled prefill cost of the stand-in per 1000 input tokens (default: 50)",
+    )
+    parser.add_argument("--reply-secs", type=float, default=2.0, help="Length of each canned reply")
+    parser.add_argument("--stream-speed", type=float, default=2.0, help="Reply streaming speed vs real time")
+    parser.add_argument(
+        "--noise-filter",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Run the pooled noise filter on caller audio (default: off, it only adds CPU here)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--verbose", "-v", action="count", default=0)
+    opts = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if opts.verbose else "WARNING")
+
+    opts.call_timeout = opts.duration + 60
+    opts.transcript_format = "jsonl"
+    opts.transcript_dir = tempfile.mkdtemp(prefix="ola-prompt-variants-")
+    try:
+        asyncio.run(main_async(opts))
+    finally:
+        shutil.rmtree(opts.transcript_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
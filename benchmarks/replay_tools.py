@@ -0,0 +1,427 @@
+"""Replay recorded tool-call sequences against the Ola tool layer.
+
+Tool-call sequences come from three sources:
+
+- JSONL transcripts, which record every tool call with its arguments;
+- legacy text transcripts, where calls are inferred: a phone number in a user
+  turn means ``verify_driver_number``, and keywords in the following
+  assistant reply ("RC pending", "version", "payout", ...) mean the tool that
+  reply was built from;
+- the canonical test dialogues from the readme (``CANONICAL_SCENARIOS``).
+
+Every replayed call gets its own tool session from ``register_ola_tools``, so
+the handlers run exactly as in a live call (argument normalization, per-call
+cache, tool_guard deadlines). Nothing else runs: no LLM and no audio. Sessions
+are replayed at the given concurrency against each backend. The output is a
+per-backend, per-tool table of throughput and latency percentiles. Run from
+the repo root:
+
+    python benchmarks/replay_tools.py transcripts/ --sessions 2000 --concurrency 50
+    python benchmarks/replay_tools.py --backends sqlite,cached --driver-db drivers.sqlite --json
+
+With ``--prefetch`` the lookups that follow a verified number are prefetched
+(``tool_calling.prefetch_after_verify``), and the report adds each tool's
+prefetch hit and wasted counts. Prefetching only pays off against a slow
+backend and with time between tool calls, which ``--backend-latency-ms`` and
+``--turn-gap-ms`` model:
+
+    python benchmarks/replay_tools.py --backends dict --backend-latency-ms 80 --turn-gap-ms 1500 --prefetch
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger  # noqa: E402
+from pipecat.services.llm_service import FunctionCallParams  # noqa: E402
+
+from driver_store import (  # noqa: E402
+    ACCOUNT_HEALTH_DB,
+    DRIVERS_DB,
+    INCENTIVES_DB,
+    ONLINE_STATUS_DB,
+    WALLET_DB,
+    DriverRepository,
+    MemoryDriverRepository,
+    SQLiteDriverRepository,
+    load_snapshot,
+    set_repository,
+)
+from tool_cache import CachedDriverRepository  # noqa: E402
+from tool_calling import (  # noqa: E402
+    PREFETCH_TOOLS,
+    configure_prefetch,
+    prefetch_stats,
+    register_ola_tools,
+    release_tool_session,
+)
+from transcript import iter_transcript_records  # noqa: E402
+
+ToolCall = Tuple[str, Dict[str, Any]]
+Scenario = List[ToolCall]
+
+MAJESTIC = {"lat": 12.978, "lon": 77.571}
+
+# The readme's "Driver Support — Test Dialogues", as the tool chains they trigger.
+CANONICAL_SCENARIOS: Dict[str, Scenario] = {
+    "verify_number": [("verify_driver_number", {"phone_number": "9876543210"})],
+    "blocked_number": [("verify_driver_number", {"phone_number": "9911223344"})],
+    "app_outdated": [
+        ("verify_driver_number", {"phone_number": "9876543210"}),
+        ("check_app_online_status", {}),
+        ("push_device_reauth", {"purpose": "update"}),
+    ],
+    "supply_demand": [
+        ("get_supply_demand_snapshot", dict(MAJESTIC)),
+        ("get_incentives_today", {"city": "Bengaluru"}),
+    ],
+    "payout_hold": [
+        ("verify_driver_number", {"phone_number": "9876543210"}),
+        ("fetch_wallet_and_payouts", {}),
+    ],
+    "reauth": [
+        ("verify_driver_number", {"phone_number": "9876543210"}),
+        ("push_device_reauth", {"purpose": "reauth"}),
+    ],
+    "incentives": [("get_incentives_today", {"city": "Delhi"})],
+}
+
+_TEXT_LINE = re.compile(r"^\[(?P<ts>[^\]]+)\] (?P<role>user|assistant): (?P<content>.*)$")
+_PHONE = re.compile(r"(?:\+?91[\s-]?)?\d[\d\s-]{8,}\d")
+
+# Reply keywords (lowercased) -> the tool the reply was built from.
+_REPLY_TOOLS: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("document", " rc ", "rc document", "docs pending", "strike"), "get_driver_account_health"),
+    (("version", "purana"), "check_app_online_status"),
+    (("link bhej", "otp"), "push_device_reauth"),
+    (("payout", "wallet", "kyc"), "fetch_wallet_and_payouts"),
+    (("incentive", "surge", "quest"), "get_incentives_today"),
+    (("demand", "hotspot"), "get_supply_demand_snapshot"),
+)
+
+
+def _inferred_call(tool: str, reply: str, city: str) -> ToolCall:
+    if tool == "push_device_reauth":
+        return tool, {"purpose": "update" if "update" in reply else "reauth"}
+    if tool == "get_incentives_today":
+        return tool, {"city": city}
+    if tool == "get_supply_demand_snapshot":
+        return tool, dict(MAJESTIC)
+    return tool, {}
+
+
+def scenario_from_text(lines: Iterable[str]) -> Scenario:
+    """Infer the tool calls of a legacy text transcript (see module docstring)."""
+    calls: Scenario = []
+    pending_number: Optional[str] = None
+    city = "Bengaluru"
+    for line in lines:
+        match = _TEXT_LINE.match(line.strip())
+        if not match:
+            continue
+        content = match["content"]
+        if match["role"] == "user":
+            phone = _PHONE.search(content)
+            if phone:
+                pending_number = phone.group(0)
+            if "delhi" in content.lower() or "दिल्ली" in content:
+                city = "Delhi"
+            continue
+        if pending_number:
+            calls.append(("verify_driver_number", {"phone_number": pending_number}))
+            pending_number = None
+        reply = f" {content.lower()} "
+        for keywords, tool in _REPLY_TOOLS:
+            if any(k in reply for k in keywords):
+                calls.append(_inferred_call(tool, reply, city))
+    return calls
+
+
+def load_scenarios(paths: List[str]) -> Dict[str, Scenario]:
+    """Tool-call sequences per session from JSONL and text transcripts."""
+    scenarios: Dict[str, Scenario] = {}
+    jsonl_paths, text_paths = [], []
+    for path in paths:
+        if os.path.isdir(path):
+            files = [os.path.join(path, name) for name in sorted(os.listdir(path))]
+        else:
+            files = [path]
+        for file_path in files:
+            if file_path.endswith(".jsonl"):
+                jsonl_paths.append(file_path)
+            elif file_path.endswith(".txt"):
+                text_paths.append(file_path)
+
+    by_session: Dict[str, Scenario] = defaultdict(list)
+    for record in iter_transcript_records(jsonl_paths):
+        for call in record.get("tool_calls") or []:
+            by_session[f"jsonl:{record.get('session_id')}"].append((call["name"], call.get("arguments") or {}))
+    scenarios.update(by_session)
+
+    for path in text_paths:
+        with open(path, "r", encoding="utf-8") as f:
+            calls = scenario_from_text(f)
+        if calls:
+            scenarios[f"text:{os.path.basename(path)}"] = calls
+    return {name: calls for name, calls in scenarios.items() if calls}
+
+
+class SlowRepository(DriverRepository):
+    """Adds a fixed round-trip latency to every lookup of another repository."""
+
+    def __init__(self, inner: DriverRepository, latency_ms: float):
+        self._inner = inner
+        self._latency = latency_ms / 1000
+
+    async def get_driver(self, msisdn: str) -> Optional[dict]:
+        await asyncio.sleep(self._latency)
+        return await self._inner.get_driver(msisdn)
+
+    async def get_account_health(self, msisdn: str) -> Optional[dict]:
+        await asyncio.sleep(self._latency)
+        return await self._inner.get_account_health(msisdn)
+
+    async def get_online_status(self, msisdn: str) -> Optional[dict]:
+        await asyncio.sleep(self._latency)
+        return await self._inner.get_online_status(msisdn)
+
+    async def get_wallet(self, msisdn: str) -> Optional[dict]:
+        await asyncio.sleep(self._latency)
+        return await self._inner.get_wallet(msisdn)
+
+    async def get_incentives(self, city: str, date: str) -> Optional[dict]:
+        await asyncio.sleep(self._latency)
+        return await self._inner.get_incentives(city, date)
+
+    def close(self):
+        self._inner.close()
+
+
+class ToolTable:
+    """Collects the handlers register_ola_tools would register on the LLM."""
+
+    def __init__(self):
+        self.handlers: Dict[str, Any] = {}
+
+    def register_function(self, name: str, handler):
+        self.handlers[name] = handler
+
+
+async def replay_session(
+    scenario: Scenario, durations: Dict[str, List[float]], errors: Dict[str, int], turn_gap: float = 0.0
+):
+    pc_id = f"replay-{uuid.uuid4().hex}"
+    table = ToolTable()
+    register_ola_tools(table, pc_id=pc_id)
+    try:
+        for index, (name, arguments) in enumerate(scenario):
+            if index and turn_gap:
+                # The model and the caller talking between two tool calls
+                await asyncio.sleep(turn_gap)
+            results: List[Any] = []
+
+            async def result_callback(result, *, properties=None):
+                results.append(result)
+
+            params = FunctionCallParams(
+                function_name=name,
+                tool_call_id=f"{pc_id}-{index}",
+                arguments=dict(arguments),
+                llm=None,
+                context=None,
+                result_callback=result_callback,
+            )
+            start = time.perf_counter()
+            await table.handlers[name](params)
+            durations[name].append((time.perf_counter() - start) * 1000)
+            result = results[0] if results else None
+            if not isinstance(result, dict) or result.get("status") in ("unavailable", "error"):
+                errors[name] += 1
+    finally:
+        release_tool_session(pc_id)
+
+
+async def run_backend(
+    repository: DriverRepository,
+    scenarios: List[Scenario],
+    sessions: int,
+    concurrency: int,
+    turn_gap: float = 0.0,
+) -> Dict[str, Any]:
+    set_repository(repository)
+    prefetch_before = prefetch_stats()
+    durations: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int):
+        async with semaphore:
+            await replay_session(scenarios[index % len(scenarios)], durations, errors, turn_gap)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(sessions)))
+    wall = time.perf_counter() - start
+
+    tools = {}
+    for name, values in sorted(durations.items()):
+        samples = np.asarray(values)
+        tools[name] = {
+            "calls": len(values),
+            "errors": errors.get(name, 0),
+            "calls_per_sec": round(len(values) / wall, 1),
+            "p50_ms": round(float(np.percentile(samples, 50)), 3),
+            "p95_ms": round(float(np.percentile(samples, 95)), 3),
+            "p99_ms": round(float(np.percentile(samples, 99)), 3),
+            "max_ms": round(float(samples.max()), 3),
+        }
+    for tool, row in prefetch_stats().items():
+        before = prefetch_before.get(tool, {})
+        if tool in tools:
+            tools[tool]["prefetch_hit"] = row["hit"] - before.get("hit", 0)
+            tools[tool]["prefetch_wasted"] = row["wasted"] - before.get("wasted", 0)
+    total_calls = sum(len(v) for v in durations.values())
+    return {
+        "sessions_per_sec": round(sessions / wall, 1),
+        "calls_per_sec": round(total_calls / wall, 1),
+        "tools": tools,
+    }
+
+
+def build_mock_snapshot(directory: str) -> str:
+    """Write the mock datastores into a SQLite snapshot via the bulk loader."""
+    db_path = os.path.join(directory, "drivers.sqlite")
+    per_driver = {
+        "drivers": DRIVERS_DB,
+        "account_health": ACCOUNT_HEALTH_DB,
+        "online_status": ONLINE_STATUS_DB,
+        "wallet": WALLET_DB,
+    }
+    for table, rows in per_driver.items():
+        source = os.path.join(directory, f"{table}.jsonl")
+        with open(source, "w", encoding="utf-8") as f:
+            for msisdn, row in rows.items():
+                f.write(json.dumps({"msisdn": msisdn, **row}) + "\n")
+        load_snapshot(db_path, table, source)
+    source = os.path.join(directory, "incentives.jsonl")
+    with open(source, "w", encoding="utf-8") as f:
+        for (city, day), row in INCENTIVES_DB.items():
+            f.write(json.dumps({"city": city, "date": day, **row}) + "\n")
+    load_snapshot(db_path, "incentives", source)
+    return db_path
+
+
+def make_backend(name: str, db_path: str, latency_ms: float = 0.0) -> DriverRepository:
+    def slow(repository: DriverRepository) -> DriverRepository:
+        return SlowRepository(repository, latency_ms) if latency_ms else repository
+
+    if name == "dict":
+        return slow(MemoryDriverRepository())
+    if name == "sqlite":
+        return slow(SQLiteDriverRepository(db_path))
+    if name == "cached":
+        return CachedDriverRepository(slow(SQLiteDriverRepository(db_path)))
+    if name == "cached-dict":
+        return CachedDriverRepository(slow(MemoryDriverRepository()))
+    raise ValueError(f"Unknown backend {name}")
+
+
+def print_report(results: Dict[str, Dict[str, Any]]):
+    header = (
+        f"{'backend':<12} {'tool':<28} {'calls':>7} {'err':>5} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'pf hit':>7} {'pf waste':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for backend, result in results.items():
+        for tool, row in result["tools"].items():
+            print(
+                f"{backend:<12} {tool:<28} {row['calls']:>7} {row['errors']:>5} {row['calls_per_sec']:>9.1f} "
+                f"{row['p50_ms']:>8.3f} {row['p95_ms']:>8.3f} {row['p99_ms']:>8.3f} {row['max_ms']:>8.3f} "
+                f"{row.get('prefetch_hit', '-'):>7} {row.get('prefetch_wasted', '-'):>8}"
+            )
+        print(
+            f"{backend:<12} {'(all tools)':<28} {'':>7} {'':>5} {result['calls_per_sec']:>9.1f}"
+            f"   sessions/s {result['sessions_per_sec']:.1f}"
+        )
+
+
+async def main_async(opts: argparse.Namespace):
+    scenarios = load_scenarios(opts.transcripts)
+    if opts.canonical:
+        scenarios.update({f"canonical:{name}": calls for name, calls in CANONICAL_SCENARIOS.items()})
+    if not scenarios:
+        raise SystemExit("No tool-call sequences found")
+    logger.info(f"Replaying {len(scenarios)} tool-call sequences")
+    for name, calls in scenarios.items():
+        logger.debug(f"{name}: {[tool for tool, _ in calls]}")
+
+    configure_prefetch(opts.prefetch_tools.split(",") if opts.prefetch else ())
+    with tempfile.TemporaryDirectory(prefix="ola-replay-") as tmp:
+        db_path = opts.driver_db or build_mock_snapshot(tmp)
+        results = {}
+        for backend in opts.backends.split(","):
+            repository = make_backend(backend, db_path, opts.backend_latency_ms)
+            try:
+                results[backend] = await run_backend(
+                    repository,
+                    list(scenarios.values()),
+                    opts.sessions,
+                    opts.concurrency,
+                    opts.turn_gap_ms / 1000,
+                )
+            finally:
+                repository.close()
+
+    if opts.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay transcript tool calls against the Ola tool layer")
+    parser.add_argument("transcripts", nargs="*", default=["transcripts"], help="Transcript files or directories")
+    parser.add_argument("--sessions", type=int, default=1000, help="Replayed sessions per backend")
+    parser.add_argument("--concurrency", type=int, default=50, help="Sessions replayed at once")
+    parser.add_argument("--backends", default="dict,sqlite,cached", help="dict, sqlite, cached, cached-dict")
+    parser.add_argument("--driver-db", default=None, help="SQLite snapshot (default: built from the mock data)")
+    parser.add_argument(
+        "--canonical",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Include the readme's canonical test dialogues (default: on)",
+    )
+    parser.add_argument(
+        "--backend-latency-ms", type=float, default=0.0, help="Round trip added to every backend lookup"
+    )
+    parser.add_argument("--turn-gap-ms", type=float, default=0.0, help="Pause between the tool calls of a session")
+    parser.add_argument(
+        "--prefetch",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Prefetch the lookups that follow a verified number (default: off)",
+    )
+    parser.add_argument("--prefetch-tools", default=",".join(PREFETCH_TOOLS), help="Lookups prefetched with --prefetch")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--verbose", "-v", action="count", default=0)
+    opts = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if opts.verbose else "WARNING")
+    asyncio.run(main_async(opts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+from pipecat.frames.frames import Frame, OpenAILLMContextAssistantTimestampFrame
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from metrics import TOKEN_BUCKETS, SessionMetrics, histogram
+from prompt_budget import count_tokens
+
+# First line of the system message that carries facts from compacted turns
+FACTS_HEADER = "Facts from earlier in this call (tool results, most recent per tool):"
+
+
+@dataclass(frozen=True)
+class ContextBudget:
+    """Limits of a call's conversation context.
+
+    Attributes:
+        max_tokens: Compact once the context grows past this many tokens.
+        keep_turns: Most recent user turns always kept verbatim.
+        max_fact_chars: Longest single fact kept from an old tool result.
+    """
+
+    max_tokens: int = 2000
+    keep_turns: int = 3
+    max_fact_chars: int = 200
+
+
+def context_tokens(messages: List[Dict[str, Any]]) -> int:
+    return count_tokens(json.dumps(messages, ensure_ascii=False, default=str))
+
+
+def _short(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    if isinstance(value, list):
+        if any(isinstance(item, (dict, list)) for item in value):
+            return f"[{len(value)} items]"
+        more = f" +{len(value) - 3}" if len(value) > 3 else ""
+        return "[" + ", ".join(_short(item) for item in value[:3]) + more + "]"
+    return str(value)
+
+
+def tool_fact(name: str, arguments: Any, result: Any, max_chars: int = 200) -> str:
+    """One-line summary of a tool call: its arguments and the scalar fields of its result.
+
+    ``verify_driver_number(phone_number=+919876543210) -> is_registered=true, is_blocked=false``
+    """
+    if isinstance(arguments, str):
+        try:
+            arguments = json.loads(arguments or "{}")
+        except ValueError:
+            arguments = {}
+    if isinstance(result, str):
+        try:
+            result = json.loads(result)
+        except ValueError:
+            pass
+    args = ", ".join(f"{k}={_short(v)}" for k, v in (arguments or {}).items())
+    if isinstance(result, dict):
+        # Nested objects (hotspot lists, hold details) are dropped; scalars carry the facts
+        fields = ", ".join(f"{k}={_short(v)}" for k, v in result.items() if not isinstance(v, dict))
+    else:
+        fields = _short(result)
+    fact = f"{name}({args}) -> {fields}"
+    return fact if len(fact) <= max_chars else fact[: max_chars - 3] + "..."
+
+
+def facts_text(facts: Dict[str, str]) -> Optional[str]:
+    """Content of the system message carrying ``facts``, or None when there are none."""
+    if not facts:
+        return None
+    return FACTS_HEADER + "\n" + "\n".join(f"- {fact}" for fact in facts.values())
+
+
+def compact_messages(
+    messages: List[Dict[str, Any]],
+    budget: ContextBudget,
+    facts: Dict[str, str],
+    stale: Iterable[Dict[str, Any]] = (),
+) -> List[Dict[str, Any]]:
+    """Fit ``messages`` (OpenAI format) into ``budget``.
+
+    The last ``budget.keep_turns`` user turns stay verbatim, as do system
+    messages. Tool calls before them are folded into ``facts`` (one line per
+    tool, newest wins; updated in place) and sent as a single system
+    message. Older user/assistant text is then dropped, oldest first, until
+    the context fits; ``stale`` messages (like the one that prompts the
+    greeting) go first.
+
+    Returns:
+        The compacted message list, or ``messages`` itself when it already fits.
+    """
+    if context_tokens(messages) <= budget.max_tokens:
+        return messages
+
+    stale_ids = {id(message) for message in stale}
+    user_positions = [i for i, m in enumerate(messages) if m.get("role") == "user" and id(m) not in stale_ids]
+    if len(user_positions) <= budget.keep_turns:
+        return messages
+    cut = user_positions[-budget.keep_turns]
+    old, recent = messages[:cut], messages[cut:]
+
+    pinned: List[Dict[str, Any]] = []
+    text: List[Tuple[bool, Dict[str, Any]]] = []
+    calls: Dict[str, Tuple[str, Any]] = {}
+    for message in old:
+        role = message.get("role")
+        if role == "system":
+            if not str(message.get("content", "")).startswith(FACTS_HEADER):
+                pinned.append(message)
+        elif role == "assistant" and message.get("tool_calls"):
+            for call in message["tool_calls"]:
+                function = call.get("function", {})
+                calls[call.get("id")] = (function.get("name", "tool"), function.get("arguments"))
+        elif role == "tool":
+            name, arguments = calls.get(message.get("tool_call_id"), ("tool", None))
+            # Re-inserted so the dict keeps the tools in the order they last ran
+            facts.pop(name, None)
+            facts[name] = tool_fact(name, arguments, message.get("content"), budget.max_fact_chars)
+        else:
+            text.append((id(message) in stale_ids, message))
+
+    content = facts_text(facts)
+    facts_message = [{"role": "system", "content": content}] if content else []
+
+    # Stale messages first, then the oldest text
+    kept = [message for is_stale, message in text if not is_stale]
+    compacted = pinned + facts_message + kept + recent
+    while kept and context_tokens(compacted) > budget.max_tokens:
+        kept.pop(0)
+        compacted = pinned + facts_message + kept + recent
+    # Recent turns alone can exceed the budget; nothing left to compact then
+    return messages if compacted == messages else compacted
+
+
+class ContextBudgetProcessor(FrameProcessor):
+    """Keeps a call's conversation context within a ContextBudget.
+
+    Placed after the assistant context aggregator, it runs once per
+    completed assistant turn (the aggregator's timestamp frame): it records
+    the context size, and compacts the context when the size is over budget.
+    With the realtime service the model keeps its own copy of the
+    conversation, so the same turns are also removed there (see
+    ``PrecompiledRealtimeLLMService.compact_conversation``).
+
+    Metrics: the ``context_tokens`` gauge and ``context_compactions`` counter
+    of the call's SessionMetrics, and the worker-wide ``context.tokens``
+    histogram (tokens per turn).
+    """
+
+    def __init__(
+        self,
+        context: OpenAILLMContext,
+        budget: ContextBudget,
+        session: SessionMetrics,
+        llm: Optional[Any] = None,
+        stale: Iterable[Dict[str, Any]] = (),
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._context = context
+        self._budget = budget
+        self._session = session
+        self._llm = llm
+        self._stale = list(stale)
+        self._facts: Dict[str, str] = {}
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, OpenAILLMContextAssistantTimestampFrame):
+            await self._enforce()
+        await self.push_frame(frame, direction)
+
+    async def _enforce(self):
+        messages = self._context.messages
+        after = before = context_tokens(messages)
+        compacted = messages
+        if before > self._budget.max_tokens:
+            compacted = compact_messages(messages, self._budget, self._facts, self._stale)
+        if compacted is not messages:
+            self._context.set_messages(compacted)
+            after = context_tokens(compacted)
+            self._session.increment("context_compactions")
+            logger.debug(f"{self}: context compacted from {before} to {after} tokens")
+            compact_conversation = getattr(self._llm, "compact_conversation", None)
+            if compact_conversation is not None:
+                await compact_conversation(self._budget.keep_turns, facts_text(self._facts))
+        self._session.set("context_tokens", after)
+        histogram("context.tokens", TOKEN_BUCKETS, unit="tokens").observe(after)
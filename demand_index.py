@@ -0,0 +1,402 @@
+import asyncio
+import csv
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from metrics import histogram
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distance (km) from one point to arrays of points."""
+    lat1 = np.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons - lon)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+class DemandIndex:
+    """Grid index over demand-zone centroids, stored as columnar NumPy arrays.
+
+    Zones are bucketed into ``cell_deg`` x ``cell_deg`` cells and sorted by
+    cell key (``row * cols + col``), so the zones of one grid row within a
+    column range form a contiguous slice found with two ``searchsorted``
+    calls. A query only touches the cells covering its search radius and
+    runs the haversine/ETA math vectorized over those candidates.
+
+    An index is immutable once built: refreshes build a new one with a higher
+    ``version`` and swap the reference, so a call that already holds an index
+    keeps reading a consistent version until it is done.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        lat: np.ndarray,
+        lon: np.ndarray,
+        demand: np.ndarray,
+        wait_mins: np.ndarray,
+        cell_deg: float = 0.02,
+        version: int = 0,
+        presorted: bool = False,
+    ):
+        self.cell_deg = cell_deg
+        self.version = version
+        self._cols = int(np.ceil(360 / cell_deg)) + 1
+        keys = self._cell_keys(np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64))
+        if presorted:
+            # Columns already ordered by cell key (e.g. memory-mapped from
+            # write_columnar): use them as-is, without copying.
+            order = slice(None)
+        else:
+            order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.names = np.asarray(names)[order]
+        self.lat = np.asarray(lat, dtype=np.float64)[order]
+        self.lon = np.asarray(lon, dtype=np.float64)[order]
+        self.demand = np.asarray(demand, dtype=np.float32)[order]
+        self.wait_mins = np.asarray(wait_mins, dtype=np.float32)[order]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _cell_keys(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        rows = np.floor((lat + 90) / self.cell_deg).astype(np.int64)
+        cols = np.floor((lon + 180) / self.cell_deg).astype(np.int64)
+        return rows * self._cols + cols
+
+    def candidates(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        """Indices of zones in the grid cells covering ``radius_km`` around the point."""
+        dlat = radius_km / 111.0
+        dlon = radius_km / max(111.0 * np.cos(np.radians(lat)), 1e-6)
+        row_lo = int(np.floor((lat - dlat + 90) / self.cell_deg))
+        row_hi = int(np.floor((lat + dlat + 90) / self.cell_deg))
+        col_lo = int(np.floor((lon - dlon + 180) / self.cell_deg))
+        col_hi = int(np.floor((lon + dlon + 180) / self.cell_deg))
+        rows = np.arange(row_lo, row_hi + 1, dtype=np.int64)
+        starts = np.searchsorted(self.keys, rows * self._cols + col_lo, side="left")
+        ends = np.searchsorted(self.keys, rows * self._cols + col_hi, side="right")
+        slices = [np.arange(s, e) for s, e in zip(starts, ends) if e > s]
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def hotspots(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 3,
+        radius_km: float = 8.0,
+        speed_kmph: float = 20.0,
+    ) -> List[dict]:
+        """Top-k zones by demand discounted by driving ETA from the point."""
+        idx = self.candidates(lat, lon, radius_km)
+        if not len(idx):
+            return []
+        dist = haversine_km(lat, lon, self.lat[idx], self.lon[idx])
+        in_radius = dist <= radius_km
+        idx, dist = idx[in_radius], dist[in_radius]
+        if not len(idx):
+            return []
+        eta = dist / speed_kmph * 60
+        score = self.demand[idx] / (1.0 + eta / 15.0)
+        k = min(k, len(idx))
+        top = np.argpartition(-score, k - 1)[:k]
+        top = top[np.argsort(-score[top])]
+        return [
+            {
+                "name": str(self.names[idx[i]]),
+                "lat": round(float(self.lat[idx[i]]), 4),
+                "lon": round(float(self.lon[idx[i]]), 4),
+                "eta_mins": int(round(float(eta[i]))),
+                "demand_index": round(float(self.demand[idx[i]]), 2),
+            }
+            for i in top
+        ]
+
+    def snapshot(self, lat: float, lon: float, k: int = 2, radius_km: float = 8.0) -> dict:
+        """Answer in the ``get_supply_demand_snapshot`` result shape."""
+        idx = self.candidates(lat, lon, 2.0)
+        if len(idx):
+            dist = haversine_km(lat, lon, self.lat[idx], self.lon[idx])
+            local = idx[dist <= 2.0]
+        else:
+            local = idx
+        demand_here = float(self.demand[local].mean()) if len(local) else 0.0
+        wait_here = float(np.median(self.wait_mins[local])) if len(local) else None
+        spots = self.hotspots(lat, lon, k=k, radius_km=radius_km)
+        suggestion = None
+        if spots and spots[0]["demand_index"] > demand_here:
+            suggestion = f"{spots[0]['name']} taraf move kariye; wahan demand zyada hai."
+        return {
+            "demand_index": round(demand_here, 2),
+            "median_wait_mins": int(round(wait_here)) if wait_here is not None else None,
+            "hotspots": spots,
+            "suggestion": suggestion,
+        }
+
+
+ZONE_COLUMNS = ("name", "lat", "lon", "demand_index", "median_wait_mins")
+Chunk = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def iter_zone_chunks(path: str, chunk_rows: int = 50_000) -> Iterator[Chunk]:
+    """Stream a zone CSV as columnar chunks of at most ``chunk_rows`` rows.
+
+    The CSV needs name,lat,lon,demand_index columns (median_wait_mins is
+    optional). Only one chunk of Python rows is alive at a time.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        col = {name: header.index(name) for name in ZONE_COLUMNS if name in header}
+        wait_col = col.get("median_wait_mins")
+        rows: List[List[str]] = []
+
+        def to_chunk() -> Chunk:
+            return (
+                np.array([r[col["name"]] for r in rows]),
+                np.array([r[col["lat"]] for r in rows], dtype=np.float64),
+                np.array([r[col["lon"]] for r in rows], dtype=np.float64),
+                np.array([r[col["demand_index"]] for r in rows], dtype=np.float32),
+                np.array([r[wait_col] or 0 for r in rows] if wait_col is not None else np.zeros(len(rows)), dtype=np.float32),
+            )
+
+        for row in reader:
+            rows.append(row)
+            if len(rows) >= chunk_rows:
+                yield to_chunk()
+                rows = []
+        if rows:
+            yield to_chunk()
+
+
+_CURRENT = "CURRENT"
+_VERSION_DIR = re.compile(r"^v(\d+)$")
+
+
+def _published_dir(directory: str) -> str:
+    """Version directory a columnar snapshot's CURRENT pointer names (flat layout: the directory)."""
+    pointer = os.path.join(directory, _CURRENT)
+    if not os.path.exists(pointer):
+        return directory
+    with open(pointer, "r", encoding="utf-8") as f:
+        return os.path.join(directory, f.read().strip())
+
+
+def write_columnar(index: DemandIndex, directory: str, keep: int = 2):
+    """Save an index as sorted .npy columns that load_columnar can memory-map.
+
+    Every snapshot goes to a new ``v<ns>`` subdirectory and is published by
+    atomically replacing the ``CURRENT`` pointer file. Published columns are
+    never rewritten: readers may have them memory-mapped, and truncating a
+    mapped file kills the process with SIGBUS. Versions older than the last
+    ``keep`` are deleted, which is safe for mappings that are still open.
+    """
+    os.makedirs(directory, exist_ok=True)
+    name = f"v{time.time_ns()}"
+    target = os.path.join(directory, name)
+    os.makedirs(target)
+    np.save(os.path.join(target, "names.npy"), index.names.astype(str))
+    for column in ("lat", "lon", "demand", "wait_mins"):
+        np.save(os.path.join(target, f"{column}.npy"), getattr(index, column))
+    with open(os.path.join(target, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"cell_deg": index.cell_deg, "zones": len(index)}, f)
+
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{_CURRENT}.")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(name)
+    os.replace(tmp, os.path.join(directory, _CURRENT))
+
+    versions = sorted(
+        (int(m.group(1)), entry) for entry in os.listdir(directory) if (m := _VERSION_DIR.match(entry))
+    )
+    for _, old in versions[:-keep]:
+        shutil.rmtree(os.path.join(directory, old), ignore_errors=True)
+
+
+def load_columnar(directory: str, version: int = 0) -> DemandIndex:
+    """Memory-map the published write_columnar snapshot; columns are used without copying."""
+    directory = _published_dir(directory)
+    with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    columns = {
+        name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+        for name in ("names", "lat", "lon", "demand", "wait_mins")
+    }
+    return DemandIndex(
+        columns["names"], columns["lat"], columns["lon"], columns["demand"], columns["wait_mins"],
+        cell_deg=meta["cell_deg"], version=version, presorted=True,
+    )
+
+
+def snapshot_mtime(path: str) -> float:
+    """Modification time of a snapshot; columnar directories are tracked by their CURRENT pointer."""
+    if os.path.isdir(path):
+        pointer = os.path.join(path, _CURRENT)
+        return os.path.getmtime(pointer if os.path.exists(pointer) else os.path.join(path, "meta.json"))
+    return os.path.getmtime(path)
+
+
+class _ColumnBuffer:
+    """Growable column: each chunk is copied in and can be dropped at once."""
+
+    def __init__(self):
+        self._data: Optional[np.ndarray] = None
+        self._size = 0
+
+    def append(self, chunk: np.ndarray):
+        n = len(chunk)
+        data = self._data
+        dtype = chunk.dtype if data is None else np.promote_types(data.dtype, chunk.dtype)
+        if data is None or self._size + n > len(data) or dtype != data.dtype:
+            grown = np.empty(max(self._size + n, 2 * len(data) if data is not None else n), dtype)
+            if data is not None:
+                grown[: self._size] = data[: self._size]
+            self._data = data = grown
+        data[self._size : self._size + n] = chunk
+        self._size += n
+
+    def values(self) -> np.ndarray:
+        return self._data[: self._size]
+
+
+def load_demand_index(path: str, cell_deg: float = 0.02, version: int = 0) -> DemandIndex:
+    """Build a DemandIndex from a zone CSV (streamed in chunks) or a columnar directory."""
+    if os.path.isdir(path):
+        return load_columnar(path, version=version)
+    columns = [_ColumnBuffer() for _ in range(5)]
+    zones = 0
+    for chunk in iter_zone_chunks(path):
+        for column, values in zip(columns, chunk):
+            column.append(values)
+        zones += len(chunk[0])
+        del chunk
+    if not zones:
+        raise ValueError(f"No demand zones in {path}")
+    names, lat, lon, demand, wait = (column.values() for column in columns)
+    del columns
+    return DemandIndex(names, lat, lon, demand, wait, cell_deg=cell_deg, version=version)
+
+
+class DemandIndexStore:
+    """Holds the current DemandIndex version and swaps in refreshed ones.
+
+    The snapshot's mtime is checked at most every ``poll_interval`` seconds
+    from the query path. A changed snapshot is ingested and indexed in a
+    worker thread, then published with a single reference assignment; calls
+    that already hold the previous version finish on it, and it is freed
+    once the last of them drops its reference.
+
+    Refresh durations go to the ``demand.refresh`` histogram and the lag
+    between the file changing and the new version serving to
+    ``demand.swap_lag``.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 30.0):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.index: Optional[DemandIndex] = None
+        self.refreshes = 0
+        self.failures = 0
+        self.last_refresh_ms: Optional[float] = None
+        self.last_swap_lag_secs: Optional[float] = None
+        self._mtime = 0.0
+        self._last_poll = 0.0
+        self._reload_task: Optional[asyncio.Task] = None
+
+    @property
+    def version(self) -> int:
+        return self.index.version if self.index else 0
+
+    def _build(self, mtime: float) -> DemandIndex:
+        start = time.perf_counter()
+        index = load_demand_index(self.path, version=self.version + 1)
+        self.last_refresh_ms = (time.perf_counter() - start) * 1000
+        histogram("demand.refresh").observe(self.last_refresh_ms)
+        return index
+
+    def _swap(self, index: DemandIndex, mtime: float):
+        self.index, self._mtime = index, mtime
+        self.refreshes += 1
+        self.last_swap_lag_secs = max(time.time() - mtime, 0.0)
+        histogram("demand.swap_lag").observe(self.last_swap_lag_secs * 1000)
+        logger.info(
+            f"Demand index v{index.version}: {len(index)} zones from {self.path} "
+            f"(build {self.last_refresh_ms:.1f} ms, swap lag {self.last_swap_lag_secs:.1f} s)"
+        )
+
+    def load(self):
+        """Build the first version synchronously (startup)."""
+        mtime = snapshot_mtime(self.path)
+        self._swap(self._build(mtime), mtime)
+
+    async def refresh(self, mtime: Optional[float] = None):
+        """Build the next version off-thread and swap it in."""
+        mtime = mtime if mtime is not None else snapshot_mtime(self.path)
+        try:
+            index = await asyncio.to_thread(self._build, mtime)
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Demand snapshot refresh failed, keeping v{self.version}: {e}")
+            return
+        self._swap(index, mtime)
+
+    def poll(self):
+        """Schedule a background refresh if the snapshot changed on disk."""
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval or (self._reload_task and not self._reload_task.done()):
+            return
+        self._last_poll = now
+        try:
+            mtime = snapshot_mtime(self.path)
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self._reload_task = asyncio.create_task(self.refresh(mtime))
+
+    def current(self) -> Optional[DemandIndex]:
+        """The latest version; hold on to it for the duration of one query."""
+        self.poll()
+        return self.index
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "zones": len(self.index) if self.index else 0,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_refresh_ms": round(self.last_refresh_ms, 1) if self.last_refresh_ms is not None else None,
+            "last_swap_lag_secs": round(self.last_swap_lag_secs, 1) if self.last_swap_lag_secs is not None else None,
+        }
+
+
+_store: Optional[DemandIndexStore] = None
+
+
+def get_demand_store() -> Optional[DemandIndexStore]:
+    return _store
+
+
+def configure_demand_index(path: Optional[str] = None) -> Optional[DemandIndexStore]:
+    """Load the demand snapshot at ``path`` (or $OLA_DEMAND_SNAPSHOT) once at startup.
+
+    ``path`` is a zone CSV or a directory written by ``write_columnar``.
+    """
+    global _store
+    path = path or os.getenv("OLA_DEMAND_SNAPSHOT")
+    if not path:
+        _store = None
+        return None
+    _store = DemandIndexStore(path)
+    _store.load()
+    return _store
@@ -0,0 +1,308 @@
+import abc
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from msisdn import normalize_msisdn
+
+# Mock “datastores” (used by MemoryDriverRepository)
+DRIVERS_DB: Dict[str, Dict[str, Any]] = {
+    "+919876543210": {"name": "Ramesh", "blocked": False, "registered": True, "city": "Bengaluru", "rating": 4.82},
+    "+919911223344": {"name": "Suresh", "blocked": True,  "registered": True, "city": "Delhi", "rating": 4.55},
+}
+
+ACCOUNT_HEALTH_DB = {
+    "+919876543210": {"docs_pending": [], "bgv_status": "clear", "strikes": 0, "deactivation_reason": None},
+    "+919911223344": {"docs_pending": ["RC"], "bgv_status": "pending", "strikes": 2, "deactivation_reason": "compliance_hold"},
+}
+
+ONLINE_STATUS_DB = {
+    "+919876543210": {"last_online_at": "2025-10-24T09:10:00+05:30", "online_hours_today": 2.3, "app_version": "5.14.2"},
+    "+919911223344": {"last_online_at": "2025-10-24T07:05:00+05:30", "online_hours_today": 0.4, "app_version": "5.10.0"},
+}
+
+WALLET_DB = {
+    "+919876543210": {"wallet_balance": 732.50, "next_payout_date": "2025-10-26", "holds": []},
+    "+919911223344": {"wallet_balance": 12.0,   "next_payout_date": "2025-10-25", "holds": ["KYC hold"]},
+}
+
+INCENTIVES_DB = {
+    ("Bengaluru","2025-10-24"): {"surge_multiplier": 1.0, "quest_bonus": "3 rides → ₹150", "slots_remaining": True},
+    ("Delhi","2025-10-24"):     {"surge_multiplier": 1.4, "quest_bonus": "5 rides → ₹300", "slots_remaining": False},
+}
+
+
+class DriverRepository(abc.ABC):
+    """Read-only access to the driver facts the Ola tools need.
+
+    Per-driver records are keyed by normalized MSISDN (``+91XXXXXXXXXX``),
+    incentives by ``(city, "YYYY-MM-DD")``. Every method returns a plain dict,
+    or None when there is no record.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    async def get_driver(self, msisdn: str) -> Optional[dict]:
+        ...
+
+    @abc.abstractmethod
+    async def get_account_health(self, msisdn: str) -> Optional[dict]:
+        ...
+
+    @abc.abstractmethod
+    async def get_online_status(self, msisdn: str) -> Optional[dict]:
+        ...
+
+    @abc.abstractmethod
+    async def get_wallet(self, msisdn: str) -> Optional[dict]:
+        ...
+
+    @abc.abstractmethod
+    async def get_incentives(self, city: str, date: str) -> Optional[dict]:
+        ...
+
+    def close(self):
+        pass
+
+
+class MemoryDriverRepository(DriverRepository):
+    """Repository over in-memory dicts; defaults to the mock datastores."""
+
+    name = "memory"
+
+    def __init__(
+        self,
+        drivers: Optional[Dict[str, dict]] = None,
+        account_health: Optional[Dict[str, dict]] = None,
+        online_status: Optional[Dict[str, dict]] = None,
+        wallet: Optional[Dict[str, dict]] = None,
+        incentives: Optional[Dict[Tuple[str, str], dict]] = None,
+    ):
+        self.drivers = DRIVERS_DB if drivers is None else drivers
+        self.account_health = ACCOUNT_HEALTH_DB if account_health is None else account_health
+        self.online_status = ONLINE_STATUS_DB if online_status is None else online_status
+        self.wallet = WALLET_DB if wallet is None else wallet
+        self.incentives = INCENTIVES_DB if incentives is None else incentives
+
+    async def get_driver(self, msisdn: str) -> Optional[dict]:
+        return self.drivers.get(msisdn)
+
+    async def get_account_health(self, msisdn: str) -> Optional[dict]:
+        return self.account_health.get(msisdn)
+
+    async def get_online_status(self, msisdn: str) -> Optional[dict]:
+        return self.online_status.get(msisdn)
+
+    async def get_wallet(self, msisdn: str) -> Optional[dict]:
+        return self.wallet.get(msisdn)
+
+    async def get_incentives(self, city: str, date: str) -> Optional[dict]:
+        return self.incentives.get((city, date))
+
+
+# SQLite snapshot layout. Per-driver tables are keyed (and clustered) by the
+# normalized MSISDN, incentives by (city, date); list fields are stored as JSON.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drivers (
+    msisdn TEXT PRIMARY KEY, name TEXT, blocked INTEGER, registered INTEGER, city TEXT, rating REAL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS account_health (
+    msisdn TEXT PRIMARY KEY, docs_pending TEXT, bgv_status TEXT, strikes INTEGER, deactivation_reason TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS online_status (
+    msisdn TEXT PRIMARY KEY, last_online_at TEXT, online_hours_today REAL, app_version TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS wallet (
+    msisdn TEXT PRIMARY KEY, wallet_balance REAL, next_payout_date TEXT, holds TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS incentives (
+    city TEXT, date TEXT, surge_multiplier REAL, quest_bonus TEXT, slots_remaining INTEGER,
+    PRIMARY KEY (city, date)
+) WITHOUT ROWID;
+"""
+
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "drivers": ("msisdn", "name", "blocked", "registered", "city", "rating"),
+    "account_health": ("msisdn", "docs_pending", "bgv_status", "strikes", "deactivation_reason"),
+    "online_status": ("msisdn", "last_online_at", "online_hours_today", "app_version"),
+    "wallet": ("msisdn", "wallet_balance", "next_payout_date", "holds"),
+    "incentives": ("city", "date", "surge_multiplier", "quest_bonus", "slots_remaining"),
+}
+JSON_COLUMNS = {"docs_pending", "holds"}
+BOOL_COLUMNS = {"blocked", "registered", "slots_remaining"}
+
+
+class SQLiteDriverRepository(DriverRepository):
+    """Repository over a read-only SQLite snapshot shared by all workers.
+
+    The file is opened with ``mode=ro`` so every worker process maps the same
+    pages through the OS cache instead of holding its own copy of the data.
+    Queries are indexed point lookups run in the default executor, one
+    connection per executor thread; ``close`` closes all of them.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Driver snapshot not found: {path}")
+        self.path = path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _fetch_one(self, table: str, where: str, params: Tuple[Any, ...]) -> Optional[dict]:
+        row = self._connection().execute(f"SELECT * FROM {table} WHERE {where}", params).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        for key in JSON_COLUMNS.intersection(record):
+            record[key] = json.loads(record[key]) if record[key] else []
+        for key in BOOL_COLUMNS.intersection(record):
+            record[key] = bool(record[key])
+        return record
+
+    async def _query(self, table: str, where: str, *params: Any) -> Optional[dict]:
+        return await asyncio.to_thread(self._fetch_one, table, where, params)
+
+    async def get_driver(self, msisdn: str) -> Optional[dict]:
+        return await self._query("drivers", "msisdn = ?", msisdn)
+
+    async def get_account_health(self, msisdn: str) -> Optional[dict]:
+        return await self._query("account_health", "msisdn = ?", msisdn)
+
+    async def get_online_status(self, msisdn: str) -> Optional[dict]:
+        return await self._query("online_status", "msisdn = ?", msisdn)
+
+    async def get_wallet(self, msisdn: str) -> Optional[dict]:
+        return await self._query("wallet", "msisdn = ?", msisdn)
+
+    async def get_incentives(self, city: str, date: str) -> Optional[dict]:
+        return await self._query("incentives", "city = ? AND date = ?", city, date)
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+            # Threads that query again open new connections
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+
+def _read_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream rows from a .csv or .jsonl file."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def _coerce(column: str, value: Any) -> Any:
+    if column in JSON_COLUMNS:
+        if isinstance(value, str):
+            # CSV cells hold lists as JSON or "a|b" strings
+            value = json.loads(value) if value.startswith("[") else [v for v in value.split("|") if v]
+        return json.dumps(value or [])
+    if column in BOOL_COLUMNS:
+        if isinstance(value, str):
+            return int(value.strip().lower() in ("1", "true", "yes"))
+        return int(bool(value))
+    if value == "":
+        return None
+    return value
+
+
+def load_snapshot(db_path: str, table: str, source_path: str, batch_size: int = 10_000) -> int:
+    """Bulk load a CSV/JSONL file into ``table`` of the snapshot at ``db_path``.
+
+    MSISDNs are normalized on the way in, rows are inserted in batches inside
+    one transaction, and existing keys are replaced. Returns the row count.
+    """
+    if table not in TABLE_COLUMNS:
+        raise ValueError(f"Unknown table {table}; expected one of {sorted(TABLE_COLUMNS)}")
+    columns = TABLE_COLUMNS[table]
+    sql = f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        total = 0
+        batch = []
+        with conn:
+            for row in _read_rows(source_path):
+                if "msisdn" in row:
+                    row["msisdn"] = normalize_msisdn(str(row["msisdn"]))
+                batch.append(tuple(_coerce(c, row.get(c)) for c in columns))
+                if len(batch) >= batch_size:
+                    conn.executemany(sql, batch)
+                    total += len(batch)
+                    batch.clear()
+            if batch:
+                conn.executemany(sql, batch)
+                total += len(batch)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    logger.info(f"Loaded {total} rows into {table} from {source_path}")
+    return total
+
+
+_repository: DriverRepository = MemoryDriverRepository()
+
+
+def get_repository() -> DriverRepository:
+    return _repository
+
+
+def set_repository(repository: DriverRepository) -> DriverRepository:
+    """Install ``repository`` (e.g. a caching wrapper) as the process-wide backend."""
+    global _repository
+    _repository = repository
+    return _repository
+
+
+def configure_repository(path: Optional[str] = None) -> DriverRepository:
+    """Select the backend: SQLite snapshot at ``path`` (or $OLA_DRIVER_DB), else memory."""
+    global _repository
+    path = path or os.getenv("OLA_DRIVER_DB")
+    _repository.close()
+    _repository = SQLiteDriverRepository(path) if path else MemoryDriverRepository()
+    logger.info(f"Driver repository: {_repository.name}{' (' + path + ')' if path else ''}")
+    return _repository
+
+
+if __name__ == "__main__":
+    # python driver_store.py drivers.sqlite --drivers drivers.csv --wallet wallet.jsonl ...
+    parser = argparse.ArgumentParser(description="Build a driver snapshot for SQLiteDriverRepository")
+    parser.add_argument("db_path")
+    for table_name in TABLE_COLUMNS:
+        parser.add_argument(f"--{table_name.replace('_', '-')}", dest=table_name, help=f"CSV/JSONL rows for {table_name}")
+    cli_args = parser.parse_args()
+    for table_name in TABLE_COLUMNS:
+        source = getattr(cli_args, table_name)
+        if source:
+            load_snapshot(cli_args.db_path, table_name, source)
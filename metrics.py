@@ -0,0 +1,254 @@
+import bisect
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds (ms) of the latency buckets; the last bucket is open-ended.
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+# Upper bounds of the size buckets for token counts.
+TOKEN_BUCKETS: Tuple[float, ...] = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram, cheap enough for hot paths.
+
+    Attributes:
+        buckets: Upper bounds of the buckets, in ``unit``.
+        unit: Unit of the observed values ("ms" unless it counts sizes).
+        counts: Observations per bucket (one extra slot for the overflow bucket).
+        count: Total number of observations.
+        total: Sum of all observed values.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS_MS, unit: str = "ms"):
+        self.buckets = buckets
+        self.unit = unit
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float):
+        index = bisect.bisect_left(self.buckets, value_ms)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value_ms
+            if value_ms > self.max:
+                self.max = value_ms
+
+    def percentile(self, q: float) -> float:
+        """Approximate the q-th percentile (0-100) by the bucket upper bound."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        unit = self.unit
+        return {
+            "count": self.count,
+            f"mean_{unit}": round(self.total / self.count, 3) if self.count else 0.0,
+            f"p50_{unit}": self.percentile(50),
+            f"p95_{unit}": self.percentile(95),
+            f"p99_{unit}": self.percentile(99),
+            f"max_{unit}": round(self.max, 3),
+        }
+
+    def cumulative(self) -> Tuple[List[int], int, float]:
+        """Cumulative bucket counts, total count and sum, read consistently."""
+        with self._lock:
+            counts, count, total = list(self.counts), self.count, self.total
+        running = 0
+        for index, n in enumerate(counts):
+            running += n
+            counts[index] = running
+        return counts, count, total
+
+
+_histograms: Dict[str, Histogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def histogram(name: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS_MS, unit: str = "ms") -> Histogram:
+    """Return the process-wide histogram called ``name``, creating it on first use.
+
+    ``buckets`` and ``unit`` only apply when the histogram is created.
+    """
+    h = _histograms.get(name)
+    if h is None:
+        with _histograms_lock:
+            h = _histograms.setdefault(name, Histogram(buckets, unit))
+    return h
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Observe the duration of the ``with`` block into histogram ``name``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram(name).observe((time.perf_counter() - start) * 1000)
+
+
+def snapshot(prefix: str = "") -> Dict[str, dict]:
+    """Snapshot of every histogram whose name starts with ``prefix``."""
+    return {name: h.snapshot() for name, h in sorted(_histograms.items()) if name.startswith(prefix)}
+
+
+_counters: Dict[str, int] = {}
+
+
+def increment(name: str, value: int = 1):
+    """Add ``value`` to the process-wide counter ``name``."""
+    with _histograms_lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def counters(prefix: str = "") -> Dict[str, int]:
+    return {name: n for name, n in sorted(_counters.items()) if name.startswith(prefix)}
+
+
+class SessionMetrics:
+    """Histograms, counters and gauges for one call.
+
+    Everything observed or counted here is also recorded into the
+    worker-wide ``<scope>.<name>`` histogram or counter, so per-session and
+    per-worker views come from the same observations. Gauges (the latest
+    value of something, like the context size) exist per session only.
+    """
+
+    def __init__(self, session_id: str, scope: str = "turn"):
+        self.session_id = session_id
+        self.scope = scope
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+
+    def observe(self, name: str, value_ms: float):
+        h = self.histograms.get(name)
+        if h is None:
+            h = self.histograms[name] = Histogram()
+        h.observe(value_ms)
+        histogram(f"{self.scope}.{name}").observe(value_ms)
+
+    def increment(self, name: str, value: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+        increment(f"{self.scope}.{name}", value)
+
+    def set(self, name: str, value: float):
+        self.gauges[name] = value
+
+    def snapshot(self) -> dict:
+        return {
+            **{name: h.snapshot() for name, h in sorted(self.histograms.items())},
+            **dict(sorted(self.counters.items())),
+            **dict(sorted(self.gauges.items())),
+        }
+
+
+_sessions: Dict[str, SessionMetrics] = {}
+
+
+def session_metrics(session_id: str) -> SessionMetrics:
+    """Return the metrics of a live session, creating them on first use."""
+    session = _sessions.get(session_id)
+    if session is None:
+        session = _sessions[session_id] = SessionMetrics(session_id)
+    return session
+
+
+def release_session_metrics(session_id: str) -> Optional[SessionMetrics]:
+    """Stop exporting a finished session; its observations stay in the worker totals."""
+    return _sessions.pop(session_id, None)
+
+
+def _family(name: str) -> Tuple[str, Optional[str]]:
+    """Split "tool.verify_driver_number" into a metric family and a ``name`` label."""
+    family, _, member = name.partition(".")
+    return re.sub(r"[^a-zA-Z0-9_]", "_", family), member or None
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _render_histogram(lines: List[str], metric: str, h: Histogram, labels: Dict[str, str]):
+    counts, count, total = h.cumulative()
+    for bound, n in zip(h.buckets, counts):
+        lines.append(f"{metric}_bucket{_labels({**labels, 'le': f'{bound:g}'})} {n}")
+    lines.append(f"{metric}_bucket{_labels({**labels, 'le': '+Inf'})} {count}")
+    lines.append(f"{metric}_sum{_labels(labels)} {total:.3f}")
+    lines.append(f"{metric}_count{_labels(labels)} {count}")
+
+
+def render_prometheus(
+    labels: Optional[Dict[str, str]] = None,
+    gauges: Optional[Dict[str, float]] = None,
+    namespace: str = "pipecat",
+) -> str:
+    """Render every histogram, counter and live session in Prometheus text format.
+
+    Worker histograms are exported as ``<namespace>_<family>_<unit>{name=...}``,
+    live sessions as ``<namespace>_session_<family>_ms{session=...}`` (gauges
+    as ``<namespace>_session_<family>{session=...}``); all series carry
+    ``labels`` (e.g. the worker id).
+
+    Args:
+        labels: Labels added to every series.
+        gauges: Extra point-in-time values, exported as ``<namespace>_<key>``.
+        namespace: Metric name prefix.
+    """
+    labels = labels or {}
+    families: Dict[Tuple[str, str], List[str]] = {}
+
+    def series(metric: str, kind: str) -> List[str]:
+        return families.setdefault((metric, kind), [])
+
+    for name, h in sorted(_histograms.items()):
+        family, member = _family(name)
+        metric = f"{namespace}_{family}_{h.unit}"
+        _render_histogram(series(metric, "histogram"), metric, h, {**labels, **({"name": member} if member else {})})
+
+    for name, n in sorted(_counters.items()):
+        family, member = _family(name)
+        metric = f"{namespace}_{family}_total"
+        series(metric, "counter").append(f"{metric}{_labels({**labels, **({'name': member} if member else {})})} {n}")
+
+    for session in list(_sessions.values()):
+        session_labels = {**labels, "session": session.session_id}
+        for name, h in sorted(session.histograms.items()):
+            metric = f"{namespace}_session_{session.scope}_ms"
+            _render_histogram(series(metric, "histogram"), metric, h, {**session_labels, "name": name})
+        for name, n in sorted(session.counters.items()):
+            metric = f"{namespace}_session_{session.scope}_total"
+            series(metric, "counter").append(f"{metric}{_labels({**session_labels, 'name': name})} {n}")
+        for name, value in sorted(session.gauges.items()):
+            metric = f"{namespace}_session_{session.scope}"
+            series(metric, "gauge").append(f"{metric}{_labels({**session_labels, 'name': name})} {float(value):g}")
+
+    for key, value in sorted((gauges or {}).items()):
+        if isinstance(value, (int, float)):
+            metric = f"{namespace}_{key}"
+            series(metric, "gauge").append(f"{metric}{_labels(labels)} {float(value):g}")
+
+    lines: List[str] = []
+    for (metric, kind), body in families.items():
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(body)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,138 @@
+import re
+from functools import lru_cache
+from typing import Dict, List
+
+# Zero code points of the decimal digit blocks callers' numbers arrive in
+# (STT output, typed digits from the UI, transliterated text).
+_DIGIT_ZEROS = (
+    0x0660,  # Arabic-Indic
+    0x06F0,  # Extended Arabic-Indic (Urdu)
+    0x0966,  # Devanagari
+    0x09E6,  # Bengali
+    0x0A66,  # Gurmukhi
+    0x0AE6,  # Gujarati
+    0x0BE6,  # Tamil
+    0x0C66,  # Telugu
+    0x0CE6,  # Kannada
+    0x0D66,  # Malayalam
+    0xFF10,  # Fullwidth
+)
+
+_ASCII_DIGITS = {chr(zero + d): str(d) for zero in _DIGIT_ZEROS for d in range(10)}
+_SEPARATORS = " -.()/,_\u00a0\u202f\u2010\u2011\u2012\u2013\u2014"
+
+# ASCII input (the common case) is stripped of separators with one
+# bytes.translate call; other scripts go through the str translation table,
+# which also maps every non-ASCII digit to ASCII.
+_ASCII_DELETE = b" -.()/,_+"
+_TRANSLATE = str.maketrans({**_ASCII_DIGITS, **{ch: None for ch in _SEPARATORS + "+"}})
+_TO_ASCII_DIGITS = str.maketrans(_ASCII_DIGITS)
+
+# Spoken digits in English, romanized Hindi and Devanagari.
+_SPOKEN_DIGITS: Dict[str, str] = {}
+for _digit, _words in {
+    "0": ("zero", "oh", "o", "shunya", "shoonya", "sunya", "shunye", "शून्य", "जीरो", "ज़ीरो"),
+    "1": ("one", "ek", "aek", "एक", "वन"),
+    "2": ("two", "do", "doh", "दो", "टू"),
+    "3": ("three", "teen", "tin", "तीन", "थ्री"),
+    "4": ("four", "char", "chaar", "चार", "फोर"),
+    "5": ("five", "paanch", "panch", "pach", "पांच", "पाँच", "फाइव"),
+    "6": ("six", "chhe", "chhah", "chah", "che", "chheh", "chhai", "छह", "छः", "छे", "छै", "सिक्स"),
+    "7": ("seven", "saat", "sat", "सात", "सेवन"),
+    "8": ("eight", "aath", "ath", "आठ", "एट"),
+    "9": ("nine", "nau", "nao", "nou", "नौ", "नाइन"),
+}.items():
+    for _word in _words:
+        _SPOKEN_DIGITS[_word] = _digit
+
+_REPEATS: Dict[str, int] = {
+    "double": 2, "dubble": 2, "डबल": 2,
+    "triple": 3, "tripple": 3, "ट्रिपल": 3,
+}
+
+# Digit runs, or runs of anything that is not a digit, space or separator
+# (Devanagari vowel signs are not \w, so \w+ would split "पांच").
+_TOKEN = re.compile(r"\d+|[^\s\d,.\-+()/]+")
+_NON_DIGITS = re.compile(r"[^0-9]")
+
+
+def parse_spoken_digits(text: str) -> str:
+    """Extract the digit sequence from a spoken/transcribed number.
+
+    Handles digit words in English, romanized Hindi and Devanagari
+    ("nau aath saat", "नौ आठ सात"), "double"/"triple" repeats ("double five"
+    -> "55", "triple 0" -> "000") and digits mixed with words.
+
+    Only runs of adjacent number tokens count: any other word ("mera",
+    "number", "hai") ends a run. A run made of a single digit word is
+    dropped, since "do", "ek" and "o" are also everyday filler ("check kar
+    do", "ek baar").
+    """
+    digits: List[str] = []
+    run: List[str] = []
+    tokens = words = 0
+    repeat = 1
+
+    def end_run():
+        nonlocal tokens, words, repeat
+        if run and (tokens > 1 or not words):
+            digits.extend(run)
+        run.clear()
+        tokens = words = 0
+        repeat = 1
+
+    for token in _TOKEN.findall(text.translate(_TO_ASCII_DIGITS).lower()):
+        if token.isdigit():
+            # A repeat applies to the first digit of a following group: "double 5"
+            run.append(token[0] * repeat + token[1:])
+            repeat = 1
+        elif token in _REPEATS:
+            repeat = _REPEATS[token]
+        elif token in _SPOKEN_DIGITS:
+            run.append(_SPOKEN_DIGITS[token] * repeat)
+            words += 1
+            repeat = 1
+        else:
+            end_run()
+            continue
+        tokens += 1
+    end_run()
+    return "".join(digits)
+
+
+def extract_digits(raw: str) -> str:
+    """Digits of ``raw``: translation-table fast path, spoken-number parser otherwise.
+
+    When the text already holds a full number in digits ("mera number
+    9876543210 hai, ek baar check karo") the words around it are ignored.
+    """
+    if raw.isascii():
+        compact = raw.encode("ascii").translate(None, _ASCII_DELETE)
+        if compact.isdigit():
+            return compact.decode("ascii")
+    else:
+        compact = raw.translate(_TRANSLATE)
+        if compact.isascii() and compact.isdigit():
+            return compact
+    written = _NON_DIGITS.sub("", raw.translate(_TO_ASCII_DIGITS))
+    if len(written) >= 10:
+        return written
+    return parse_spoken_digits(raw)
+
+
+@lru_cache(maxsize=4096)
+def normalize_msisdn(raw: str, default_cc: str = "+91") -> str:
+    """Normalize a phone number to E.164 (``+91XXXXXXXXXX`` for Indian numbers).
+
+    Accepts formatted numbers, non-ASCII digits and spoken forms. Results are
+    memoized, since the same number is passed to several tools in one call.
+    """
+    digits = extract_digits(raw)
+    if digits.startswith("91") and len(digits) == 12:
+        return f"+{digits}"
+    if digits.startswith("0") and len(digits) == 11:
+        # Domestic trunk prefix: 0 98765 43210
+        digits = digits[1:]
+    if len(digits) == 10:
+        return f"{default_cc}{digits}"
+    return f"+{digits}"
@@ -6,74 +6,126 @@ from dotenv import load_dotenv
 from loguru import logger
 import os
 from datetime import date 
+from typing import Optional
 import argparse
 import asyncio
 from pipecat.adapters.schemas.tools_schema import ToolsSchema
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_response import LLMUserAggregatorParams
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
 from pipecat.services.groq.stt import GroqSTTService
 from pipecat.services.openai.llm import OpenAILLMService
 from pipecat.services.openai.tts import OpenAITTSService
 from pipecat.pipeline.runner import PipelineRunner
-from pipecat.frames.frames import TTSSpeakFrame, CancelFrame
+from pipecat.frames.frames import TTSSpeakFrame, CancelFrame, EndFrame
 from pipecat.processors.transcript_processor import TranscriptProcessor
-from pipecat.transports.base_transport import TransportParams
+from pipecat.services.llm_service import LLMService
+from pipecat.services.stt_service import STTService
+from pipecat.services.tts_service import TTSService
+from pipecat.transports.base_transport import BaseTransport, TransportParams
 from pipecat.transports.network.small_webrtc import SmallWebRTCTransport
 from pipecat.transports.network.webrtc_connection import SmallWebRTCConnection
-from pipecat.audio.filters.noisereduce_filter import NoisereduceFilter
 from pipecat.services.openai.stt import OpenAISTTService
-from pipecat.services.openai_realtime_beta import (
-    InputAudioNoiseReduction,
-    InputAudioTranscription,
-    OpenAIRealtimeBetaLLMService,
-    SemanticTurnDetection,
-    SessionProperties,
+from audio_frontend import AUDIO_FILTERS
+from audio_pool import audio_pool, configure_audio_pool
+from context_budget import ContextBudget, ContextBudgetProcessor
+from demand_index import configure_demand_index, get_demand_store
+from driver_store import configure_repository, get_repository, set_repository
+from phrase_cache import (
+    GOODBYE,
+    SAMPLE_RATE as PHRASE_SAMPLE_RATE,
+    CachedOpenAITTSService,
+    configure_phrase_cache,
+    get_phrase_cache,
+    openai_synthesizer,
+    scripted_phrases,
 )
-from tool_calling import register_ola_tools
-from transcript import TranscriptHandler
+from session_config import (
+    IntentToolScope,
+    PrecompiledRealtimeLLMService,
+    SessionConfig,
+    configure_session_config,
+    get_session_configs,
+)
+from session_lifecycle import SessionActivityObserver
+from tool_cache import CachedDriverRepository
+import metrics
+import session_lifecycle
+import tool_guard
+from tool_calling import (
+    PREFETCH_TOOLS,
+    configure_prefetch,
+    get_tool_session,
+    prefetch_stats,
+    register_ola_tools,
+    release_tool_session,
+)
+from transcript import TRANSCRIPT_FORMATS, TranscriptHandler, TranscriptMetricsObserver
+from turn_metrics import TurnLatencyObserver
 load_dotenv(override=True)
 
+PIPELINE_MODES = ("realtime", "cascaded")
 
-def load_instrcutions(path:str):
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
-
-instruction_path = os.path.join(os.path.dirname(__file__), "prompt.txt")
-instruction_text = load_instrcutions(instruction_path)
-
+# Voice of the cascaded pipeline's TTS and of the cached phrases
+TTS_VOICE = "coral"
+TTS_MODEL = "gpt-4o-mini-tts"
 
 
-async def run_bot(webrtc_connection: SmallWebRTCConnection, _: argparse.Namespace):
+async def run_bot(webrtc_connection: SmallWebRTCConnection, args: argparse.Namespace):
     logger.info(f"Starting bot")
-    CALL_TIMEOUT_SECS = 240  # 4 minutes
-    transport = SmallWebRTCTransport(
-        webrtc_connection=webrtc_connection,
-        params=TransportParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            audio_in_filter = NoisereduceFilter(),
-            vad_analyzer=SileroVADAnalyzer(params=VADParams(
-                        start_secs=0.20,   # react ~100 ms after speech onset
-                        confidence=0.5,
-                        stop_secs=0.4,
-                        min_volume=0.6,
-                    )),
-        ),
-    )
-    
-
-
-    session_properties = SessionProperties(
-        input_audio_transcription=InputAudioTranscription(),
-
-        turn_detection=SemanticTurnDetection(),
-        input_audio_noise_reduction=InputAudioNoiseReduction(type="near_field"),
-        instructions=f"{instruction_text}"
-    )
+    # Warm VAD model + noise filter from the process-wide pool (see warmup()).
+    audio_lease = audio_pool.acquire()
+    try:
+        transport = SmallWebRTCTransport(
+            webrtc_connection=webrtc_connection,
+            params=TransportParams(
+                audio_in_enabled=True,
+                audio_out_enabled=True,
+                audio_in_filter=audio_lease.audio_in_filter,
+                vad_analyzer=audio_lease.vad_analyzer,
+            ),
+        )
+        await run_pipeline(transport, webrtc_connection.pc_id, args)
+    finally:
+        audio_pool.release(audio_lease)
+
+
+async def run_pipeline(
+    transport: BaseTransport,
+    pc_id: str,
+    args: argparse.Namespace,
+    llm: Optional[LLMService] = None,
+    session_config: Optional[SessionConfig] = None,
+    stt: Optional[STTService] = None,
+    tts: Optional[TTSService] = None,
+):
+    """Run one call over ``transport`` until the pipeline ends.
+
+    With ``args.pipeline_mode == "realtime"`` (the default) the OpenAI
+    realtime service hears the caller and speaks the reply. ``"cascaded"``
+    runs STT -> text LLM -> TTS instead, with the same prompt, tools and
+    transcripts; TTS starts on the first complete sentence of the reply.
+
+    Args:
+        transport: Transport of the call (SmallWebRTC in production).
+        pc_id: Id of the peer connection; scopes tool sessions and metrics.
+        args: Runner arguments.
+        llm: Replaces the OpenAI realtime (or, cascaded, text) LLM service,
+            e.g. with the load-test stub.
+        session_config: Replaces the current prompt/tools version, e.g. with a
+            benchmark variant.
+        stt: Replaces the OpenAI STT service of the cascaded mode.
+        tts: Replaces the OpenAI TTS service of the cascaded mode.
+    """
+    CALL_TIMEOUT_SECS = getattr(args, "call_timeout", 240)  # 4 minutes
+    cascaded = getattr(args, "pipeline_mode", "realtime") == "cascaded"
+
+    # Prompt, first-turn message and tool schemas, prebuilt per version;
+    # a call keeps the version it started with across prompt reloads.
+    session_config = session_config or get_session_configs().current()
+    logger.info(f"Using session config v{session_config.version} ({session_config.digest})")
 
     # Update STT to be more language-agnostic initially
     # stt = GroqSTTService(
@@ -86,37 +138,61 @@ async def run_bot(webrtc_connection: SmallWebRTCConnection, _: argparse.Namespac
     
     api_key = os.getenv("OPENAI_API_KEY")
 
-    stt = OpenAISTTService(
-        api_key=api_key,
-        model="gpt-4o-transcribe",
-        prompt=(
-            "Detect and transcribe in the original language spoken. "
-            "Context: Ola driver support—common terms include rides, online, booking, pickup, drop, city/locality names. "
-            "If Hindi/Hinglish, use Devanagari; if English, use English script."
-        ),
-    )
+    if cascaded and stt is None:
+        stt = OpenAISTTService(
+            api_key=api_key,
+            model="gpt-4o-transcribe",
+            prompt=(
+                "Detect and transcribe in the original language spoken. "
+                "Context: Ola driver support—common terms include rides, online, booking, pickup, drop, city/locality names. "
+                "If Hindi/Hinglish, use Devanagari; if English, use English script."
+            ),
+        )
 
 
     # voice = "shimmer" if datetime.now().hour < 18 else "echo"
-    tts = OpenAITTSService(api_key=api_key, voice="coral", model = "gpt-4o-mini-tts")
-
-
-    # llm = OpenAILLMService(
-    #     model = "gpt-4.1",
-    #     api_key=api_key,
-    #     temperature = 0.7
-    # )
-
-
-    llm = OpenAIRealtimeBetaLLMService(
-        api_key=api_key,
-        session_properties=session_properties,
-        start_audio_paused=False,
-    )
+    if cascaded and tts is None:
+        # Text is synthesized one sentence at a time as the LLM streams it
+        # (sentence ends include the Devanagari danda), so the caller hears
+        # the first sentence while the rest of the reply is generated.
+        # Scripted sentences found in the phrase cache play without synthesis.
+        tts = CachedOpenAITTSService(
+            phrase_cache=get_phrase_cache(),
+            api_key=api_key,
+            voice=TTS_VOICE,
+            model=TTS_MODEL,
+            aggregate_sentences=True,
+        )
+
+
+    if llm is None and cascaded:
+        llm = OpenAILLMService(
+            model=getattr(args, "llm_model", "gpt-4.1-mini"),
+            api_key=api_key,
+            temperature=0.7,
+        )
+    elif llm is None:
+        llm = PrecompiledRealtimeLLMService(
+            api_key=api_key,
+            session_config=session_config,
+            start_audio_paused=False,
+        )
+    # Offer only the detected intent's tools once the caller has said what they need
+    tool_scope = None
+    if getattr(args, "tool_subset", False) and isinstance(llm, PrecompiledRealtimeLLMService):
+        tool_scope = IntentToolScope(llm)
     #Transcript handling to log the transcript file
     transcript = TranscriptProcessor()
-    session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    transcript_handler = TranscriptHandler(output_file=f"transcripts/session_ola_{session_id}_{date.today()}.txt")
+    session_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    transcript_format = getattr(args, "transcript_format", "text")
+    extension = "jsonl" if transcript_format == "jsonl" else "txt"
+    transcript_dir = getattr(args, "transcript_dir", "transcripts")
+    transcript_handler = TranscriptHandler(
+        output_file=os.path.join(transcript_dir, f"session_ola_{session_id}_{date.today()}.{extension}"),
+        format=transcript_format,
+        session_id=session_id,
+        buffered=True,
+    )
 
     messages = [
         {
@@ -125,26 +201,87 @@ async def run_bot(webrtc_connection: SmallWebRTCConnection, _: argparse.Namespac
             
         }
     ]
-    # Register Ola tools (one-liner)
-    tools = register_ola_tools(llm)
-
-
-    context = OpenAILLMContext(messages, tools)
-    context_aggregator = llm.create_context_aggregator(context)
+    if cascaded:
+        # The realtime service sends the instructions with session.update;
+        # a text LLM reads them from the context.
+        messages.insert(0, {"role": "system", "content": session_config.instructions})
+    # Register Ola tools, bound to this call's pc_id so concurrent calls
+    # never share a verified number.
+    register_ola_tools(llm, pc_id=pc_id)
+    get_tool_session(pc_id).add_tool_observer(transcript_handler.record_tool_call)
+
+
+    context = OpenAILLMContext(messages, session_config.tools)
+    if cascaded:
+        # Segmented STT delivers one final transcript per VAD segment, so
+        # there are no late transcripts worth waiting for before the LLM runs.
+        context_aggregator = llm.create_context_aggregator(
+            context, user_params=LLMUserAggregatorParams(aggregation_timeout=0.05)
+        )
+    else:
+        context_aggregator = llm.create_context_aggregator(context)
+    # Compacts old turns once the context outgrows its budget; the kickoff
+    # message is only needed for the greeting.
+    context_budget = ContextBudgetProcessor(
+        context,
+        ContextBudget(
+            max_tokens=getattr(args, "context_budget", 2000),
+            keep_turns=getattr(args, "context_keep_turns", 3),
+        ),
+        metrics.session_metrics(pc_id),
+        llm=llm,
+        stale=messages[-1:],
+    )
 
-    pipeline = Pipeline(
-        [
+    if cascaded:
+        processors = [
+            transport.input(),
+            stt,
+            transcript.user(),
+            context_aggregator.user(),
+            llm,
+            tts,
+            transport.output(),
+            transcript.assistant(),
+            context_aggregator.assistant(),
+            context_budget,
+        ]
+    else:
+        processors = [
             transport.input(),  
-            # stt,
-            # transcript.user(),
             context_aggregator.user(),
             llm,  
+            # The realtime service emits the caller's transcripts itself
             transcript.user(),
-            # tts,
             transport.output(),  
             transcript.assistant(),
             context_aggregator.assistant(),
+            context_budget,
         ]
+    pipeline = Pipeline(processors)
+
+    async def end_call(reason: str):
+        """Timeout of the call's lifecycle: say goodbye and stop the pipeline."""
+        cache = get_phrase_cache()
+        goodbye = cache.frames(GOODBYE) if cache is not None else None
+        if goodbye is not None:
+            # Cached audio goes straight to the output transport in either
+            # mode; EndFrame stops the pipeline once it has been played.
+            await task.queue_frames([*goodbye, EndFrame()])
+            audio_bytes = sum(len(getattr(frame, "audio", b"")) for frame in goodbye)
+            await asyncio.sleep(audio_bytes / (PHRASE_SAMPLE_RATE * 2) + 2.0)
+        else:
+            await task.queue_frame(TTSSpeakFrame(GOODBYE))
+            await task.queue_frame(CancelFrame())
+        await task.cancel()
+
+    # Owns the call's timers: a hard cap on its length and an idle timeout.
+    # Everything it runs is cancelled on disconnect or when the pipeline ends.
+    lifecycle = session_lifecycle.open_session(
+        pc_id,
+        end_call,
+        call_timeout=CALL_TIMEOUT_SECS,
+        idle_timeout=getattr(args, "idle_timeout", 0.0),
     )
 
     task = PipelineTask(
@@ -153,8 +290,14 @@ async def run_bot(webrtc_connection: SmallWebRTCConnection, _: argparse.Namespac
             allow_interruptions=True,
             enable_metrics=True,
             enable_usage_metrics=True,
-            report_only_initial_ttfb=True,
+            # Per-turn TTFB is recorded in the JSONL transcripts.
+            report_only_initial_ttfb=False,
         ),
+        observers=[
+            TranscriptMetricsObserver(transcript_handler),
+            TurnLatencyObserver(metrics.session_metrics(pc_id)),
+            SessionActivityObserver(lifecycle),
+        ],
     )
 
 
@@ -165,59 +308,220 @@ async def run_bot(webrtc_connection: SmallWebRTCConnection, _: argparse.Namespac
     # )
 
 
-    async def stop_session():
-        logger.info(f"Stopping session in room")
-
-        try:
-            # Queue a cancel frame to stop the pipeline
-            await asyncio.sleep(CALL_TIMEOUT_SECS)
-            logger.info("Auto-ending call after 2 minutes")
-            await task.queue_frame(TTSSpeakFrame("Thank you for your time. This call will now end."))
-            await task.queue_frame(CancelFrame())
-            # Cancel the task
-            await task.cancel()
-        except Exception as e:
-            logger.error(f"Error stopping session: {e}")
-
-
-
     @transport.event_handler("on_client_connected")
     async def on_client_connected(transport, client):
         logger.info(f"Client csageonnected")
 
 
-        first_turn = {
-            "role": "system",
-            "content": (
-                "### FIRST_TURN (Ola Driver Support)\n"
-                "- If caller complains about not getting rides, greet and ask: 'Kya yeh aapka registered number hai?'\n"
-                "- When the caller provides or confirms the number, CALL tool `verify_driver_number` "
-                "with the exact number they said. Wait for the tool result and proceed:\n"
-                "  * registered & not blocked -> 'Aapka number blocked nahi hai. Sab theek hai.' + suggestion\n"
-                "  * registered & blocked     -> inform blocked + offer human handover\n"
-                "  * not registered           -> ask for registered number (max 2 tries) then offer handover\n"
-                "- Keep replies short, in Hindi/Hinglish, one question at a time.\n"
-                "- Do NOT mention loans/EMI/IDs or internal tools.\n"
-            )
-        }
-
-
-        context.messages.append(first_turn)
+        context.messages.append(session_config.first_turn_message())
         await task.queue_frames([context_aggregator.user().get_context_frame()])
-        asyncio.create_task(stop_session())
+        lifecycle.start()
 
     @transport.event_handler("on_client_disconnected")
     async def on_client_disconnected(transport, client):
         logger.info(f"Client disconnected")
+        await session_lifecycle.close_session(pc_id)
+        await task.cancel()
 
     @transcript.event_handler("on_transcript_update")
     async def on_transcript_update(processor, frame):
         await transcript_handler.on_transcript_update(processor, frame)
+        if tool_scope is not None:
+            for message in frame.messages:
+                if message.role == "user":
+                    await tool_scope.on_user_text(message.content)
+
+    try:
+        await PipelineRunner(handle_sigint=False).run(task)
+    finally:
+        await session_lifecycle.close_session(pc_id)
+        release_tool_session(pc_id)
+        session_metrics = metrics.release_session_metrics(pc_id)
+        if session_metrics is not None:
+            logger.info(f"Turn metrics for {pc_id}: {session_metrics.snapshot()}")
+        await transcript_handler.close()
+
+
+def warmup(args: argparse.Namespace):
+    """Load shared models once at startup, before any call connects."""
+    configure_audio_pool(
+        getattr(args, "audio_pool_size", audio_pool.size),
+        audio_filter=getattr(args, "audio_filter", "noisereduce"),
+        noise_window_secs=getattr(args, "noise_window_ms", 64.0) / 1000,
+        vad_batch=getattr(args, "vad_batch", 0),
+        vad_batch_wait_secs=getattr(args, "vad_batch_wait_ms", 4.0) / 1000,
+    ).warm()
+    repository = configure_repository(getattr(args, "driver_db", None))
+    if getattr(args, "tool_cache", True):
+        set_repository(CachedDriverRepository(repository))
+    configure_demand_index(getattr(args, "demand_snapshot", None))
+    if getattr(args, "prefetch", False):
+        configure_prefetch(getattr(args, "prefetch_tools", ",".join(PREFETCH_TOOLS)).split(","))
+    else:
+        configure_prefetch(())
+    session_configs = configure_session_config(getattr(args, "prompt", None), getattr(args, "first_turn", None))
+    session_config = session_configs.current()
+    # Scripted phrases are synthesized once (kept on disk across restarts)
+    api_key = os.getenv("OPENAI_API_KEY")
+    configure_phrase_cache(
+        getattr(args, "phrase_cache_dir", None),
+        TTS_VOICE,
+        TTS_MODEL,
+        scripted_phrases(session_config.instructions, session_config.first_turn["content"]),
+        openai_synthesizer(TTS_VOICE, TTS_MODEL, api_key) if api_key else None,
+    )
 
-    await PipelineRunner(handle_sigint=False).run(task)
+
+def stats() -> dict:
+    repository = get_repository()
+    demand_store = get_demand_store()
+    return {
+        "audio_pool": audio_pool.stats(),
+        "tool_lookups": metrics.snapshot("lookup."),
+        "tool_cache": repository.stats() if isinstance(repository, CachedDriverRepository) else None,
+        "tool_latency": metrics.snapshot("tool."),
+        "tool_guard": tool_guard.stats(),
+        "prefetch": prefetch_stats(),
+        "turns": {**metrics.snapshot("turn."), **metrics.counters("turn.")},
+        "context": metrics.snapshot("context."),
+        "session_config": get_session_configs().stats(),
+        "tool_scope": metrics.counters("tool_scope."),
+        "phrase_cache": get_phrase_cache().stats() if get_phrase_cache() else None,
+        "lifecycle": {**session_lifecycle.stats(), **metrics.counters("session.")},
+        "demand_index": {**demand_store.stats(), **metrics.snapshot("demand.")} if demand_store else None,
+    }
 
 
 
 if __name__ == "__main__":
     from run import main
-    main()
+
+    parser = argparse.ArgumentParser(description="Ola Driver Support bot")
+    parser.add_argument(
+        "--transcript-format",
+        choices=TRANSCRIPT_FORMATS,
+        default="text",
+        help="Transcript output format (default: text)",
+    )
+    parser.add_argument(
+        "--audio-pool-size",
+        type=int,
+        default=4,
+        help="Warm VAD analyzers/noise filters preloaded at startup (default: 4)",
+    )
+    parser.add_argument(
+        "--audio-filter",
+        choices=AUDIO_FILTERS,
+        default="noisereduce",
+        help="Noise filter on caller audio: noisereduce (per frame, ~1.5 cores per call), "
+        "spectral-gate (windowed, vectorized, adds --noise-window-ms of latency) or off (default: noisereduce)",
+    )
+    parser.add_argument(
+        "--noise-window-ms",
+        type=float,
+        default=64.0,
+        help="Audio gated at a time by the spectral-gate filter; adds as much input latency (default: 64)",
+    )
+    parser.add_argument(
+        "--vad-batch",
+        type=int,
+        default=0,
+        help="Most calls classified in one batched Silero VAD inference, 0 to run each call alone "
+        "on the shared model (default: 0)",
+    )
+    parser.add_argument(
+        "--vad-batch-wait-ms",
+        type=float,
+        default=4.0,
+        help="Longest a VAD chunk waits for other calls' chunks to batch with (default: 4)",
+    )
+    parser.add_argument(
+        "--driver-db",
+        default=None,
+        help="Read-only SQLite driver snapshot (default: $OLA_DRIVER_DB, else in-memory mock data)",
+    )
+    parser.add_argument(
+        "--demand-snapshot",
+        default=None,
+        help="Demand-zone CSV (or write_columnar directory) for get_supply_demand_snapshot, "
+        "reloaded when it changes "
+        "(default: $OLA_DEMAND_SNAPSHOT, else mock hotspots)",
+    )
+    parser.add_argument(
+        "--prompt",
+        default=None,
+        help="Session instructions, reloaded for new calls when the file changes (default: prompt.txt)",
+    )
+    parser.add_argument(
+        "--first-turn",
+        default=None,
+        help="System message added when the caller connects, reloaded like --prompt (default: first_turn.txt)",
+    )
+    parser.add_argument(
+        "--pipeline-mode",
+        choices=PIPELINE_MODES,
+        default="realtime",
+        help="realtime: OpenAI realtime speech-to-speech; cascaded: STT -> text LLM -> "
+        "sentence-streamed TTS (default: realtime)",
+    )
+    parser.add_argument(
+        "--llm-model",
+        default="gpt-4.1-mini",
+        help="Text LLM of the cascaded pipeline (default: gpt-4.1-mini)",
+    )
+    parser.add_argument(
+        "--phrase-cache-dir",
+        default="phrase_cache",
+        help="Directory of pre-synthesized scripted phrases, built at startup; empty to disable "
+        "(default: phrase_cache)",
+    )
+    parser.add_argument(
+        "--call-timeout",
+        type=float,
+        default=240.0,
+        help="Hard cap on a call's length in seconds (default: 240)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=0.0,
+        help="End a call after this many seconds without anyone speaking, 0 to disable (default: 0)",
+    )
+    parser.add_argument(
+        "--context-budget",
+        type=int,
+        default=2000,
+        help="Tokens of conversation context kept per call before old turns are compacted (default: 2000)",
+    )
+    parser.add_argument(
+        "--context-keep-turns",
+        type=int,
+        default=3,
+        help="Most recent caller turns always kept verbatim in the context (default: 3)",
+    )
+    parser.add_argument(
+        "--tool-subset",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Narrow each call's tools to the intent detected in the caller's speech "
+        "(realtime mode, see prompt_budget.py; default: off)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Fetch the driver's account health, online status, wallet and incentives "
+        "concurrently as soon as their number is verified (default: off)",
+    )
+    parser.add_argument(
+        "--prefetch-tools",
+        default=",".join(PREFETCH_TOOLS),
+        help="Comma-separated lookups to prefetch with --prefetch (default: all four)",
+    )
+    parser.add_argument(
+        "--tool-cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Cache tool lookups with per-tool TTLs and request coalescing (default: on)",
+    )
+    main(parser)
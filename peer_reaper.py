@@ -0,0 +1,183 @@
+import asyncio
+import os
+import resource
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+from pipecat.transports.network.webrtc_connection import SmallWebRTCConnection
+
+from metrics import counters, increment
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak RSS (KiB on Linux) where /proc is unavailable
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@dataclass
+class PeerRecord:
+    """What the reaper knows about one peer connection.
+
+    Attributes:
+        connection: The peer connection.
+        opened_at: When the offer was accepted (monotonic seconds).
+        rss_at_open: Worker RSS growth across the handshake, the closest
+            per-connection attribution of aiortc state (ICE, DTLS, SRTP).
+        connected_at: When the connection first reported "connected".
+        silent_since: Since when the peer has stopped answering keepalives.
+        session_ended_at: When the bot session serving the peer ended.
+    """
+
+    connection: SmallWebRTCConnection
+    opened_at: float
+    rss_at_open: int = 0
+    connected_at: Optional[float] = None
+    silent_since: Optional[float] = None
+    session_ended_at: Optional[float] = None
+
+
+class PeerReaper:
+    """Closes peer connections that never connect or that nobody uses any more.
+
+    ``pcs_map`` only shrinks when a connection's "closed" event fires. A peer
+    that never completes ICE, or goes away without closing, would stay in
+    the map with all its aiortc state. Every ``interval`` seconds the reaper
+    closes and forgets peers that:
+
+    - have not connected ``handshake_timeout`` seconds after the offer;
+    - stopped answering keepalives ``idle_timeout`` seconds ago;
+    - have had no bot session for ``idle_timeout`` seconds (the call ended
+      but the client never hung up).
+
+    Attributes:
+        handshake_timeout: Seconds a new peer has to reach "connected".
+        idle_timeout: Seconds a silent or session-less peer is kept.
+        interval: Seconds between sweeps.
+    """
+
+    def __init__(self, handshake_timeout: float = 30.0, idle_timeout: float = 60.0, interval: float = 5.0):
+        self.handshake_timeout = handshake_timeout
+        self.idle_timeout = idle_timeout
+        self.interval = interval
+        self._peers: Dict[str, PeerRecord] = {}
+
+    def configure(self, handshake_timeout: float, idle_timeout: float, interval: float = 5.0):
+        self.handshake_timeout = handshake_timeout
+        self.idle_timeout = idle_timeout
+        self.interval = interval
+
+    def track(self, pc_id: str, connection: SmallWebRTCConnection, rss_at_open: int = 0):
+        """Start watching a newly accepted peer."""
+        self._peers[pc_id] = PeerRecord(connection, time.monotonic(), rss_at_open)
+
+    def forget(self, pc_id: str):
+        self._peers.pop(pc_id, None)
+
+    def session_ended(self, pc_id: str):
+        """The bot session serving ``pc_id`` finished; the peer is now idle."""
+        record = self._peers.get(pc_id)
+        if record is not None:
+            record.session_ended_at = time.monotonic()
+
+    def _verdict(self, record: PeerRecord, now: float) -> Optional[str]:
+        pc = record.connection.pc
+        state = pc.connectionState if pc is not None else "closed"
+        if state == "closed":
+            return "closed"
+        if record.connected_at is None:
+            if state == "connected":
+                record.connected_at = now
+            elif now - record.opened_at > self.handshake_timeout:
+                return "handshake"
+            return None
+        if record.connection.is_connected():
+            record.silent_since = None
+        elif record.silent_since is None:
+            record.silent_since = now
+        elif now - record.silent_since > self.idle_timeout:
+            return "silent"
+        if record.session_ended_at is not None and now - record.session_ended_at > self.idle_timeout:
+            return "no_session"
+        return None
+
+    async def sweep(
+        self,
+        pcs_map: Dict[str, SmallWebRTCConnection],
+        on_reaped: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> List[str]:
+        """Close and drop every stale peer of ``pcs_map``; returns their ids."""
+        now = time.monotonic()
+        # Peers added to the map without going through track() (e.g. before
+        # the reaper was configured) are watched from now on.
+        for pc_id, connection in pcs_map.items():
+            if pc_id not in self._peers:
+                self._peers[pc_id] = PeerRecord(connection, now)
+        reaped = []
+        for pc_id, record in list(self._peers.items()):
+            if pcs_map.get(pc_id) is not record.connection:
+                # Closed normally ("closed" event) or replaced
+                self._peers.pop(pc_id, None)
+                continue
+            reason = self._verdict(record, now)
+            if reason is None:
+                continue
+            increment(f"peer.reaped_{reason}")
+            logger.info(f"Reaping peer {pc_id}: {reason} after {now - record.opened_at:.0f}s")
+            self._peers.pop(pc_id, None)
+            pcs_map.pop(pc_id, None)
+            reaped.append(pc_id)
+            try:
+                await record.connection.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing peer {pc_id}: {e}")
+            if on_reaped is not None:
+                await on_reaped(pc_id)
+        return reaped
+
+    async def run(
+        self,
+        pcs_map: Dict[str, SmallWebRTCConnection],
+        on_reaped: Optional[Callable[[str], Awaitable[None]]] = None,
+    ):
+        """Sweep every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.sweep(pcs_map, on_reaped)
+            except Exception as e:
+                logger.error(f"Peer reaper sweep failed: {e}")
+
+    def report(self) -> dict:
+        """Age, state and memory attribution of every tracked peer."""
+        now = time.monotonic()
+        peers = []
+        for pc_id, record in self._peers.items():
+            pc = record.connection.pc
+            peers.append(
+                {
+                    "pc_id": pc_id,
+                    "age_s": round(now - record.opened_at, 1),
+                    "state": pc.connectionState if pc is not None else "closed",
+                    "ice_state": pc.iceConnectionState if pc is not None else "closed",
+                    "connected": record.connection.is_connected(),
+                    "silent_s": round(now - record.silent_since, 1) if record.silent_since else 0.0,
+                    "session_ended_s": (
+                        round(now - record.session_ended_at, 1) if record.session_ended_at else None
+                    ),
+                    "rss_at_open_bytes": record.rss_at_open,
+                }
+            )
+        return {
+            "rss_bytes": rss_bytes(),
+            "peers": peers,
+            "reaped": counters("peer.reaped_"),
+            "handshake_timeout": self.handshake_timeout,
+            "idle_timeout": self.idle_timeout,
+        }
@@ -0,0 +1,222 @@
+import hashlib
+import os
+import re
+import tempfile
+from typing import AsyncGenerator, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+from pipecat.frames.frames import Frame, TTSAudioRawFrame, TTSStartedFrame, TTSStoppedFrame
+from pipecat.services.openai.tts import OpenAITTSService
+from pipecat.utils.string import match_endofsentence
+
+from metrics import counters, increment
+
+# OpenAI TTS "pcm" output: 16-bit mono at 24 kHz
+SAMPLE_RATE = 24000
+CHUNK_SECS = 0.1
+
+GOODBYE = "Thank you for your time. This call will now end."
+
+# Lines the prompt scripts verbatim, in curly, double or single quotes (and maybe
+# bold): “**Kya yeh aapka registered number hai?**”, 'Kya yeh aapka registered number hai?'
+_QUOTED = re.compile(r"“([^”\n]{8,})”|\"([^\"\n]{8,})\"|'([^'\n]{8,})'")
+_EMPHASIS = re.compile(r"\*+")
+# Quoted code rather than speech: tool arguments like "account_block" or "<short reason>"
+_NOT_SPOKEN = re.compile(r"[_<>{}=]")
+_SPACE = re.compile(r"\s+")
+
+Synthesizer = Callable[[str], bytes]
+
+
+def normalize(text: str) -> str:
+    return _SPACE.sub(" ", text).strip().casefold()
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split ``text`` the way the TTS sentence aggregator does, so cached keys match what it sends."""
+    sentences = []
+    rest = text
+    while rest.strip():
+        end = 0
+        # The aggregator tests the text as it grows; the first prefix ending a sentence wins
+        for i in range(1, len(rest) + 1):
+            end = match_endofsentence(rest[:i])
+            if end:
+                break
+        if not end:
+            sentences.append(rest.strip())
+            break
+        sentences.append(rest[:end].strip())
+        rest = rest[end:]
+    return sentences
+
+
+def scripted_phrases(*texts: str) -> List[str]:
+    """The quoted utterances of the given prompt texts, plus the goodbye of a timed-out call."""
+    phrases = [GOODBYE]
+    for text in texts:
+        for match in _QUOTED.finditer(text):
+            phrase = _EMPHASIS.sub("", next(group for group in match.groups() if group is not None)).strip()
+            if " " in phrase and not _NOT_SPOKEN.search(phrase):
+                phrases.append(phrase)
+    return list(dict.fromkeys(phrases))
+
+
+def openai_synthesizer(voice: str, model: str, api_key: Optional[str] = None) -> Synthesizer:
+    """Blocking OpenAI TTS, used to fill the cache at startup."""
+    from openai import OpenAI
+
+    client = OpenAI(api_key=api_key)
+
+    def synthesize(text: str) -> bytes:
+        return client.audio.speech.create(model=model, voice=voice, input=text, response_format="pcm").content
+
+    return synthesize
+
+
+class PhraseCache:
+    """On-disk PCM of fixed phrases for one TTS voice and model.
+
+    Each sentence of a phrase is stored as ``<directory>/<model>/<voice>/<sha1>.pcm``
+    (the hash is of the normalized text), since the TTS service receives
+    replies one sentence at a time. ``prebuild`` synthesizes what is missing
+    and loads every phrase into memory, so a hit costs no synthesis and no I/O.
+
+    Metrics: ``phrase_cache.hit``, ``phrase_cache.miss`` and
+    ``phrase_cache.bytes_served`` counters.
+    """
+
+    def __init__(self, directory: str, voice: str, model: str):
+        self.voice = voice
+        self.model = model
+        self.directory = os.path.join(directory, model, voice)
+        self._audio: Dict[str, bytes] = {}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pcm")
+
+    def prebuild(self, phrases: Iterable[str], synthesize: Optional[Synthesizer] = None) -> int:
+        """Load the audio of every sentence of ``phrases``, synthesizing the missing ones.
+
+        Returns:
+            The number of sentences synthesized.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        synthesized = 0
+        for phrase in phrases:
+            for sentence in split_sentences(phrase):
+                key = normalize(sentence)
+                path = self._path(key)
+                if not os.path.exists(path):
+                    if synthesize is None:
+                        continue
+                    try:
+                        audio = synthesize(sentence)
+                    except Exception as e:
+                        logger.warning(f"Could not synthesize cached phrase {sentence!r}: {e}")
+                        continue
+                    # Written atomically: other workers may prebuild the same directory
+                    fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(audio)
+                    os.replace(tmp, path)
+                    synthesized += 1
+                with open(path, "rb") as f:
+                    self._audio[key] = f.read()
+        logger.info(
+            f"Phrase cache {self.model}/{self.voice}: {len(self._audio)} sentences, "
+            f"{self.bytes_cached} bytes ({synthesized} synthesized)"
+        )
+        return synthesized
+
+    @property
+    def bytes_cached(self) -> int:
+        return sum(len(audio) for audio in self._audio.values())
+
+    def lookup(self, text: str) -> Optional[bytes]:
+        """PCM of ``text`` if it is a cached sentence; counts a hit or a miss."""
+        audio = self._audio.get(normalize(text))
+        if audio is None:
+            increment("phrase_cache.miss")
+            return None
+        increment("phrase_cache.hit")
+        increment("phrase_cache.bytes_served", len(audio))
+        return audio
+
+    def frames(self, text: str) -> Optional[List[Frame]]:
+        """TTS frames playing ``text`` from the cache, or None unless every sentence is cached."""
+        chunks = [self._audio.get(normalize(sentence)) for sentence in split_sentences(text)]
+        if not chunks or any(chunk is None for chunk in chunks):
+            increment("phrase_cache.miss")
+            return None
+        audio = b"".join(chunks)
+        increment("phrase_cache.hit")
+        increment("phrase_cache.bytes_served", len(audio))
+        return [TTSStartedFrame(), *audio_frames(audio), TTSStoppedFrame()]
+
+    def stats(self) -> dict:
+        counts = counters("phrase_cache.")
+        hits = counts.get("phrase_cache.hit", 0)
+        misses = counts.get("phrase_cache.miss", 0)
+        return {
+            "voice": self.voice,
+            "model": self.model,
+            "sentences": len(self._audio),
+            "bytes_cached": self.bytes_cached,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+            "bytes_served": counts.get("phrase_cache.bytes_served", 0),
+        }
+
+
+def audio_frames(audio: bytes) -> List[TTSAudioRawFrame]:
+    chunk_bytes = int(SAMPLE_RATE * CHUNK_SECS) * 2
+    return [
+        TTSAudioRawFrame(audio[offset : offset + chunk_bytes], SAMPLE_RATE, 1)
+        for offset in range(0, len(audio), chunk_bytes)
+    ]
+
+
+class CachedOpenAITTSService(OpenAITTSService):
+    """OpenAITTSService that plays cached sentences instead of synthesizing them."""
+
+    def __init__(self, *, phrase_cache: Optional[PhraseCache] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._phrase_cache = phrase_cache
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        audio = self._phrase_cache.lookup(text) if self._phrase_cache is not None else None
+        if audio is None:
+            async for frame in super().run_tts(text):
+                yield frame
+            return
+        logger.debug(f"{self}: playing cached [{text}]")
+        yield TTSStartedFrame()
+        for frame in audio_frames(audio):
+            yield frame
+        yield TTSStoppedFrame()
+
+
+_cache: Optional[PhraseCache] = None
+
+
+def get_phrase_cache() -> Optional[PhraseCache]:
+    return _cache
+
+
+def configure_phrase_cache(
+    directory: Optional[str],
+    voice: str,
+    model: str,
+    phrases: Iterable[str] = (),
+    synthesize: Optional[Synthesizer] = None,
+) -> Optional[PhraseCache]:
+    """Build the phrase cache once at startup; None (no cache) without a directory."""
+    global _cache
+    if not directory:
+        _cache = None
+        return None
+    _cache = PhraseCache(directory, voice, model)
+    _cache.prebuild(phrases, synthesize)
+    return _cache
@@ -0,0 +1,202 @@
+import argparse
+import json
+import os
+import re
+import tempfile
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+
+from pipecat.adapters.services.open_ai_realtime_adapter import OpenAIRealtimeLLMAdapter
+
+from session_config import FIRST_TURN_PATH, PROMPT_PATH, SessionConfig, build_session_config
+
+try:
+    import tiktoken
+except ImportError:  # optional: fall back to an estimate
+    tiktoken = None
+
+# Tokenizer of the gpt-4o family, which the realtime models belong to.
+ENCODING = "o200k_base"
+
+_encoder = None
+
+
+def _get_encoder():
+    global _encoder
+    if _encoder is None and tiktoken is not None:
+        _encoder = tiktoken.get_encoding(ENCODING)
+    return _encoder
+
+
+def tokenizer_name() -> str:
+    return ENCODING if _get_encoder() is not None else "estimate"
+
+
+def count_tokens(text: str) -> int:
+    """Token count of ``text`` with tiktoken, or an estimate when it is not installed.
+
+    The estimate charges ASCII text at ~4 characters per token and every
+    other character (Devanagari, emoji, curly quotes) as a token of its own,
+    which is close for the Hinglish prompt and errs high for Devanagari.
+    """
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return -(-ascii_chars // 4) + (len(text) - ascii_chars)
+
+
+@dataclass
+class PromptBudget:
+    """Token size of each part of a realtime session setup.
+
+    Attributes:
+        instructions: Session instructions (prompt.txt).
+        first_turn: System message appended when the caller connects.
+        tools: Each tool schema, as serialized in ``session.update``.
+        session: The rest of ``session.update`` (audio, VAD and
+            transcription settings).
+        session_bytes: Size of the serialized ``session.update``.
+    """
+
+    instructions: int
+    first_turn: int
+    tools: Dict[str, int] = field(default_factory=dict)
+    session: int = 0
+    session_bytes: int = 0
+
+    @property
+    def tools_total(self) -> int:
+        return sum(self.tools.values())
+
+    @property
+    def total(self) -> int:
+        return self.instructions + self.first_turn + self.tools_total + self.session
+
+    def as_dict(self) -> dict:
+        return {
+            "tokenizer": tokenizer_name(),
+            "instructions": self.instructions,
+            "first_turn": self.first_turn,
+            "tools": dict(self.tools),
+            "tools_total": self.tools_total,
+            "session": self.session,
+            "total": self.total,
+            "session_bytes": self.session_bytes,
+        }
+
+
+def analyze(config: SessionConfig) -> PromptBudget:
+    """Measure the token size of each component of ``config``."""
+    provider_tools = OpenAIRealtimeLLMAdapter().to_provider_tools_format(config.tools)
+    tools = {tool["name"]: count_tokens(json.dumps(tool, ensure_ascii=False)) for tool in provider_tools}
+    instructions = count_tokens(config.instructions)
+    # Everything in session.update that is neither the instructions nor a tool
+    session = max(0, count_tokens(config.session_update) - instructions - sum(tools.values()))
+    return PromptBudget(
+        instructions=instructions,
+        first_turn=count_tokens(config.first_turn["content"]),
+        tools=tools,
+        session=session,
+        session_bytes=config.size_bytes,
+    )
+
+
+# Pictographs and dingbats, plus the emoji variation selector
+_EMOJI = re.compile("[\U0001F000-\U0001FAFF\u2600-\u27BF\uFE0F]")
+_HEADING = re.compile(r"#+\s*(.*)")
+_RULE = re.compile(r"(-{3,}|\*{3,}|_{3,})")
+# Sections that only repeat instructions given elsewhere in prompt.txt
+DROP_SECTIONS = ("Sample Flow",)
+
+
+def compact_prompt(text: str, drop_sections: Iterable[str] = DROP_SECTIONS) -> str:
+    """A token-lean variant of a markdown prompt with the same instructions.
+
+    Removes what the model does not need from a prompt written for people:
+    emoji, bold markers, horizontal rules, heading markup (headings become
+    ``Title:`` lines), trailing spaces, repeated blank lines and the
+    sections named in ``drop_sections``.
+    """
+    drop = tuple(title.lower() for title in drop_sections)
+    lines = []
+    skipping = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        heading = _HEADING.fullmatch(stripped)
+        if heading:
+            title = _EMOJI.sub("", heading.group(1)).replace("**", "").strip()
+            skipping = title.lower().startswith(drop)
+            if skipping:
+                continue
+            line = title if ":" in title else f"{title}:"
+        elif skipping or _RULE.fullmatch(stripped):
+            continue
+        line = _EMOJI.sub("", line).replace("**", "").rstrip()
+        if not line and (not lines or not lines[-1]):
+            continue
+        lines.append(unicodedata.normalize("NFC", line))
+    return "\n".join(lines).strip() + "\n"
+
+
+def build_variants(prompt_path: str = PROMPT_PATH, first_turn_path: str = FIRST_TURN_PATH) -> Dict[str, SessionConfig]:
+    """Session configs to compare: full and compacted prompt, each with every intent's tools.
+
+    Keys are ``full``, ``compact``, ``full+<intent>`` and ``compact+<intent>``.
+    """
+    full = build_session_config(0, prompt_path, first_turn_path)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", encoding="utf-8", delete=False) as f:
+        f.write(compact_prompt(full.instructions))
+    try:
+        compact = build_session_config(0, f.name, first_turn_path)
+    finally:
+        os.unlink(f.name)
+    variants = {}
+    for label, config in (("full", full), ("compact", compact)):
+        variants[label] = config
+        variants.update({f"{label}+{intent}": variant for intent, variant in config.variants.items()})
+    return variants
+
+
+def _print_budget(label: str, budget: PromptBudget):
+    print(f"{label}  ({budget.session_bytes} bytes, {tokenizer_name()} tokens)")
+    rows = [("instructions", budget.instructions), ("first_turn", budget.first_turn)]
+    rows += [(f"tool {name}", tokens) for name, tokens in budget.tools.items()]
+    rows += [("session settings", budget.session), ("total", budget.total)]
+    for name, tokens in rows:
+        share = tokens / budget.total * 100 if budget.total else 0.0
+        print(f"  {name:<38} {tokens:>6}  {share:>5.1f}%")
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Token budget of the realtime session setup")
+    parser.add_argument("--prompt", default=PROMPT_PATH, help="Session instructions (default: prompt.txt)")
+    parser.add_argument("--first-turn", default=FIRST_TURN_PATH, help="First-turn message (default: first_turn.txt)")
+    parser.add_argument("--write-compact", default=None, help="Write the compacted prompt to this path")
+    parser.add_argument("--json", action="store_true", help="Print the budgets as JSON")
+    opts = parser.parse_args(argv)
+
+    budgets = {label: analyze(config) for label, config in build_variants(opts.prompt, opts.first_turn).items()}
+    if opts.write_compact:
+        with open(opts.prompt, "r", encoding="utf-8") as f:
+            compact = compact_prompt(f.read())
+        with open(opts.write_compact, "w", encoding="utf-8") as f:
+            f.write(compact)
+
+    if opts.json:
+        print(json.dumps({label: budget.as_dict() for label, budget in budgets.items()}, indent=2))
+        return
+    _print_budget("full", budgets["full"])
+    print()
+    full = budgets["full"].total
+    print(f"{'variant':<28} {'tokens':>6}  {'bytes':>6}  {'saved':>6}")
+    for label, budget in budgets.items():
+        saved = (full - budget.total) / full * 100
+        print(f"{label:<28} {budget.total:>6}  {budget.session_bytes:>6}  {saved:>5.1f}%")
+    if opts.write_compact:
+        print(f"\nCompacted prompt written to {opts.write_compact}; serve it with --prompt {opts.write_compact}")
+
+
+if __name__ == "__main__":
+    main()
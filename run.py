@@ -7,31 +7,107 @@
 import argparse
 import asyncio
 import importlib.util
+import multiprocessing
 import os
+import shutil
+import socket
 import sys
-from contextlib import asynccontextmanager
+import tempfile
+from contextlib import asynccontextmanager, suppress
 from inspect import iscoroutinefunction, signature
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-import os
+import aiohttp
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse, Response
 from loguru import logger
 from pipecat_ai_small_webrtc_prebuilt.frontend import SmallWebRTCPrebuiltUI
 
 from pipecat.transports.network.webrtc_connection import IceServer, SmallWebRTCConnection
 
+import metrics
+import session_lifecycle
+from admission import AdmissionController
+from peer_reaper import PeerReaper, rss_bytes
+from session_registry import SessionRegistry
+
 # Load environment variables
 load_dotenv(override=True)
 
-app = FastAPI()
-
 # Store connections by pc_id
 pcs_map: Dict[str, SmallWebRTCConnection] = {}
 
+# Concurrent session cap (configured from the command line in main())
+admission = AdmissionController()
+
+# Closes peers that never connect or outlive their call (configured in main())
+reaper = PeerReaper()
+
+# Set on shutdown: new offers are refused while live calls finish
+draining = False
+
+# Running bot calls. They run outside the request cycle (not as BackgroundTasks,
+# which uvicorn waits for without a limit before the lifespan shutdown), so
+# drain() can bound and end them.
+bot_tasks: Set[asyncio.Task] = set()
+
+
+class DrainingServer(uvicorn.Server):
+    """uvicorn server that starts refusing offers as soon as shutdown is signalled."""
+
+    def handle_exit(self, sig, frame):
+        global draining
+        draining = True
+        super().handle_exit(sig, frame)
+
+# Multi-worker mode (--workers > 1): this worker's id, its private address for
+# forwarded requests, and the registry mapping pc_id -> owning worker.
+worker_id: Optional[str] = None
+worker_address: Optional[str] = None
+session_registry: Optional[SessionRegistry] = None
+
+
+async def release_peer(pc_id: str):
+    """Drop a reaped peer from the multi-worker registry."""
+    if session_registry is not None:
+        session_registry.release(pc_id)
+
+
+async def drain(timeout: float):
+    """Refuse new offers, give live calls ``timeout`` seconds to end, then close every peer."""
+    global draining
+    draining = True
+    if bot_tasks:
+        logger.info(f"Draining: waiting up to {timeout:g}s for {len(bot_tasks)} live calls")
+        _, pending = await asyncio.wait(set(bot_tasks), timeout=timeout)
+        if pending:
+            logger.warning(f"Drain timeout, closing {len(pending)} live calls")
+    connections = list(pcs_map.values())
+    pcs_map.clear()
+    await asyncio.gather(*(pc.disconnect() for pc in connections), return_exceptions=True)
+    # Disconnected calls end on their own; cancel any that do not
+    for task in list(bot_tasks):
+        task.cancel()
+    await asyncio.gather(*bot_tasks, return_exceptions=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    reaper_task = asyncio.create_task(reaper.run(pcs_map, release_peer))
+    try:
+        yield  # Run app
+    finally:
+        reaper_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await reaper_task
+        await drain(getattr(args, "drain_timeout", 0.0))
+
+
+app = FastAPI(lifespan=lifespan)
+
 ice_servers = [
     IceServer(
         urls="stun:stun.l.google.com:19302",
@@ -132,8 +208,85 @@ async def root_redirect():
     return RedirectResponse(url="/client/")
 
 
+@app.get("/api/stats")
+async def bot_stats():
+    """Runtime stats reported by the bot module (pools, caches, ...)."""
+    if bot_module is not None and hasattr(bot_module, "stats"):
+        return bot_module.stats()
+    return {}
+
+
+@app.get("/api/capacity")
+async def capacity():
+    """Live occupancy; answers 503 when this worker would refuse new calls."""
+    occupancy = admission.occupancy()
+    occupancy["draining"] = draining
+    occupancy["accepting"] = occupancy["accepting"] and not draining
+    return JSONResponse(occupancy, status_code=200 if occupancy["accepting"] else 503)
+
+
+@app.get("/api/peers")
+async def peers():
+    """Age, connection state and memory attribution of every peer connection."""
+    return reaper.report()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Latency histograms and counters of this worker and its live sessions."""
+    occupancy = admission.occupancy()
+    gauges = {
+        "sessions_active": occupancy["active"],
+        "sessions_waiting": occupancy["waiting"],
+        "peer_connections": len(pcs_map),
+        "rss_bytes": rss_bytes(),
+        "draining": int(draining),
+        **{f"lifecycle_{key}": value for key, value in session_lifecycle.stats().items()},
+    }
+    return metrics.render_prometheus(labels={"worker": worker_id or "main"}, gauges=gauges)
+
+
+async def run_admitted_bot(webrtc_connection: SmallWebRTCConnection):
+    """Run the bot for an admitted connection and free its slot afterwards."""
+    assert run_bot_func is not None
+    try:
+        await run_bot_func(webrtc_connection, args)
+    finally:
+        admission.release()
+        reaper.session_ended(public_pc_id(webrtc_connection.pc_id))
+
+
+def public_pc_id(pc_id: str) -> str:
+    """Qualify a local pc_id with the worker id so it is unique across workers."""
+    return f"{worker_id}.{pc_id}" if worker_id else pc_id
+
+
+async def forward_offer(owner: str, request: dict) -> Optional[Union[dict, Response]]:
+    """Send a renegotiation to the worker owning the peer; None if unreachable.
+
+    Returns the owner's answer, or its error response (e.g. a 503 while it
+    drains) passed through with the same status code.
+    """
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{owner}/api/offer", json=request) as response:
+                if response.status >= 300:
+                    logger.warning(f"Owner {owner} refused pc_id {request.get('pc_id')}: HTTP {response.status}")
+                    retry_after = response.headers.get("Retry-After")
+                    return Response(
+                        content=await response.read(),
+                        status_code=response.status,
+                        media_type=response.content_type,
+                        headers={"Retry-After": retry_after} if retry_after else None,
+                    )
+                return await response.json()
+    except aiohttp.ClientError as e:
+        logger.warning(f"Owner {owner} unreachable for pc_id {request.get('pc_id')}: {e}")
+        return None
+
+
 @app.post("/api/offer")
-async def offer(request: dict, background_tasks: BackgroundTasks):
+async def offer(request: dict):
     global run_bot_func, is_webrtc_bot
 
     if not run_bot_func:
@@ -146,6 +299,15 @@ async def offer(request: dict, background_tasks: BackgroundTasks):
 
     pc_id = request.get("pc_id")
 
+    # Renegotiation for a peer owned by another worker: route it there.
+    if pc_id and pc_id not in pcs_map and session_registry is not None:
+        owner = session_registry.owner_of(pc_id)
+        if owner and owner != worker_address:
+            answer = await forward_offer(owner, request)
+            if answer is not None:
+                return answer
+            session_registry.release(pc_id)
+
     if pc_id and pc_id in pcs_map:
         pipecat_connection = pcs_map[pc_id]
         logger.info(f"Reusing existing connection for pc_id: {pc_id}")
@@ -153,33 +315,50 @@ async def offer(request: dict, background_tasks: BackgroundTasks):
             sdp=request["sdp"], type=request["type"], restart_pc=request.get("restart_pc", False)
         )
     else:
+        if draining:
+            return JSONResponse({"error": "draining"}, status_code=503, headers={"Retry-After": "1"})
+        if not await admission.acquire():
+            logger.warning(f"Refusing offer, worker at capacity: {admission.occupancy()}")
+            return JSONResponse(
+                {"error": "busy"},
+                status_code=503,
+                headers={"Retry-After": str(max(1, int(admission.wait_timeout)))},
+            )
+
+        rss_before = rss_bytes()
         pipecat_connection = SmallWebRTCConnection(ice_servers)
-        await pipecat_connection.initialize(sdp=request["sdp"], type=request["type"])
+        try:
+            await pipecat_connection.initialize(sdp=request["sdp"], type=request["type"])
+        except Exception:
+            admission.release()
+            raise
+        reaper.track(
+            public_pc_id(pipecat_connection.pc_id), pipecat_connection, max(0, rss_bytes() - rss_before)
+        )
 
         @pipecat_connection.event_handler("closed")
         async def handle_disconnected(webrtc_connection: SmallWebRTCConnection):
             logger.info(f"Discarding peer connection for pc_id: {webrtc_connection.pc_id}")
-            pcs_map.pop(webrtc_connection.pc_id, None)
+            public_id = public_pc_id(webrtc_connection.pc_id)
+            pcs_map.pop(public_id, None)
+            reaper.forget(public_id)
+            if session_registry is not None:
+                session_registry.release(public_id)
 
-        # We've already checked that run_bot_func exists
-        assert run_bot_func is not None
-        background_tasks.add_task(run_bot_func, pipecat_connection, args)
+        task = asyncio.create_task(run_admitted_bot(pipecat_connection))
+        bot_tasks.add(task)
+        task.add_done_callback(bot_tasks.discard)
 
     answer = pipecat_connection.get_answer()
+    answer["pc_id"] = public_pc_id(answer["pc_id"])
     # Updating the peer connection inside the map
     pcs_map[answer["pc_id"]] = pipecat_connection
+    if session_registry is not None:
+        session_registry.claim(answer["pc_id"], worker_address)
 
     return answer
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    yield  # Run app
-    coros = [pc.close() for pc in pcs_map.values()]
-    await asyncio.gather(*coros)
-    pcs_map.clear()
-
-
 async def run_standalone_bot() -> None:
     """Run a standalone bot that doesn't require WebRTC"""
     global run_bot_func
@@ -189,6 +368,98 @@ async def run_standalone_bot() -> None:
         raise RuntimeError("No bot function available to run")
 
 
+def configure_logging(verbose: int):
+    logger.remove()
+    if verbose:
+        logger.add(sys.stderr, level="TRACE")
+    else:
+        logger.add(sys.stderr, level="DEBUG")
+
+
+def load_bot(bot_file: str):
+    """Import the bot file and let it preload shared models."""
+    global run_bot_func, bot_module, is_webrtc_bot
+    bot_module, run_bot_func, is_webrtc_bot = import_bot_file(bot_file)
+    logger.info(f"Successfully loaded bot from {bot_file}")
+
+    # Let the bot preload shared models before serving any call
+    if hasattr(bot_module, "warmup"):
+        bot_module.warmup(args)
+
+
+def reuseport_socket(host: str, port: int) -> socket.socket:
+    """Bind a listening socket that several worker processes can share."""
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+def serve_worker(bot_file: str, worker_args: argparse.Namespace, index: int, registry_dir: str):
+    """Entry point of one worker process in multi-worker mode.
+
+    Every worker binds the public port with SO_REUSEPORT, so the kernel spreads
+    new connections across workers, plus a private loopback port that other
+    workers use to forward renegotiations for peers this worker owns.
+    """
+    global args, worker_id, worker_address, session_registry
+    args = worker_args
+    configure_logging(args.verbose)
+    admission.configure(args.max_sessions, args.admission_queue, args.admission_timeout)
+    reaper.configure(args.peer_handshake_timeout, args.peer_idle_timeout, args.reaper_interval)
+
+    public = reuseport_socket(args.host, args.port)
+    private = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    private.bind(("127.0.0.1", 0))
+
+    worker_id = f"w{index}"
+    worker_address = f"http://127.0.0.1:{private.getsockname()[1]}"
+    session_registry = SessionRegistry(registry_dir)
+    logger.info(f"Worker {worker_id} (pid {os.getpid()}) serving on {args.host}:{args.port}, private {worker_address}")
+
+    load_bot(bot_file)
+    server = DrainingServer(uvicorn.Config(app))
+    try:
+        server.run(sockets=[public, private])
+    finally:
+        session_registry.purge_owner(worker_address)
+
+
+def run_workers(bot_file: str, worker_args: argparse.Namespace):
+    """Start ``--workers`` processes sharing one port and a session registry."""
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("--workers > 1 needs SO_REUSEPORT support")
+
+    owns_registry = worker_args.registry_dir is None
+    registry_dir = worker_args.registry_dir or tempfile.mkdtemp(prefix="pipecat-sessions-")
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(
+            target=serve_worker,
+            args=(os.path.abspath(bot_file), worker_args, index, registry_dir),
+            name=f"bot-worker-{index}",
+        )
+        for index in range(worker_args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    logger.info(f"Started {len(workers)} workers, session registry at {registry_dir}")
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        logger.info("Stopping workers...")
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.join()
+    finally:
+        if owns_registry:
+            shutil.rmtree(registry_dir, ignore_errors=True)
+
+
 def main(parser: Optional[argparse.ArgumentParser] = None):
     global args
 
@@ -201,14 +472,66 @@ def main(parser: Optional[argparse.ArgumentParser] = None):
     parser.add_argument(
         "--port", type=int, default=6010, help="Port for HTTP server (default: 6078)"
     )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=0,
+        help="Maximum concurrent call sessions per worker, 0 for no limit (default: 0)",
+    )
+    parser.add_argument(
+        "--admission-queue",
+        type=int,
+        default=8,
+        help="Offers allowed to wait for a free session slot (default: 8)",
+    )
+    parser.add_argument(
+        "--admission-timeout",
+        type=float,
+        default=2.0,
+        help="Seconds an offer may wait for a free slot before a 503 (default: 2.0)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes sharing the port (default: 1)",
+    )
+    parser.add_argument(
+        "--registry-dir",
+        default=None,
+        help="Directory for the multi-worker session registry (default: a temp dir)",
+    )
+    parser.add_argument(
+        "--peer-handshake-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds a new peer connection has to connect before it is closed (default: 30)",
+    )
+    parser.add_argument(
+        "--peer-idle-timeout",
+        type=float,
+        default=60.0,
+        help="Seconds a silent peer, or one whose call ended, is kept open (default: 60)",
+    )
+    parser.add_argument(
+        "--reaper-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between stale peer sweeps (default: 5)",
+    )
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds live calls may keep running after shutdown is requested (default: 30)",
+    )
     parser.add_argument("--verbose", "-v", action="count", default=0)
     args = parser.parse_args()
 
-    logger.remove(0)
-    if args.verbose:
-        logger.add(sys.stderr, level="TRACE")
-    else:
-        logger.add(sys.stderr, level="DEBUG")
+    admission.configure(args.max_sessions, args.admission_queue, args.admission_timeout)
+    reaper.configure(args.peer_handshake_timeout, args.peer_idle_timeout, args.reaper_interval)
+
+    configure_logging(args.verbose)
 
     # Infer the bot file from the caller if not provided explicitly
     bot_file = args.bot_file
@@ -224,15 +547,18 @@ def main(parser: Optional[argparse.ArgumentParser] = None):
         print("Could not determine the bot file. Pass it explicitly to main().")
         sys.exit(1)
 
+    if args.workers > 1:
+        # Each worker imports the bot file itself; the supervisor only waits.
+        run_workers(bot_file, args)
+        return
+
     # Import the bot file
     try:
-        global run_bot_func, bot_module, is_webrtc_bot
-        bot_module, run_bot_func, is_webrtc_bot = import_bot_file(bot_file)
-        logger.info(f"Successfully loaded bot from {bot_file}")
+        load_bot(bot_file)
 
         if is_webrtc_bot:
             logger.info("Detected WebRTC-compatible bot, starting web server...")
-            uvicorn.run(app, host=args.host, port=args.port)
+            DrainingServer(uvicorn.Config(app, host=args.host, port=args.port)).run()
         else:
             logger.info("Detected standalone bot, running directly...")
             asyncio.run(run_standalone_bot())
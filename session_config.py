@@ -0,0 +1,365 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from loguru import logger
+from pipecat.adapters.schemas.tools_schema import ToolsSchema
+from pipecat.adapters.services.open_ai_realtime_adapter import OpenAIRealtimeLLMAdapter
+from pipecat.frames.frames import ErrorFrame
+from pipecat.services.openai_realtime_beta import (
+    InputAudioNoiseReduction,
+    InputAudioTranscription,
+    OpenAIRealtimeBetaLLMService,
+    SemanticTurnDetection,
+    SessionProperties,
+)
+from pipecat.services.openai_realtime_beta.events import (
+    ConversationItem,
+    ConversationItemCreateEvent,
+    ConversationItemDeleteEvent,
+    ItemContent,
+    SessionUpdateEvent,
+)
+
+from metrics import histogram, increment
+from tool_calling import INTENT_TOOLS, OLA_TOOLS, detect_intent, tools_for_intent
+
+PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompt.txt")
+FIRST_TURN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "first_turn.txt")
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """Everything a call needs from the prompt files, built once per version.
+
+    Attributes:
+        version: Increases by one on every reload.
+        digest: Short hash of the serialized session, to tell versions apart in logs.
+        instructions: Realtime session instructions (prompt.txt).
+        first_turn: System message appended when the caller connects.
+        tools: Tool schemas registered for every call.
+        session_properties: Realtime session settings. Shared by all calls on
+            this version; treat as read-only.
+        session_update: Serialized ``session.update`` event, sent as-is.
+        build_ms: Time it took to build this version.
+        intent: Caller intent whose tool subset this variant offers, or None
+            for the full tool set.
+        variants: Same version with the tool subset of each intent in
+            ``tool_calling.INTENT_TOOLS``, keyed by intent.
+    """
+
+    version: int
+    digest: str
+    instructions: str
+    first_turn: Mapping[str, str]
+    tools: ToolsSchema
+    session_properties: SessionProperties
+    session_update: str
+    build_ms: float
+    intent: Optional[str] = None
+    variants: Mapping[str, "SessionConfig"] = field(default_factory=dict)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.session_update.encode("utf-8"))
+
+    def first_turn_message(self) -> Dict[str, str]:
+        """A fresh copy of the first-turn message (the context owns and may edit it)."""
+        return dict(self.first_turn)
+
+    def for_intent(self, intent: Optional[str]) -> "SessionConfig":
+        """The variant offering only ``intent``'s tools; this config when there is none."""
+        return self.variants.get(intent, self)
+
+
+def _read(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _compile(
+    version: int,
+    instructions: str,
+    first_turn: Mapping[str, str],
+    tools: ToolsSchema,
+    intent: Optional[str] = None,
+) -> SessionConfig:
+    session_properties = SessionProperties(
+        input_audio_transcription=InputAudioTranscription(),
+        turn_detection=SemanticTurnDetection(),
+        input_audio_noise_reduction=InputAudioNoiseReduction(type="near_field"),
+        instructions=instructions,
+    )
+    provider_tools: List[Dict[str, Any]] = OpenAIRealtimeLLMAdapter().to_provider_tools_format(tools)
+    event = SessionUpdateEvent(session=session_properties.model_copy(update={"tools": provider_tools}))
+    payload = event.model_dump(exclude_none=True)
+    payload.pop("event_id", None)  # optional, and must not be shared by calls
+    session_update = json.dumps(payload, ensure_ascii=False)
+    digest = hashlib.sha1((session_update + first_turn["content"]).encode("utf-8")).hexdigest()[:8]
+    return SessionConfig(
+        version=version,
+        digest=digest,
+        instructions=instructions,
+        first_turn=first_turn,
+        tools=tools,
+        session_properties=session_properties,
+        session_update=session_update,
+        build_ms=0.0,
+        intent=intent,
+    )
+
+
+def build_session_config(
+    version: int,
+    prompt_path: str = PROMPT_PATH,
+    first_turn_path: str = FIRST_TURN_PATH,
+    tools: ToolsSchema = OLA_TOOLS,
+    intent_variants: bool = True,
+) -> SessionConfig:
+    """Read the prompt files and serialize the realtime session once.
+
+    With ``intent_variants`` the per-intent tool subsets are serialized too,
+    so narrowing a call's tools later costs no rebuild.
+    """
+    start = time.perf_counter()
+    instructions = _read(prompt_path)
+    first_turn = MappingProxyType({"role": "system", "content": _read(first_turn_path)})
+    config = _compile(version, instructions, first_turn, tools)
+    variants = {}
+    if intent_variants:
+        variants = {
+            intent: _compile(version, instructions, first_turn, tools_for_intent(intent), intent)
+            for intent in INTENT_TOOLS
+        }
+    build_ms = (time.perf_counter() - start) * 1000
+    histogram("session_config.build").observe(build_ms)
+    return replace(config, build_ms=build_ms, variants=MappingProxyType(variants))
+
+
+class SessionConfigStore:
+    """Holds the current SessionConfig and swaps in a new one when a file changes.
+
+    The prompt files' mtimes are checked at most every ``poll_interval``
+    seconds when a call starts. A changed version is built off-thread and
+    published with a single reference assignment, so only calls that start
+    afterwards see it; live calls keep the version they started with.
+    """
+
+    def __init__(
+        self,
+        prompt_path: str = PROMPT_PATH,
+        first_turn_path: str = FIRST_TURN_PATH,
+        poll_interval: float = 5.0,
+    ):
+        self.paths = (prompt_path, first_turn_path)
+        self.poll_interval = poll_interval
+        self.config: Optional[SessionConfig] = None
+        self.reloads = 0
+        self.failures = 0
+        self._mtimes = (0.0, 0.0)
+        self._last_poll = 0.0
+        self._reload_task: Optional[asyncio.Task] = None
+
+    @property
+    def version(self) -> int:
+        return self.config.version if self.config else 0
+
+    def _mtimes_now(self):
+        return tuple(os.path.getmtime(path) for path in self.paths)
+
+    def _build(self) -> SessionConfig:
+        return build_session_config(self.version + 1, *self.paths)
+
+    def _swap(self, config: SessionConfig, mtimes):
+        self.config, self._mtimes = config, mtimes
+        self.reloads += 1
+        logger.info(
+            f"Session config v{config.version} ({config.digest}): {config.size_bytes} bytes, "
+            f"built in {config.build_ms:.1f} ms"
+        )
+
+    def load(self):
+        """Build the first version synchronously (startup)."""
+        mtimes = self._mtimes_now()
+        self._swap(self._build(), mtimes)
+
+    async def reload(self, mtimes=None):
+        """Build the next version off-thread and swap it in."""
+        mtimes = mtimes or self._mtimes_now()
+        try:
+            config = await asyncio.to_thread(self._build)
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Session config reload failed, keeping v{self.version}: {e}")
+            return
+        self._swap(config, mtimes)
+
+    def poll(self):
+        """Schedule a background reload if a prompt file changed on disk."""
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval or (self._reload_task and not self._reload_task.done()):
+            return
+        self._last_poll = now
+        try:
+            mtimes = self._mtimes_now()
+        except OSError:
+            return
+        if mtimes != self._mtimes:
+            self._reload_task = asyncio.create_task(self.reload(mtimes))
+
+    def current(self) -> SessionConfig:
+        """The version to start a new call with."""
+        if self.config is None:
+            self.load()
+        self.poll()
+        return self.config
+
+    def stats(self) -> dict:
+        config = self.config
+        return {
+            "version": self.version,
+            "digest": config.digest if config else None,
+            "size_bytes": config.size_bytes if config else 0,
+            "build_ms": round(config.build_ms, 2) if config else None,
+            "reloads": self.reloads,
+            "failures": self.failures,
+        }
+
+
+class PrecompiledRealtimeLLMService(OpenAIRealtimeBetaLLMService):
+    """Realtime service that sends a SessionConfig's pre-serialized session.
+
+    The stock service rebuilds and serializes ``session.update`` (including
+    the tool schemas) on every connect. Here the payload built once per config
+    version is sent as-is. Settings replaced at runtime with an
+    LLMUpdateSettingsFrame fall back to the stock path.
+    """
+
+    def __init__(self, *, session_config: SessionConfig, **kwargs):
+        super().__init__(session_properties=session_config.session_properties, **kwargs)
+        self._session_config = session_config
+        # Server-side conversation items in order, as (item id, role or None)
+        self._items: List[Tuple[str, Optional[str]]] = []
+        self._facts_item_id: Optional[str] = None
+
+    @property
+    def session_config(self) -> SessionConfig:
+        return self._session_config
+
+    async def set_session_config(self, config: SessionConfig):
+        """Switch the live session to another prebuilt config, e.g. an intent's tool subset."""
+        self._session_config = config
+        self._session_properties = config.session_properties
+        if self._context:
+            self._context.set_tools(config.tools)
+        await self._update_settings()
+
+    async def _handle_evt_conversation_item_created(self, evt):
+        if evt.item.id != self._facts_item_id:
+            self._items.append((evt.item.id, evt.item.role))
+        await super()._handle_evt_conversation_item_created(evt)
+
+    async def compact_conversation(self, keep_turns: int, facts: Optional[str] = None) -> int:
+        """Delete server-side items older than the last ``keep_turns`` user turns.
+
+        The realtime API keeps the whole conversation and reads it for every
+        response. User, assistant and tool items before the ``keep_turns``-th
+        most recent user item are deleted, and ``facts`` (what they
+        established) replaces them as a system item at the start of the
+        conversation. System items (flow instructions) are kept, as in
+        ``context_budget.compact_messages``.
+
+        Returns:
+            The number of items deleted.
+        """
+        user_positions = [i for i, (_, role) in enumerate(self._items) if role == "user"]
+        if len(user_positions) <= keep_turns or not self._websocket:
+            return 0
+        cut = user_positions[-keep_turns]
+        old = self._items[:cut]
+        stale = [item for item in old if item[1] != "system"]
+        self._items = [item for item in old if item[1] == "system"] + self._items[cut:]
+        stale_ids = [item_id for item_id, _ in stale]
+        if self._facts_item_id:
+            stale_ids.append(self._facts_item_id)
+            self._facts_item_id = None
+        for item_id in stale_ids:
+            await self.send_client_event(ConversationItemDeleteEvent(item_id=item_id))
+        if facts:
+            item = ConversationItem(
+                type="message", role="system", content=[ItemContent(type="input_text", text=facts)]
+            )
+            # Not a user turn: keep the service from adding it to the context again
+            self._messages_added_manually[item.id] = True
+            self._facts_item_id = item.id
+            await self.send_client_event(ConversationItemCreateEvent(previous_item_id="root", item=item))
+        return len(stale)
+
+    async def _update_settings(self):
+        if self._session_properties is not self._session_config.session_properties:
+            await super()._update_settings()
+            return
+        try:
+            if self._websocket:
+                await self._websocket.send(self._session_config.session_update)
+        except Exception as e:
+            if self._disconnecting:
+                return
+            logger.error(f"Error sending session update: {e}")
+            await self.push_error(ErrorFrame(error=f"Error sending client event: {e}", fatal=True))
+
+
+class IntentToolScope:
+    """Narrows a call's tools to the caller's intent, detected from what they say.
+
+    The first user transcript with a recognizable intent switches the session
+    to that intent's prebuilt variant (``SessionConfig.for_intent``), so later
+    responses carry fewer tool schemas. A transcript with a different intent
+    restores the full tool set for the rest of the call.
+    """
+
+    def __init__(self, llm: PrecompiledRealtimeLLMService):
+        self._llm = llm
+        self._config = llm.session_config
+        self.intent: Optional[str] = None
+        self._widened = False
+
+    async def on_user_text(self, text: str):
+        if self._widened:
+            return
+        intent = detect_intent(text)
+        if intent is None or intent == self.intent:
+            return
+        if self.intent is None:
+            self.intent = intent
+            increment(f"tool_scope.{intent}")
+            await self._llm.set_session_config(self._config.for_intent(intent))
+        else:
+            self._widened = True
+            increment("tool_scope.widened")
+            await self._llm.set_session_config(self._config)
+
+
+_store: Optional[SessionConfigStore] = None
+
+
+def get_session_configs() -> SessionConfigStore:
+    global _store
+    if _store is None:
+        _store = SessionConfigStore()
+    return _store
+
+
+def configure_session_config(
+    prompt_path: Optional[str] = None, first_turn_path: Optional[str] = None
+) -> SessionConfigStore:
+    """Build the first session config at startup from ``prompt_path`` / ``first_turn_path``."""
+    global _store
+    _store = SessionConfigStore(prompt_path or PROMPT_PATH, first_turn_path or FIRST_TURN_PATH)
+    _store.load()
+    return _store
@@ -0,0 +1,168 @@
+import asyncio
+from typing import Awaitable, Callable, Coroutine, Dict, Optional, Set
+
+from loguru import logger
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+
+from metrics import increment
+
+TimeoutHandler = Callable[[str], Awaitable[None]]
+
+_SPEECH = (UserStartedSpeakingFrame, UserStoppedSpeakingFrame, BotStartedSpeakingFrame, BotStoppedSpeakingFrame)
+
+
+class CallSession:
+    """Owns every task of one call: its timers and anything spawned for it.
+
+    Two timers end the call through ``on_timeout(reason)``:
+
+    - ``hard_cap``: ``call_timeout`` seconds after ``start()``;
+    - ``idle``: ``idle_timeout`` seconds without anyone speaking (0 disables it).
+
+    ``close()`` cancels everything still running, so nothing outlives the
+    call and keeps its pipeline objects alive.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        on_timeout: TimeoutHandler,
+        call_timeout: float = 240.0,
+        idle_timeout: float = 0.0,
+    ):
+        self.session_id = session_id
+        self.call_timeout = call_timeout
+        self.idle_timeout = idle_timeout
+        self.timed_out: Optional[str] = None
+        self._on_timeout = on_timeout
+        self._tasks: Set[asyncio.Task] = set()
+        self._user_speaking = False
+        self._bot_speaking = False
+        self._last_activity = 0.0
+        self._started = False
+        self._closed = False
+
+    @property
+    def live_tasks(self) -> int:
+        return len(self._tasks)
+
+    def spawn(self, coro: Coroutine, name: Optional[str] = None) -> Optional[asyncio.Task]:
+        """Run ``coro`` as a task of this call; it is cancelled when the call closes."""
+        if self._closed:
+            coro.close()
+            return None
+        task = asyncio.create_task(coro, name=f"{self.session_id}:{name or 'task'}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def start(self):
+        """Start the timers (when the caller connects).
+
+        A client reconnecting on the same call connects again; its timers keep
+        running from the first connect instead of being started twice.
+        """
+        if self._started:
+            return
+        self._started = True
+        self._last_activity = asyncio.get_running_loop().time()
+        self.spawn(self._hard_cap(), "hard_cap")
+        if self.idle_timeout > 0:
+            self.spawn(self._idle_watchdog(), "idle")
+
+    def on_speech(self, frame):
+        """Track who is speaking; the idle timer only runs while nobody is."""
+        if isinstance(frame, (UserStartedSpeakingFrame, UserStoppedSpeakingFrame)):
+            self._user_speaking = isinstance(frame, UserStartedSpeakingFrame)
+        else:
+            self._bot_speaking = isinstance(frame, BotStartedSpeakingFrame)
+        self._last_activity = asyncio.get_running_loop().time()
+
+    async def _hard_cap(self):
+        await asyncio.sleep(self.call_timeout)
+        await self._expire("hard_cap")
+
+    async def _idle_watchdog(self):
+        # One task for the whole call: it sleeps until the current idle
+        # deadline and re-arms itself if there was activity meanwhile.
+        loop = asyncio.get_running_loop()
+        while True:
+            speaking = self._user_speaking or self._bot_speaking
+            deadline = self._last_activity + self.idle_timeout
+            now = loop.time()
+            if not speaking and now >= deadline:
+                break
+            await asyncio.sleep(self.idle_timeout if speaking else deadline - now)
+        await self._expire("idle")
+
+    async def _expire(self, reason: str):
+        if self.timed_out or self._closed:
+            return
+        self.timed_out = reason
+        increment(f"session.timeout_{reason}")
+        logger.info(f"Ending call {self.session_id}: {reason} timeout")
+        try:
+            await self._on_timeout(reason)
+        except Exception as e:
+            logger.error(f"Error ending call {self.session_id} after {reason} timeout: {e}")
+
+    async def close(self):
+        """Cancel every task of the call and wait for them to finish."""
+        self._closed = True
+        current = asyncio.current_task()
+        tasks = [task for task in self._tasks if task is not current]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class SessionActivityObserver(BaseObserver):
+    """Feeds user/bot speech boundaries to a CallSession's idle timer."""
+
+    def __init__(self, session: CallSession, **kwargs):
+        super().__init__(**kwargs)
+        self._session = session
+        self._last_frame_id: Optional[int] = None
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if not isinstance(frame, _SPEECH) or frame.id == self._last_frame_id:
+            return
+        self._last_frame_id = frame.id
+        self._session.on_speech(frame)
+
+
+_sessions: Dict[str, CallSession] = {}
+
+
+def open_session(
+    session_id: str,
+    on_timeout: TimeoutHandler,
+    call_timeout: float = 240.0,
+    idle_timeout: float = 0.0,
+) -> CallSession:
+    """Create the lifecycle of a call; close it with ``close_session(session_id)``."""
+    session = _sessions[session_id] = CallSession(session_id, on_timeout, call_timeout, idle_timeout)
+    return session
+
+
+async def close_session(session_id: str):
+    """Cancel a call's timers and tasks. Safe to call more than once."""
+    session = _sessions.pop(session_id, None)
+    if session is not None:
+        await session.close()
+
+
+def stats() -> dict:
+    sessions = list(_sessions.values())
+    return {
+        "live_sessions": len(sessions),
+        "live_tasks": sum(session.live_tasks for session in sessions),
+    }
@@ -0,0 +1,63 @@
+import os
+import re
+import tempfile
+from typing import Optional
+
+from loguru import logger
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.#-]")
+
+
+class SessionRegistry:
+    """Maps peer connection ids to the worker that owns them.
+
+    A local stand-in for a shared registry service: one small file per
+    pc_id in a directory all workers on the host can see, holding the owning
+    worker's private address. Writes go through a temp file and
+    ``os.replace`` so readers never see a partial entry.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, pc_id: str) -> str:
+        return os.path.join(self.directory, _UNSAFE_CHARS.sub("_", pc_id))
+
+    def claim(self, pc_id: str, owner: str):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".claim-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(owner)
+        os.replace(tmp_path, self._path(pc_id))
+
+    def owner_of(self, pc_id: str) -> Optional[str]:
+        try:
+            with open(self._path(pc_id), "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def release(self, pc_id: str):
+        try:
+            os.remove(self._path(pc_id))
+        except FileNotFoundError:
+            pass
+
+    def purge_owner(self, owner: str) -> int:
+        """Drop every entry owned by ``owner``, e.g. when a worker exits."""
+        purged = 0
+        for name in os.listdir(self.directory):
+            if name.startswith(".claim-"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    if f.read().strip() != owner:
+                        continue
+                os.remove(path)
+                purged += 1
+            except FileNotFoundError:
+                continue
+        if purged:
+            logger.info(f"Purged {purged} session registry entries owned by {owner}")
+        return purged
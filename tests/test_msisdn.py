@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from msisdn import normalize_msisdn, parse_spoken_digits  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "98765 43210 check kar do",
+        "mera number 9876543210 hai, ek baar check karo",
+        "phone number is 9876543210 - can you do it",
+        "+91 98765-43210",
+        "०९८७६५४३२१०",
+    ],
+)
+def test_digits_with_filler_words(raw):
+    assert normalize_msisdn(raw) == "+919876543210"
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "nau aath saat chhe paanch chaar teen do ek shunya",
+        "mera number nau aath saat chhe paanch chaar teen do ek shunya hai",
+        "नौ आठ सात छह पांच चार तीन दो एक शून्य",
+        "nine eight seven six five four three two one zero",
+        "98765 chaar teen do ek zero",
+    ],
+)
+def test_spoken_numbers(raw):
+    assert normalize_msisdn(raw) == "+919876543210"
+
+
+def test_repeats():
+    assert parse_spoken_digits("nine double five triple zero") == "955000"
+    assert parse_spoken_digits("double five") == "55"
+
+
+def test_lone_filler_digit_words_are_ignored():
+    assert parse_spoken_digits("nau aath saat hai, ek baar check kar do") == "987"
+    assert parse_spoken_digits("can you do it") == ""
@@ -0,0 +1,35 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from phrase_cache import GOODBYE, scripted_phrases  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def read(name: str) -> str:
+    with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_prompt_phrases():
+    phrases = scripted_phrases(read("prompt.txt"), read("first_turn.txt"))
+    assert phrases[0] == GOODBYE
+    # Curly-quoted and bold in prompt.txt
+    assert "Aapka number blocked nahi hai. Sab theek hai." in phrases
+    assert "Kripya apna location badal kar phir se rides check kijiye." in phrases
+    assert "Theek hai ji, dhanyawaad. Aapko aur kisi madad ki zarurat ho to batayiyega." in phrases
+    assert "Aapka RC document pending hai." in phrases
+    # Single-quoted in first_turn.txt
+    assert "Kya yeh aapka registered number hai?" in phrases
+    assert len(phrases) == len(set(phrases))
+
+
+def test_quoted_code_is_not_a_phrase():
+    text = 'CALL `create_support_ticket(category="account_block", summary="<short reason>")` or "docs_update"'
+    assert scripted_phrases(text) == [GOODBYE]
+
+
+def test_double_quotes():
+    assert scripted_phrases('Say: "Aapka ticket ban gaya hai."') == [GOODBYE, "Aapka ticket ban gaya hai."]
@@ -0,0 +1,34 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_config import PrecompiledRealtimeLLMService, build_session_config  # noqa: E402
+
+
+def test_compaction_keeps_system_items():
+    llm = PrecompiledRealtimeLLMService(session_config=build_session_config(1), api_key="test")
+    sent = []
+
+    async def send_client_event(event):
+        sent.append(event)
+
+    llm.send_client_event = send_client_event
+    llm._websocket = object()
+    llm._items = [
+        ("first_turn", "system"),
+        ("u1", "user"),
+        ("a1", "assistant"),
+        ("call1", None),
+        ("flow", "system"),
+        ("u2", "user"),
+        ("a2", "assistant"),
+        ("u3", "user"),
+    ]
+
+    deleted = asyncio.run(llm.compact_conversation(keep_turns=2))
+
+    assert deleted == 3
+    assert [event.item_id for event in sent] == ["u1", "a1", "call1"]
+    assert [item_id for item_id, _ in llm._items] == ["first_turn", "flow", "u2", "a2", "u3"]
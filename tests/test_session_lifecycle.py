@@ -0,0 +1,23 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_lifecycle import CallSession  # noqa: E402
+
+
+def test_start_is_idempotent():
+    async def on_timeout(reason):
+        pass
+
+    async def main():
+        session = CallSession("call-1", on_timeout, call_timeout=60, idle_timeout=30)
+        session.start()
+        # A reconnect fires on_client_connected again
+        session.start()
+        assert session.live_tasks == 2
+        await session.close()
+        assert session.live_tasks == 0
+
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipecat.services.llm_service import FunctionCallParams  # noqa: E402
+
+from tool_guard import ToolPolicy, breaker_for, guard_tool  # noqa: E402
+
+
+def call(tool, arguments=None):
+    results = []
+
+    async def result_callback(result, *, properties=None):
+        results.append(result)
+
+    params = FunctionCallParams(
+        function_name="test",
+        tool_call_id="call-1",
+        arguments=arguments or {},
+        llm=None,
+        context=None,
+        result_callback=result_callback,
+    )
+    return tool(params), results
+
+
+def half_open(name):
+    breaker = breaker_for(name)
+    breaker.failures = breaker.failure_threshold
+    breaker.opened_at = time.monotonic() - breaker.reset_after
+    return breaker
+
+
+def test_cancelled_half_open_trial_releases_the_breaker():
+    async def slow(params):
+        await asyncio.sleep(10)
+
+    async def fast(params):
+        await params.result_callback({"ok": True})
+
+    async def main():
+        breaker = half_open("test_cancelled_trial")
+        trial, _ = call(guard_tool("test_cancelled_trial", slow, ToolPolicy(deadline=5)))
+        task = asyncio.create_task(trial)
+        await asyncio.sleep(0.01)
+        assert breaker.trial_in_flight
+        # Barge-in: pipecat cancels the function call
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert not breaker.trial_in_flight
+
+        retry, results = call(guard_tool("test_cancelled_trial", fast))
+        await retry
+        assert results == [{"ok": True}]
+        assert breaker.state == "closed"
+
+    asyncio.run(main())
+
+
+def test_bad_arguments_do_not_open_the_breaker():
+    async def handler(params):
+        await params.result_callback({"city": params.arguments["city"]})
+
+    async def main():
+        breaker = breaker_for("test_bad_arguments")
+        tool = guard_tool("test_bad_arguments", handler)
+        for _ in range(breaker.failure_threshold + 1):
+            pending, results = call(tool)
+            await pending
+            assert results[0]["reason"] == "bad_arguments"
+        assert breaker.state == "closed"
+        assert breaker.failures == 0
+
+        breaker = half_open("test_bad_arguments")
+        pending, _ = call(tool)
+        await pending
+        assert not breaker.trial_in_flight
+
+    asyncio.run(main())
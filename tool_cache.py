@@ -0,0 +1,191 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from driver_store import DriverRepository
+from tool_guard import hedged_attempt
+
+# Per-tool freshness budgets, in seconds.
+DEFAULT_TTLS: Dict[str, float] = {
+    "verify_driver_number": 300.0,
+    "get_driver_account_health": 60.0,
+    "check_app_online_status": 30.0,
+    "fetch_wallet_and_payouts": 60.0,
+    "get_incentives_today": 600.0,
+}
+
+_ENTRY_OVERHEAD_BYTES = 200
+_MISSING = object()
+
+
+def _estimate_size(key: Hashable, value: Any) -> int:
+    return _ENTRY_OVERHEAD_BYTES + len(json.dumps([key, value], default=str))
+
+
+class AsyncTTLCache:
+    """LRU cache with per-entry TTL, a memory cap and in-flight coalescing.
+
+    Concurrent ``get_or_load`` calls for the same key share one backend call,
+    which runs as its own task so no caller's cancellation can kill it for
+    the others. Hedged attempts (``tool_guard.hedged_attempt``) skip the
+    sharing and send a request of their own.
+    Misses (None) are cached as well, so an unregistered number is not looked
+    up again on every retry. Loader errors are never cached.
+
+    Attributes:
+        name: Label used in stats.
+        ttl: Seconds an entry stays fresh.
+        maxsize: Maximum number of entries.
+        max_bytes: Approximate memory cap (JSON size plus fixed overhead).
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 10_000, max_bytes: int = 8 * 1024 * 1024):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.hedged = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def _get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def _remove(self, key: Hashable):
+        _, _, size = self._entries.pop(key)
+        self.bytes -= size
+
+    def _put(self, key: Hashable, value: Any):
+        size = _estimate_size(key, value)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value, size)
+        self.bytes += size
+        while len(self._entries) > self.maxsize or self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = self._get(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None and not hedged_attempt.get():
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        if inflight is not None:
+            # A hedged attempt races the in-flight load with a request of its own
+            self.hedged += 1
+            value = await loader()
+            self._put(key, value)
+            return value
+
+        # The load is a task of its own: a caller that gives up (deadline,
+        # cancelled attempt) must not cancel it for the others coalesced on it
+        task = asyncio.ensure_future(loader())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._load_done(key, t))
+        return await asyncio.shield(task)
+
+    def _load_done(self, key: Hashable, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # exception() also marks an error retrieved when nobody awaits it any more
+        if not task.cancelled() and task.exception() is None:
+            self._put(key, task.result())
+
+    def invalidate(self, key: Hashable):
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hedged": self.hedged,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 3) if lookups else None,
+        }
+
+
+class CachedDriverRepository(DriverRepository):
+    """Wraps a repository with one AsyncTTLCache per tool.
+
+    Keys are the normalized MSISDN, or (city, date) for incentives, so entries
+    are safe to share across calls in the same worker.
+    """
+
+    def __init__(
+        self,
+        backend: DriverRepository,
+        ttls: Optional[Dict[str, float]] = None,
+        maxsize: int = 10_000,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.backend = backend
+        self.name = f"cached({backend.name})"
+        ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.caches = {
+            tool: AsyncTTLCache(tool, ttl, maxsize=maxsize, max_bytes=max_bytes) for tool, ttl in ttls.items()
+        }
+
+    async def get_driver(self, msisdn: str) -> Optional[dict]:
+        return await self.caches["verify_driver_number"].get_or_load(
+            msisdn, lambda: self.backend.get_driver(msisdn)
+        )
+
+    async def get_account_health(self, msisdn: str) -> Optional[dict]:
+        return await self.caches["get_driver_account_health"].get_or_load(
+            msisdn, lambda: self.backend.get_account_health(msisdn)
+        )
+
+    async def get_online_status(self, msisdn: str) -> Optional[dict]:
+        return await self.caches["check_app_online_status"].get_or_load(
+            msisdn, lambda: self.backend.get_online_status(msisdn)
+        )
+
+    async def get_wallet(self, msisdn: str) -> Optional[dict]:
+        return await self.caches["fetch_wallet_and_payouts"].get_or_load(
+            msisdn, lambda: self.backend.get_wallet(msisdn)
+        )
+
+    async def get_incentives(self, city: str, date: str) -> Optional[dict]:
+        return await self.caches["get_incentives_today"].get_or_load(
+            (city, date), lambda: self.backend.get_incentives(city, date)
+        )
+
+    def close(self):
+        self.backend.close()
+
+    def stats(self) -> Dict[str, dict]:
+        return {tool: cache.stats() for tool, cache in self.caches.items()}
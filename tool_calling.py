@@ -1,52 +1,114 @@
 # tools_ola.py
 from __future__ import annotations
+import asyncio
 import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import date as _date
-from typing import Dict, Any, Optional
+from typing import Awaitable, Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
 from pipecat.adapters.schemas.function_schema import FunctionSchema
 from pipecat.adapters.schemas.tools_schema import ToolsSchema
 from pipecat.services.llm_service import FunctionCallParams
 
+# Driver facts come from the configured repository; the mock dicts are
+# re-exported for existing imports.
+from driver_store import (
+    ACCOUNT_HEALTH_DB,
+    DRIVERS_DB,
+    INCENTIVES_DB,
+    ONLINE_STATUS_DB,
+    WALLET_DB,
+    get_repository,
+)
+from demand_index import get_demand_store
+from loguru import logger
+from metrics import counters, histogram, increment
+from msisdn import normalize_msisdn
+from tool_guard import guard_tool, hedged_attempt
 
-# Cache the last verified number (per-process simple cache).
-_LAST_VERIFIED_MSISDN: str | None = None
 
-def _set_last_msisdn(msisdn: str) -> None:
-    global _LAST_VERIFIED_MSISDN
-    _LAST_VERIFIED_MSISDN = msisdn
+# Per-call tool state. Tools used to share one process-global "last verified
+# number", so concurrent calls in the same worker could resolve each other's
+# driver. Every call now gets its own ToolSession keyed by the WebRTC pc_id.
+_SESSION_LOOKUP_LIMIT = 32
 
-def _resolve_msisdn_from_args_or_cache(args: dict) -> str | None:
-    raw = args.get("phone_number")
-    if raw:
-        return normalize_msisdn(raw)
-    return _LAST_VERIFIED_MSISDN
 
+@dataclass
+class ToolSession:
+    """Per-call state shared by the Ola tools.
 
-# Mock “datastores”
-DRIVERS_DB: Dict[str, Dict[str, Any]] = {
-    "+919876543210": {"name": "Ramesh", "blocked": False, "registered": True, "city": "Bengaluru", "rating": 4.82},
-    "+919911223344": {"name": "Suresh", "blocked": True,  "registered": True, "city": "Delhi", "rating": 4.55},
-}
+    Attributes:
+        pc_id: Peer connection id of the call owning this session.
+        verified_msisdn: Last number verified during this call.
+        lookups: Small per-call cache of tool lookups, keyed by (tool, key).
+        observers: Callbacks notified after every tool call with
+            (tool_name, arguments, duration_ms).
+        prefetching: Speculative lookups still in flight, by (tool, key).
+        prefetched: Prefetched lookups no tool call has used yet.
+    """
 
-ACCOUNT_HEALTH_DB = {
-    "+919876543210": {"docs_pending": [], "bgv_status": "clear", "strikes": 0, "deactivation_reason": None},
-    "+919911223344": {"docs_pending": ["RC"], "bgv_status": "pending", "strikes": 2, "deactivation_reason": "compliance_hold"},
-}
+    pc_id: str
+    verified_msisdn: Optional[str] = None
+    lookups: "OrderedDict[Tuple[str, Any], Any]" = field(default_factory=OrderedDict)
+    observers: List[Callable[[str, dict, float], None]] = field(default_factory=list)
+    prefetching: "Dict[Tuple[str, Any], asyncio.Task]" = field(default_factory=dict)
+    prefetched: Set[Tuple[str, Any]] = field(default_factory=set)
 
-ONLINE_STATUS_DB = {
-    "+919876543210": {"last_online_at": "2025-10-24T09:10:00+05:30", "online_hours_today": 2.3, "app_version": "5.14.2"},
-    "+919911223344": {"last_online_at": "2025-10-24T07:05:00+05:30", "online_hours_today": 0.4, "app_version": "5.10.0"},
-}
+    def add_tool_observer(self, callback: Callable[[str, dict, float], None]) -> None:
+        self.observers.append(callback)
 
-WALLET_DB = {
-    "+919876543210": {"wallet_balance": 732.50, "next_payout_date": "2025-10-26", "holds": []},
-    "+919911223344": {"wallet_balance": 12.0,   "next_payout_date": "2025-10-25", "holds": ["KYC hold"]},
-}
+    def set_verified_msisdn(self, msisdn: str) -> None:
+        self.verified_msisdn = msisdn
+
+    def resolve_msisdn(self, args: dict) -> Optional[str]:
+        """Return the number from the tool arguments, or the verified one."""
+        raw = args.get("phone_number")
+        if raw:
+            return normalize_msisdn(raw)
+        return self.verified_msisdn
+
+    def recall(self, tool: str, key: Any) -> Any:
+        return self.lookups.get((tool, key))
+
+    def remember(self, tool: str, key: Any, value: Any) -> None:
+        self.lookups[(tool, key)] = value
+        self.lookups.move_to_end((tool, key))
+        while len(self.lookups) > _SESSION_LOOKUP_LIMIT:
+            self.lookups.popitem(last=False)
+
+
+_SESSIONS: Dict[str, ToolSession] = {}
+
+
+def get_tool_session(pc_id: str) -> ToolSession:
+    """Return the ToolSession for ``pc_id``, creating it on first use."""
+    session = _SESSIONS.get(pc_id)
+    if session is None:
+        session = _SESSIONS[pc_id] = ToolSession(pc_id=pc_id)
+    return session
+
+
+def release_tool_session(pc_id: str) -> None:
+    """Drop the ToolSession for ``pc_id`` once its call has ended.
+
+    Prefetches the call never used are counted as wasted; those still in
+    flight are cancelled.
+    """
+    session = _SESSIONS.pop(pc_id, None)
+    if session is None:
+        return
+    for tool, _ in session.prefetched:
+        increment(f"prefetch.wasted_{tool}")
+    for (tool, _), task in list(session.prefetching.items()):
+        increment(f"prefetch.wasted_{tool}")
+        task.cancel()
+
+
+def active_tool_sessions() -> int:
+    return len(_SESSIONS)
 
-INCENTIVES_DB = {
-    ("Bengaluru","2025-10-24"): {"surge_multiplier": 1.0, "quest_bonus": "3 rides → ₹150", "slots_remaining": True},
-    ("Delhi","2025-10-24"):     {"surge_multiplier": 1.4, "quest_bonus": "5 rides → ₹300", "slots_remaining": False},
-}
 
 def _mock_supply_demand(lat: float, lon: float) -> dict:
     return {
@@ -61,13 +123,121 @@ def _mock_supply_demand(lat: float, lon: float) -> dict:
 
 
 # Helpers
-def normalize_msisdn(raw: str, default_cc: str = "+91") -> str:
-    digits = "".join(ch for ch in raw if ch.isdigit())
-    if digits.startswith("91") and len(digits) == 12:
-        return f"+{digits}"
-    if len(digits) == 10:
-        return f"{default_cc}{digits}"
-    return f"+{digits}" if not raw.startswith("+") else raw
+async def _lookup(session: ToolSession, tool: str, key: Any, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """Load ``key`` for ``tool`` through the per-call cache, timing backend calls."""
+    value = session.recall(tool, key)
+    loaded = value is not None
+    prefetch = session.prefetching.get((tool, key))
+    if not loaded and prefetch is not None and not hedged_attempt.get():
+        # Join the speculative lookup; shielded so a tool deadline does not cancel it
+        try:
+            value = await asyncio.shield(prefetch)
+            loaded = True
+        except Exception:
+            pass
+    if (tool, key) in session.prefetched:
+        session.prefetched.discard((tool, key))
+        increment(f"prefetch.hit_{tool}")
+    if not loaded:
+        start = time.perf_counter()
+        value = await loader()
+        histogram(f"lookup.{tool}").observe((time.perf_counter() - start) * 1000)
+        if value is not None:
+            session.remember(tool, key, value)
+    return value
+
+
+# Lookups that usually follow a successful number check, fired concurrently
+# right after it (see configure_prefetch). Off unless configured.
+PREFETCH_TOOLS = (
+    "get_driver_account_health",
+    "check_app_online_status",
+    "fetch_wallet_and_payouts",
+    "get_incentives_today",
+)
+_prefetch_tools: Tuple[str, ...] = ()
+
+
+def configure_prefetch(tools: Iterable[str] = PREFETCH_TOOLS) -> Tuple[str, ...]:
+    """Choose the lookups prefetched after verification; an empty list disables prefetching."""
+    global _prefetch_tools
+    tools = tuple(tools)
+    unknown = set(tools) - set(PREFETCH_TOOLS)
+    if unknown:
+        raise ValueError(f"Cannot prefetch {sorted(unknown)}; choose from {PREFETCH_TOOLS}")
+    _prefetch_tools = tools
+    return _prefetch_tools
+
+
+def _prefetch_lookups(msisdn: str, city: Optional[str]) -> Dict[str, Tuple[Any, Callable[[], Awaitable[Any]]]]:
+    """(key, loader) of each prefetchable tool, keyed exactly like the tool's own lookup."""
+    repository = get_repository()
+    lookups = {
+        "get_driver_account_health": (msisdn, lambda: repository.get_account_health(msisdn)),
+        "check_app_online_status": (msisdn, lambda: repository.get_online_status(msisdn)),
+        "fetch_wallet_and_payouts": (msisdn, lambda: repository.get_wallet(msisdn)),
+    }
+    if city:
+        today = str(_date.today())
+        lookups["get_incentives_today"] = ((city, today), lambda: repository.get_incentives(city, today))
+    return lookups
+
+
+async def _prefetch(session: ToolSession, tool: str, key: Any, loader: Callable[[], Awaitable[Any]]) -> Any:
+    start = time.perf_counter()
+    value = await loader()
+    histogram(f"lookup.{tool}").observe((time.perf_counter() - start) * 1000)
+    if value is not None:
+        session.remember(tool, key, value)
+    session.prefetched.add((tool, key))
+    return value
+
+
+def _prefetch_done(session: ToolSession, tool: str, key: Any, task: asyncio.Task) -> None:
+    session.prefetching.pop((tool, key), None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Prefetch of {tool} for {session.pc_id} failed: {task.exception()}")
+
+
+def prefetch_after_verify(session: ToolSession, msisdn: str, city: Optional[str]) -> int:
+    """Start the configured lookups for a verified driver without waiting for them.
+
+    Results land in the session's lookup cache, so the tool calls that follow
+    verification answer without a backend round trip (or join the lookup if
+    it is still in flight).
+
+    Returns:
+        The number of lookups started.
+    """
+    started = 0
+    for tool, (key, loader) in _prefetch_lookups(msisdn, city).items():
+        if tool not in _prefetch_tools or (tool, key) in session.prefetching:
+            continue
+        if session.recall(tool, key) is not None:
+            continue
+        task = asyncio.get_running_loop().create_task(_prefetch(session, tool, key, loader))
+        task.add_done_callback(lambda t, tool=tool, key=key: _prefetch_done(session, tool, key, t))
+        session.prefetching[(tool, key)] = task
+        increment(f"prefetch.issued_{tool}")
+        started += 1
+    return started
+
+
+def prefetch_stats() -> Dict[str, Dict[str, Any]]:
+    """Issued, hit and wasted prefetches per tool, with the hit rate of those issued."""
+    counts = counters("prefetch.")
+    stats = {}
+    for tool in PREFETCH_TOOLS:
+        issued = counts.get(f"prefetch.issued_{tool}", 0)
+        hits = counts.get(f"prefetch.hit_{tool}", 0)
+        if issued:
+            stats[tool] = {
+                "issued": issued,
+                "hit": hits,
+                "wasted": counts.get(f"prefetch.wasted_{tool}", 0),
+                "hit_rate": round(hits / issued, 3),
+            }
+    return stats
 
 
 # Schemas
@@ -142,6 +312,25 @@ push_device_reauth_schema = FunctionSchema(
     required=["phone_number","purpose"],
 )
 
+# One round trip for every per-driver fact the flows need after verification
+SNAPSHOT_FIELDS = ("account_health", "online_status", "wallet", "incentives")
+
+get_driver_snapshot_schema = FunctionSchema(
+    name="get_driver_snapshot",
+    description="Verified driver's facts in one call: account_health, online_status (app version), "
+    "wallet (payouts, holds), incentives (today). Request only the fields you need.",
+    properties={
+        "fields": {
+            "type": "array",
+            "items": {"type": "string", "enum": list(SNAPSHOT_FIELDS)},
+            "description": "Default: all fields",
+        },
+        "phone_number": {"type": "string", "description": "Optional; falls back to last verified number."},
+        "city": {"type": "string", "description": "For incentives; defaults to the driver's city."},
+    },
+    required=[],
+)
+
 create_support_ticket_schema = FunctionSchema(
     name="create_support_ticket",
     description="Create a support ticket and return ticket_id.",
@@ -155,16 +344,81 @@ create_support_ticket_schema = FunctionSchema(
 )
 
 
+# Schemas offered to the model; built once, shared by every call.
+OLA_TOOLS = ToolsSchema(standard_tools=[
+    verify_driver_number_schema,
+    get_driver_snapshot_schema,
+    get_driver_account_health_schema,
+    check_app_online_status_schema,
+    get_supply_demand_snapshot_schema,
+    fetch_wallet_and_payouts_schema,
+    get_incentives_today_schema,
+    push_device_reauth_schema,
+    # create_support_ticket_schema,
+])
+
+
+# Tools each caller intent needs, following the flows in prompt.txt. Every
+# flow starts with the number check, and a blocked number branches into the
+# account-health flow, so those tools stay in the ride complaint's subset.
+INTENT_TOOLS: Dict[str, Tuple[str, ...]] = {
+    "no_rides": (
+        "verify_driver_number",
+        "get_driver_snapshot",
+        "get_driver_account_health",
+        "check_app_online_status",
+        "get_supply_demand_snapshot",
+        "get_incentives_today",
+        "push_device_reauth",
+    ),
+    "account_blocked": ("verify_driver_number", "get_driver_account_health", "push_device_reauth"),
+    "payout": ("verify_driver_number", "get_driver_snapshot", "fetch_wallet_and_payouts"),
+    "app_issue": ("verify_driver_number", "get_driver_snapshot", "check_app_online_status", "push_device_reauth"),
+    "incentives": ("verify_driver_number", "get_incentives_today", "get_supply_demand_snapshot"),
+}
+
+# Checked in order, most specific first: "app pe ride nahi aa rahi" is a ride
+# complaint only when nothing more specific matched.
+_INTENT_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ("payout", re.compile(r"payout|pay out|paisa|paise|payment|wallet|balance|withdraw|पैस|पेमेंट|वॉलेट|भुगतान")),
+    ("account_blocked", re.compile(r"block|suspend|deactivat|band ho|बंद|ब्लॉक|सस्पेंड")),
+    ("incentives", re.compile(r"incentive|bonus|quest|surge|इंसेंटिव|बोनस")),
+    ("app_issue", re.compile(r"\bapp\b|login|log in|\botp\b|crash|update|ऐप|एप|लॉगिन")),
+    ("no_rides", re.compile(r"ride|booking|sawari|trip|राइड|सवारी|बुकिंग")),
+]
+
+_INTENT_SCHEMAS: Dict[str, ToolsSchema] = {
+    intent: ToolsSchema(standard_tools=[t for t in OLA_TOOLS.standard_tools if t.name in names])
+    for intent, names in INTENT_TOOLS.items()
+}
+
+
+def detect_intent(text: str) -> Optional[str]:
+    """Classify a caller utterance into one of ``INTENT_TOOLS`` by keyword, or None."""
+    text = text.lower()
+    for intent, pattern in _INTENT_PATTERNS:
+        if pattern.search(text):
+            return intent
+    return None
+
+
+def tools_for_intent(intent: Optional[str]) -> ToolsSchema:
+    """The tool subset for ``intent``; all of ``OLA_TOOLS`` when it is unknown."""
+    return _INTENT_SCHEMAS.get(intent, OLA_TOOLS)
+
+
 # Implementations (async)
 
-def make_verify_driver_number():
+def make_verify_driver_number(session: ToolSession):
     async def verify_driver_number(params: FunctionCallParams):
         msisdn = normalize_msisdn(
             params.arguments["phone_number"],
             params.arguments.get("country_code", "+91"),
         )
-        rec = DRIVERS_DB.get(msisdn)
-        _set_last_msisdn(msisdn)  # ✅ cache
+        rec = await _lookup(session, "verify_driver_number", msisdn, lambda: get_repository().get_driver(msisdn))
+        session.set_verified_msisdn(msisdn)  # ✅ cache (per call)
+        if rec and rec.get("registered") and _prefetch_tools:
+            prefetch_after_verify(session, msisdn, rec.get("city"))
 
         await params.result_callback({
             "normalized_number": msisdn,
@@ -177,29 +431,53 @@ def make_verify_driver_number():
     return verify_driver_number
 
 
-def make_get_driver_account_health():
+# Result shapes, shared by the single-fact tools and get_driver_snapshot
+def _account_health_result(rec: dict) -> dict:
+    return {
+        "docs_pending": rec.get("docs_pending", []),
+        "bgv_status": rec.get("bgv_status", "unknown"),
+        "strikes": rec.get("strikes", 0),
+        "deactivation_reason": rec.get("deactivation_reason"),
+    }
+
+
+def _online_status_result(info: dict) -> dict:
+    return {
+        "last_online_at": info.get("last_online_at"),
+        "online_hours_today": info.get("online_hours_today", 0.0),
+        "app_version": info.get("app_version", "unknown"),
+        "needs_update": info.get("app_version","0") < "5.12.0",
+    }
+
+
+def _wallet_result(row: dict) -> dict:
+    return {
+        "wallet_balance": row.get("wallet_balance", 0.0),
+        "next_payout_date": row.get("next_payout_date"),
+        "holds": row.get("holds", []),
+    }
+
+
+_NO_INCENTIVES = {"surge_multiplier": 1.0, "quest_bonus": None, "slots_remaining": False}
+
+
+def make_get_driver_account_health(session: ToolSession):
     async def get_driver_account_health(params: FunctionCallParams):
-        msisdn = _resolve_msisdn_from_args_or_cache(params.arguments)
+        msisdn = session.resolve_msisdn(params.arguments)
         if not msisdn:
             await params.result_callback({"status":"error","reason":"missing_phone_number"})
             return
-        rec = ACCOUNT_HEALTH_DB.get(msisdn, {})
-        await params.result_callback({
-            "docs_pending": rec.get("docs_pending", []),
-            "bgv_status": rec.get("bgv_status", "unknown"),
-            "strikes": rec.get("strikes", 0),
-            "deactivation_reason": rec.get("deactivation_reason"),
-        })
+        rec = await _lookup(session, "get_driver_account_health", msisdn, lambda: get_repository().get_account_health(msisdn)) or {}
+        await params.result_callback(_account_health_result(rec))
     return get_driver_account_health
 
-def make_push_device_reauth():
+def make_push_device_reauth(session: ToolSession):
     async def push_device_reauth(params: FunctionCallParams):
-        msisdn = _resolve_msisdn_from_args_or_cache(params.arguments)
+        msisdn = session.resolve_msisdn(params.arguments)
         if not msisdn:
             await params.result_callback({"status":"error","reason":"missing_phone_number"})
             return
         purpose = params.arguments["purpose"]
-        import random
         token = f"OTP-{random.randint(100000,999999)}"
         await params.result_callback({
             "sent": True, "msisdn": msisdn, "purpose": purpose, "token_hint": token[:3]+"***"
@@ -207,72 +485,134 @@ def make_push_device_reauth():
     return push_device_reauth
 
 
-def make_check_app_online_status():
+def make_check_app_online_status(session: ToolSession):
     async def check_app_online_status(params: FunctionCallParams):
-        msisdn = normalize_msisdn(params.arguments["phone_number"])
-        info = ONLINE_STATUS_DB.get(msisdn, {})
-        await params.result_callback({
-            "last_online_at": info.get("last_online_at"),
-            "online_hours_today": info.get("online_hours_today", 0.0),
-            "app_version": info.get("app_version", "unknown"),
-            "needs_update": info.get("app_version","0") < "5.12.0",
-        })
+        msisdn = session.resolve_msisdn(params.arguments)
+        if not msisdn:
+            await params.result_callback({"status":"error","reason":"missing_phone_number"})
+            return
+        info = await _lookup(session, "check_app_online_status", msisdn, lambda: get_repository().get_online_status(msisdn)) or {}
+        await params.result_callback(_online_status_result(info))
     return check_app_online_status
 
-def make_get_supply_demand_snapshot():
+def make_get_supply_demand_snapshot(session: ToolSession):
     async def get_supply_demand_snapshot(params: FunctionCallParams):
         lat = float(params.arguments["lat"]); lon = float(params.arguments["lon"])
-        snap = _mock_supply_demand(lat, lon)
+        store = get_demand_store()
+        index = store.current() if store else None
+        if index is None:
+            snap = _mock_supply_demand(lat, lon)
+        else:
+            start = time.perf_counter()
+            snap = index.snapshot(lat, lon)
+            histogram("lookup.get_supply_demand_snapshot").observe((time.perf_counter() - start) * 1000)
         await params.result_callback(snap)
     return get_supply_demand_snapshot
 
-def make_fetch_wallet_and_payouts():
+def make_fetch_wallet_and_payouts(session: ToolSession):
     async def fetch_wallet_and_payouts(params: FunctionCallParams):
-        msisdn = normalize_msisdn(params.arguments["phone_number"])
-        row = WALLET_DB.get(msisdn, {})
-        await params.result_callback({
-            "wallet_balance": row.get("wallet_balance", 0.0),
-            "next_payout_date": row.get("next_payout_date"),
-            "holds": row.get("holds", []),
-        })
+        msisdn = session.resolve_msisdn(params.arguments)
+        if not msisdn:
+            await params.result_callback({"status":"error","reason":"missing_phone_number"})
+            return
+        row = await _lookup(session, "fetch_wallet_and_payouts", msisdn, lambda: get_repository().get_wallet(msisdn)) or {}
+        await params.result_callback(_wallet_result(row))
     return fetch_wallet_and_payouts
 
-def make_get_incentives_today():
+def make_get_incentives_today(session: ToolSession):
     async def get_incentives_today(params: FunctionCallParams):
         city = params.arguments["city"]
         d = params.arguments.get("date") or str(_date.today())
-        info = INCENTIVES_DB.get((city, d), {"surge_multiplier": 1.0, "quest_bonus": None, "slots_remaining": False})
+        info = await _lookup(session, "get_incentives_today", (city, d), lambda: get_repository().get_incentives(city, d)) or dict(_NO_INCENTIVES)
         await params.result_callback(info)
     return get_incentives_today
 
 
-def make_create_support_ticket():
+def make_get_driver_snapshot(session: ToolSession):
+    async def get_driver_snapshot(params: FunctionCallParams):
+        msisdn = session.resolve_msisdn(params.arguments)
+        if not msisdn:
+            await params.result_callback({"status":"error","reason":"missing_phone_number"})
+            return
+        fields = [f for f in (params.arguments.get("fields") or SNAPSHOT_FIELDS) if f in SNAPSHOT_FIELDS]
+        repository = get_repository()
+        lookups: Dict[str, Awaitable[Any]] = {}
+        # Same lookups (and cache keys) as the single-fact tools, run concurrently
+        if "account_health" in fields:
+            lookups["account_health"] = _lookup(session, "get_driver_account_health", msisdn, lambda: repository.get_account_health(msisdn))
+        if "online_status" in fields:
+            lookups["online_status"] = _lookup(session, "check_app_online_status", msisdn, lambda: repository.get_online_status(msisdn))
+        if "wallet" in fields:
+            lookups["wallet"] = _lookup(session, "fetch_wallet_and_payouts", msisdn, lambda: repository.get_wallet(msisdn))
+        city = params.arguments.get("city")
+        if "incentives" in fields and not city:
+            driver = session.recall("verify_driver_number", msisdn) or await repository.get_driver(msisdn) or {}
+            city = driver.get("city")
+        if "incentives" in fields and city:
+            d = str(_date.today())
+            lookups["incentives"] = _lookup(session, "get_incentives_today", (city, d), lambda: repository.get_incentives(city, d))
+        values = dict(zip(lookups, await asyncio.gather(*lookups.values())))
+
+        snapshot: Dict[str, Any] = {}
+        if "account_health" in values:
+            snapshot["account_health"] = _account_health_result(values["account_health"] or {})
+        if "online_status" in values:
+            snapshot["online_status"] = _online_status_result(values["online_status"] or {})
+        if "wallet" in values:
+            snapshot["wallet"] = _wallet_result(values["wallet"] or {})
+        if "incentives" in values:
+            snapshot["incentives"] = values["incentives"] or dict(_NO_INCENTIVES)
+        elif "incentives" in fields:
+            snapshot["incentives"] = {"status": "error", "reason": "missing_city"}
+        await params.result_callback(snapshot)
+    return get_driver_snapshot
+
+
+def make_create_support_ticket(session: ToolSession):
     async def create_support_ticket(params: FunctionCallParams):
-        msisdn = normalize_msisdn(params.arguments["phone_number"])
+        msisdn = session.resolve_msisdn(params.arguments)
         summary = params.arguments["summary"]
         cat = params.arguments["category"]
         ticket_id = "OLA-"+str(abs(hash((msisdn, cat, summary)))%10_000_000).zfill(7)
         await params.result_callback({"ticket_id": ticket_id, "status": "created"})
     return create_support_ticket
 
+def _observed(session: ToolSession, name: str, handler: Callable[[FunctionCallParams], Awaitable[None]]):
+    """Time ``handler`` and report each call to the session's observers."""
+    async def wrapper(params: FunctionCallParams):
+        start = time.perf_counter()
+        try:
+            await handler(params)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            for callback in session.observers:
+                callback(name, dict(params.arguments or {}), duration_ms)
+    return wrapper
+
+
 # Registration helper
-def register_ola_tools(llm) -> ToolsSchema:
-    tools = ToolsSchema(standard_tools=[
-        verify_driver_number_schema,
-        get_driver_account_health_schema,
-        check_app_online_status_schema,
-        get_supply_demand_snapshot_schema,
-        fetch_wallet_and_payouts_schema,
-        get_incentives_today_schema,
-        push_device_reauth_schema,
-        # create_support_ticket_schema,
-    ])
-    llm.register_function("verify_driver_number",      make_verify_driver_number())
-    llm.register_function("get_driver_account_health", make_get_driver_account_health())
-    llm.register_function("check_app_online_status",   make_check_app_online_status())
-    llm.register_function("get_supply_demand_snapshot",make_get_supply_demand_snapshot())
-    llm.register_function("fetch_wallet_and_payouts",  make_fetch_wallet_and_payouts())
-    llm.register_function("get_incentives_today",      make_get_incentives_today())
-    llm.register_function("push_device_reauth",        make_push_device_reauth())
-    llm.register_function("create_support_ticket",     make_create_support_ticket())
-    return tools
+def register_ola_tools(llm, pc_id: str) -> ToolsSchema:
+    """Register the Ola tools on ``llm``, bound to the call identified by ``pc_id``.
+
+    Each call gets its own ToolSession, so the verified number of one driver
+    never leaks into another call served by the same process. Release it with
+    ``release_tool_session(pc_id)`` when the call ends.
+    """
+    if not pc_id:
+        raise ValueError("register_ola_tools needs the pc_id of the call, to release its tool session")
+    session = get_tool_session(pc_id)
+    handlers = {
+        "verify_driver_number":       make_verify_driver_number(session),
+        "get_driver_account_health":  make_get_driver_account_health(session),
+        "get_driver_snapshot":        make_get_driver_snapshot(session),
+        "check_app_online_status":    make_check_app_online_status(session),
+        "get_supply_demand_snapshot": make_get_supply_demand_snapshot(session),
+        "fetch_wallet_and_payouts":   make_fetch_wallet_and_payouts(session),
+        "get_incentives_today":       make_get_incentives_today(session),
+        "push_device_reauth":         make_push_device_reauth(session),
+        "create_support_ticket":      make_create_support_ticket(session),
+    }
+    for name, handler in handlers.items():
+        # Deadline / hedging / circuit breaker per tool (see tool_guard.TOOL_POLICIES)
+        llm.register_function(name, _observed(session, name, guard_tool(name, handler)))
+    return OLA_TOOLS
@@ -0,0 +1,243 @@
+import asyncio
+import contextvars
+import dataclasses
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+from pipecat.services.llm_service import FunctionCallParams
+
+from metrics import histogram
+
+ToolHandler = Callable[[FunctionCallParams], Awaitable[None]]
+
+# True inside a hedged attempt. Shared in-flight loads (the lookup cache,
+# prefetches) must not coalesce it onto the request it is hedging.
+hedged_attempt: contextvars.ContextVar[bool] = contextvars.ContextVar("hedged_attempt", default=False)
+
+
+@dataclass(frozen=True)
+class ToolPolicy:
+    """Execution limits for one tool.
+
+    Attributes:
+        deadline: Seconds the caller may wait for a result before the tool
+            answers with a degraded ``{"status": "unavailable"}`` result.
+        hedge_after: Seconds after which a second, parallel attempt is started
+            if no result has arrived yet. None disables hedging.
+        idempotent: Whether the tool may safely run twice. Tools with side
+            effects (OTPs, tickets) are never hedged.
+    """
+
+    deadline: float = 1.5
+    hedge_after: Optional[float] = None
+    idempotent: bool = True
+
+
+DEFAULT_POLICY = ToolPolicy()
+
+# Handler errors caused by the model's arguments (missing or malformed keys).
+# They say nothing about the backend, so they do not count toward the breaker.
+ARGUMENT_ERRORS = (KeyError, TypeError, ValueError)
+
+TOOL_POLICIES: Dict[str, ToolPolicy] = {
+    "verify_driver_number": ToolPolicy(deadline=2.0, hedge_after=0.4),
+    "get_driver_account_health": ToolPolicy(deadline=1.5, hedge_after=0.4),
+    "check_app_online_status": ToolPolicy(deadline=1.5, hedge_after=0.4),
+    "fetch_wallet_and_payouts": ToolPolicy(deadline=1.5, hedge_after=0.4),
+    "get_incentives_today": ToolPolicy(deadline=1.5, hedge_after=0.4),
+    # Its lookups run concurrently, so one lookup's deadline covers them all
+    "get_driver_snapshot": ToolPolicy(deadline=1.5, hedge_after=0.4),
+    "get_supply_demand_snapshot": ToolPolicy(deadline=1.5),
+    "push_device_reauth": ToolPolicy(deadline=3.0, idempotent=False),
+    "create_support_ticket": ToolPolicy(deadline=3.0, idempotent=False),
+}
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures.
+
+    While open, calls are refused for ``reset_after`` seconds; then a single
+    trial call is let through (half-open) and its outcome closes or re-opens
+    the breaker.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_after: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.times_opened = 0
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_after:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                self.times_opened += 1
+            self.opened_at = time.monotonic()
+
+    def release_trial(self):
+        """End a half-open trial that proved nothing (cancelled, bad arguments)."""
+        self.trial_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "times_opened": self.times_opened,
+            "short_circuited": self.short_circuited,
+        }
+
+
+# Breakers track backend health, so they are shared by every call in the worker.
+_breakers: Dict[str, CircuitBreaker] = {}
+_counters: Dict[str, Dict[str, int]] = {}
+
+
+def breaker_for(name: str) -> CircuitBreaker:
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker()
+    return breaker
+
+
+def _count(name: str, event: str):
+    counters = _counters.setdefault(name, {})
+    counters[event] = counters.get(event, 0) + 1
+
+
+def unavailable(name: str, reason: str) -> dict:
+    return {"status": "unavailable", "tool": name, "reason": reason}
+
+
+def guard_tool(name: str, handler: ToolHandler, policy: Optional[ToolPolicy] = None) -> ToolHandler:
+    """Wrap a tool handler with a deadline, optional hedging and a circuit breaker.
+
+    The handler reports through ``params.result_callback`` as usual; the
+    wrapper runs it against a capturing callback and forwards the first
+    result. On timeout, error or an open breaker the model gets a fast
+    ``{"status": "unavailable"}`` result instead of silence. Only timeouts and
+    backend errors count toward the breaker, not ``ARGUMENT_ERRORS``. Latencies
+    go to the ``tool.<name>`` histogram.
+    """
+    policy = policy or TOOL_POLICIES.get(name, DEFAULT_POLICY)
+    breaker = breaker_for(name)
+
+    async def guarded(params: FunctionCallParams):
+        trial = breaker.state == "half_open"
+        if not breaker.allow():
+            _count(name, "short_circuited")
+            await params.result_callback(unavailable(name, "circuit_open"))
+            return
+        try:
+            await run(params, trial)
+        except asyncio.CancelledError:
+            # Interrupted (barge-in): a trial that never finished must not
+            # leave the breaker refusing every later call
+            if trial:
+                breaker.release_trial()
+            raise
+
+    async def run(params: FunctionCallParams, trial: bool):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        outcome: asyncio.Future = loop.create_future()
+        attempts: List[asyncio.Task] = []
+
+        async def capture(result: Any, *, properties: Any = None):
+            if not outcome.done():
+                outcome.set_result((result, properties))
+
+        attempt_params = dataclasses.replace(params, result_callback=capture)
+
+        def on_attempt_done(task: asyncio.Task):
+            if task.cancelled() or outcome.done():
+                return
+            error = task.exception()
+            if error is not None and all(t.done() for t in attempts):
+                outcome.set_exception(error)
+            elif error is None and all(t.done() for t in attempts):
+                outcome.set_exception(RuntimeError(f"{name} returned without a result"))
+
+        def start_attempt(hedge: bool = False):
+            context = contextvars.copy_context()
+            if hedge:
+                context.run(hedged_attempt.set, True)
+            task = asyncio.create_task(handler(attempt_params), context=context)
+            attempts.append(task)
+            task.add_done_callback(on_attempt_done)
+
+        start_attempt()
+        reason = None
+        try:
+            if policy.hedge_after is not None and policy.idempotent and policy.hedge_after < policy.deadline:
+                await asyncio.wait([outcome], timeout=policy.hedge_after)
+                if not outcome.done():
+                    _count(name, "hedged")
+                    start_attempt(hedge=True)
+            remaining = max(policy.deadline - (loop.time() - start), 0)
+            result, properties = await asyncio.wait_for(asyncio.shield(outcome), remaining)
+        except asyncio.TimeoutError:
+            reason = "timeout"
+        except ARGUMENT_ERRORS as e:
+            logger.warning(f"Tool {name} got bad arguments: {e!r}")
+            reason = "bad_arguments"
+        except Exception as e:
+            logger.error(f"Tool {name} failed: {e}")
+            reason = "error"
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+            histogram(f"tool.{name}").observe((loop.time() - start) * 1000)
+
+        if reason is not None:
+            _count(name, reason)
+            if reason != "bad_arguments":
+                breaker.record_failure()
+            elif trial:
+                breaker.release_trial()
+            await params.result_callback(unavailable(name, reason))
+            return
+
+        breaker.record_success()
+        if properties is None:
+            await params.result_callback(result)
+        else:
+            await params.result_callback(result, properties=properties)
+
+    return guarded
+
+
+def stats() -> Dict[str, dict]:
+    return {
+        name: {**breaker.stats(), **_counters.get(name, {})}
+        for name, breaker in sorted(_breakers.items())
+    }
@@ -1,9 +1,20 @@
-from typing import Optional, List
-from pipecat.frames.frames import TranscriptionMessage, TranscriptionUpdateFrame
-from pipecat.frames.frames import TranscriptionMessage
-from pipecat.processors.transcript_processor import TranscriptProcessor
-from loguru import logger
+import asyncio
+import glob
+import json
 import os
+import sys
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from loguru import logger
+from pipecat.frames.frames import MetricsFrame, TranscriptionMessage, TranscriptionUpdateFrame
+from pipecat.metrics.metrics import ProcessingMetricsData, TTFBMetricsData
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.processors.transcript_processor import TranscriptProcessor
+
+TRANSCRIPT_FORMATS = ("text", "jsonl")
 
 
 class TranscriptHandler:
@@ -12,23 +23,113 @@ class TranscriptHandler:
     Maintains a list of conversation messages and outputs them either to a log
     or to a file as they are received. Each message includes its timestamp and role.
 
+    In buffered mode, lines are queued in memory and a background task writes
+    them in batches through one long-lived file handle, so the event loop that
+    carries the audio frames never blocks on disk I/O.
+
+    With ``format="jsonl"`` every message is written as one JSON object
+    carrying the session id, role, timestamp, turn index, the tool calls made
+    during the turn and the TTFB/processing metrics reported for it.
+
     Attributes:
         messages: List of all processed transcript messages
         output_file: Optional path to file where transcript is saved. If None, outputs to log only.
+        format: Either "text" (``[ts] role: content`` lines) or "jsonl".
+        session_id: Session identifier written into every JSONL record.
+        turn: Index of the current turn; incremented on every user message.
+        dropped: Number of lines dropped because the buffered backlog was full.
+        late_flushes: Number of buffered flushes that took longer than flush_interval.
     """
 
-    def __init__(self, output_file: Optional[str] = None):
+    def __init__(
+        self,
+        output_file: Optional[str] = None,
+        format: str = "text",
+        session_id: Optional[str] = None,
+        buffered: bool = False,
+        flush_size: int = 20,
+        flush_interval: float = 1.0,
+        max_backlog: int = 1000,
+    ):
         """Initialize handler with optional file output.
 
         Args:
             output_file: Path to output file. If None, outputs to log only.
+            format: Output format, "text" or "jsonl".
+            session_id: Session identifier for JSONL records.
+            buffered: Queue lines and write them in batches from a background task.
+            flush_size: Number of queued lines that triggers a flush in buffered mode.
+            flush_interval: Maximum seconds a line waits in the queue in buffered mode.
+            max_backlog: Maximum number of queued lines; newer lines are dropped beyond it.
         """
+        if format not in TRANSCRIPT_FORMATS:
+            raise ValueError(f"Unknown transcript format: {format}")
         self.messages: List[TranscriptionMessage] = []
         self.output_file: Optional[str] = output_file
+        self.format = format
+        self.session_id = session_id
+        self.turn = 0
+        self.buffered = buffered
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_backlog = max_backlog
+        self.dropped = 0
+        self.late_flushes = 0
+
+        self._pending: Deque[str] = deque()
+        self._flush_event: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._file: Optional[TextIO] = None
+        self._closed = False
+        self._turn_tool_calls: List[Dict[str, Any]] = []
+        self._turn_metrics: Dict[str, Dict[str, float]] = {}
+
+        if self.output_file and os.path.dirname(self.output_file):
+            os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
         logger.debug(
             f"TranscriptHandler initialized {'with output_file=' + output_file if output_file else 'with log output only'}"
+            f"{' (buffered)' if buffered and output_file else ''}"
         )
 
+    def record_tool_call(self, name: str, arguments: dict, duration_ms: float):
+        """Attach a tool call to the current turn (JSONL mode; ignored otherwise)."""
+        if self.format != "jsonl":
+            return
+        self._turn_tool_calls.append(
+            {"name": name, "arguments": arguments, "duration_ms": round(duration_ms, 2)}
+        )
+
+    def record_metric(self, kind: str, processor: str, value: float):
+        """Attach a TTFB/processing metric (seconds) to the current turn (JSONL mode; ignored otherwise)."""
+        if self.format != "jsonl":
+            return
+        self._turn_metrics.setdefault(kind, {})[processor] = round(value, 4)
+
+    def format_message(self, message: TranscriptionMessage) -> str:
+        if self.format == "jsonl":
+            return json.dumps(self._message_record(message), ensure_ascii=False)
+        timestamp = f"[{message.timestamp}] " if message.timestamp else ""
+        return f"{timestamp}{message.role}: {message.content}"
+
+    def _message_record(self, message: TranscriptionMessage) -> Dict[str, Any]:
+        if message.role == "user":
+            self.turn += 1
+        record: Dict[str, Any] = {
+            "session_id": self.session_id,
+            "role": message.role,
+            "timestamp": message.timestamp or datetime.now(timezone.utc).isoformat(),
+            "turn": self.turn,
+            "content": message.content,
+        }
+        # Tool calls and metrics collected since the last assistant message
+        # belong to the assistant reply that closes the turn.
+        if message.role == "assistant":
+            record["tool_calls"] = self._turn_tool_calls
+            record["metrics"] = self._turn_metrics
+            self._turn_tool_calls = []
+            self._turn_metrics = {}
+        return record
+
     async def save_message(self, message: TranscriptionMessage):
         """Save a single transcript message.
 
@@ -37,21 +138,100 @@ class TranscriptHandler:
         Args:
             message: The message to save
         """
-        timestamp = f"[{message.timestamp}] " if message.timestamp else ""
-        line = f"{timestamp}{message.role}: {message.content}"
+        line = self.format_message(message)
 
         # Always log the message
         logger.info(f"Transcript: {line}")
 
-        if self.output_file:
-            os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
+        if not self.output_file:
+            return
+
+        if self.buffered:
+            self._enqueue(line)
+            return
+
         # Optionally write to file
-        if self.output_file:
+        try:
+            with open(self.output_file, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except Exception as e:
+            logger.error(f"Error saving transcript message to file: {e}")
+
+    def _enqueue(self, line: str):
+        if self._closed:
+            self.dropped += 1
+            return
+        if len(self._pending) >= self.max_backlog:
+            self.dropped += 1
+            return
+        self._pending.append(line)
+
+        if self._writer_task is None:
+            self._flush_event = asyncio.Event()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+        if len(self._pending) >= self.flush_size:
+            self._flush_event.set()
+
+    async def _writer_loop(self):
+        assert self._flush_event is not None
+        while True:
             try:
-                with open(self.output_file, "a", encoding="utf-8") as f:
-                    f.write(line + "\n")
-            except Exception as e:
-                logger.error(f"Error saving transcript message to file: {e}")
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            await self._flush_pending()
+            if self._closed:
+                break
+
+    async def _flush_pending(self):
+        if not self._pending:
+            return
+        lines = list(self._pending)
+        self._pending.clear()
+        start = time.monotonic()
+        try:
+            await asyncio.to_thread(self._write_lines, lines)
+        except Exception as e:
+            logger.error(f"Error saving transcript batch to file: {e}")
+        if time.monotonic() - start > self.flush_interval:
+            self.late_flushes += 1
+
+    def _write_lines(self, lines: List[str]):
+        if self._file is None:
+            self._file = open(self.output_file, "a", encoding="utf-8")
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+            "late_flushes": self.late_flushes,
+        }
+
+    async def close(self):
+        """Flush any queued lines and release the file handle.
+
+        Safe to call more than once; call it when the session ends.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer_task:
+            # Let the writer finish its current batch and exit on its own so a
+            # write already running in the worker thread is never interleaved.
+            self._flush_event.set()
+            await self._writer_task
+            self._writer_task = None
+        await self._flush_pending()
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+        if self.dropped or self.late_flushes:
+            logger.warning(
+                f"Transcript {self.output_file}: {self.dropped} dropped lines, {self.late_flushes} late flushes"
+            )
 
     async def on_transcript_update(
         self, processor: TranscriptProcessor, frame: TranscriptionUpdateFrame
@@ -67,3 +247,85 @@ class TranscriptHandler:
         for msg in frame.messages:
             self.messages.append(msg)
             await self.save_message(msg)
+
+
+class TranscriptMetricsObserver(BaseObserver):
+    """Feeds the pipeline's TTFB/processing metrics into a TranscriptHandler.
+
+    Observers see a frame at every hop it is pushed through, so frames are
+    de-duplicated by id before being recorded.
+    """
+
+    def __init__(self, handler: TranscriptHandler, **kwargs):
+        super().__init__(**kwargs)
+        self._handler = handler
+        self._seen: Deque[int] = deque(maxlen=64)
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if not isinstance(frame, MetricsFrame) or frame.id in self._seen:
+            return
+        self._seen.append(frame.id)
+        for item in frame.data:
+            if isinstance(item, TTFBMetricsData):
+                self._handler.record_metric("ttfb", item.processor, item.value)
+            elif isinstance(item, ProcessingMetricsData):
+                self._handler.record_metric("processing", item.processor, item.value)
+
+
+def iter_transcript_records(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Lazily yield JSONL transcript records from files, directories or globs.
+
+    Files are opened one at a time and read line by line, so a full day of
+    calls can be aggregated without loading it into memory. Malformed lines
+    are skipped with a warning.
+
+    Args:
+        paths: File paths, directories (all ``*.jsonl`` inside) or glob patterns.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(glob.glob(os.path.join(path, "*.jsonl")))
+        elif glob.has_magic(path):
+            files = sorted(glob.glob(path))
+        else:
+            files = [path]
+        for file_path in files:
+            with open(file_path, "r", encoding="utf-8") as f:
+                for lineno, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping malformed transcript line {file_path}:{lineno}")
+
+
+def summarize_transcripts(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate session, turn, tool-call and TTFB counts over JSONL records."""
+    sessions = set()
+    turns = 0
+    tool_calls: Counter = Counter()
+    ttfb_total = 0.0
+    ttfb_count = 0
+    for record in records:
+        sessions.add(record.get("session_id"))
+        if record.get("role") == "user":
+            turns += 1
+        for call in record.get("tool_calls") or []:
+            tool_calls[call["name"]] += 1
+        for value in (record.get("metrics") or {}).get("ttfb", {}).values():
+            ttfb_total += value
+            ttfb_count += 1
+    return {
+        "sessions": len(sessions),
+        "turns": turns,
+        "tool_calls": dict(tool_calls),
+        "mean_ttfb_secs": round(ttfb_total / ttfb_count, 4) if ttfb_count else None,
+    }
+
+
+if __name__ == "__main__":
+    # python transcript.py transcripts/            (or a glob / list of .jsonl files)
+    print(json.dumps(summarize_transcripts(iter_transcript_records(sys.argv[1:] or ["transcripts"])), indent=2))
@@ -0,0 +1,120 @@
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+    LLMTextFrame,
+    StartInterruptionFrame,
+    TTSAudioRawFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+
+from metrics import SessionMetrics
+
+# Frames that carry a turn boundary. Everything else (input audio above all)
+# is rejected by a single isinstance check.
+_TRACKED = (
+    UserStoppedSpeakingFrame,
+    LLMTextFrame,
+    TTSAudioRawFrame,
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    StartInterruptionFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+)
+# First output of the model: audio deltas (realtime) or text tokens (cascaded).
+_LLM_OUTPUT = (LLMTextFrame, TTSAudioRawFrame)
+
+
+class TurnLatencyObserver(BaseObserver):
+    """Records per-turn latencies of one call into a SessionMetrics.
+
+    For every user turn it measures VAD stop -> first LLM output
+    (``vad_to_llm``), first LLM output -> first audio out (``llm_to_audio``)
+    and the end-to-end ``vad_to_audio``. It also times tool calls
+    (``tool_call``) and counts ``turns`` and ``interruptions`` (user speech
+    while the bot is talking).
+
+    A tool turn is one model round trip spent on tools: it opens with the
+    first call the model makes and closes with the model's next output (a
+    reply or the next call) once every result is in. Each is counted in
+    ``tool_turns`` and timed in ``tool_turn``; calls made in parallel share
+    one turn, calls made one after another take one turn each.
+
+    Times come from the pipeline clock stamped on each push, and observers run
+    off the pipeline's processing path, so the audio path only pays for
+    queueing the frame.
+    """
+
+    def __init__(self, session: SessionMetrics, **kwargs):
+        super().__init__(**kwargs)
+        self._session = session
+        self._seen: Deque[int] = deque(maxlen=64)
+        self._vad_stopped_at: Optional[int] = None
+        self._llm_started_at: Optional[int] = None
+        self._bot_speaking = False
+        self._tool_started_at: Dict[str, int] = {}
+        self._tool_turn_started_at: Optional[int] = None
+
+    def _close_tool_turn(self, now: int):
+        if self._tool_turn_started_at is not None and not self._tool_started_at:
+            self._session.observe("tool_turn", (now - self._tool_turn_started_at) / 1e6)
+            self._tool_turn_started_at = None
+
+    def _first_sighting(self, frame) -> bool:
+        # Observers see a frame at every hop; only its first push counts.
+        if frame.id in self._seen:
+            return False
+        self._seen.append(frame.id)
+        return True
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if not isinstance(frame, _TRACKED):
+            return
+        now = data.timestamp
+
+        if isinstance(frame, _LLM_OUTPUT):
+            self._close_tool_turn(now)
+            if self._vad_stopped_at is not None and self._llm_started_at is None:
+                self._llm_started_at = now
+                self._session.observe("vad_to_llm", (now - self._vad_stopped_at) / 1e6)
+            return
+
+        if not self._first_sighting(frame):
+            return
+
+        if isinstance(frame, UserStoppedSpeakingFrame):
+            self._vad_stopped_at = now
+            self._llm_started_at = None
+            # A new user turn abandons a tool turn the model never answered
+            self._tool_turn_started_at = None
+            self._tool_started_at.clear()
+            self._session.increment("turns")
+        elif isinstance(frame, BotStartedSpeakingFrame):
+            self._bot_speaking = True
+            if self._vad_stopped_at is not None:
+                self._session.observe("vad_to_audio", (now - self._vad_stopped_at) / 1e6)
+                if self._llm_started_at is not None:
+                    self._session.observe("llm_to_audio", (now - self._llm_started_at) / 1e6)
+                self._vad_stopped_at = self._llm_started_at = None
+        elif isinstance(frame, BotStoppedSpeakingFrame):
+            self._bot_speaking = False
+        elif isinstance(frame, StartInterruptionFrame):
+            if self._bot_speaking:
+                self._session.increment("interruptions")
+        elif isinstance(frame, FunctionCallInProgressFrame):
+            self._close_tool_turn(now)
+            if self._tool_turn_started_at is None:
+                self._tool_turn_started_at = now
+                self._session.increment("tool_turns")
+            self._tool_started_at[frame.tool_call_id] = now
+        elif isinstance(frame, FunctionCallResultFrame):
+            started_at = self._tool_started_at.pop(frame.tool_call_id, None)
+            if started_at is not None:
+                self._session.observe("tool_call", (now - started_at) / 1e6)